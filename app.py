@@ -8,8 +8,15 @@ import os
 from fastapi import FastAPI
 
 import modules.support_functions as sup_f
-from enviroment import LOGS_DIR
-from routers import dump_ntlm, brute_ntlm, creds, technical
+from enviroment import LOGS_DIR, APP_CONFIG
+from modules.brute_scheduler import BruteScheduler
+from modules.cpu_partitioner import CpuPartitioner
+from modules.dump_crack_pipeline import DumpCrackPipeline
+from modules.dump_ntlm_performer import DumpNTLMPerformer
+from modules.dump_worker_pool import DumpWorkerPool
+from modules.hashcat_performer import HashcatPerformer
+from modules.webhook_notifier import WebhookNotifier
+from routers import dump_ntlm, brute_ntlm, creds, technical, dump_crack
 
 sup_f.init_custome_logger(os.path.join(LOGS_DIR, 'api_all.log'), os.path.join(LOGS_DIR, 'api_error.log'))
 
@@ -23,3 +30,26 @@ app.include_router(dump_ntlm.router)
 app.include_router(brute_ntlm.router)
 app.include_router(creds.router)
 app.include_router(technical.router)
+app.include_router(dump_crack.router)
+
+
+@app.on_event('startup')
+def reattach_instances() -> None:
+    """
+    Reattach to the processes left running by the previous run of the API, resume the dump-and-crack pipelines,
+    start scheduling the queued ones and notifying the callback URLs of the finished sessions,
+    pre-warm the dump workers
+    """
+    if APP_CONFIG.get('dump_worker_pool', 'true').lower() == 'true':
+        DumpWorkerPool.start()
+    DumpNTLMPerformer.reattach_instances()
+    HashcatPerformer.reattach_instances(is_auto_restore=APP_CONFIG.get('auto_restore_brute', 'false').lower() == 'true')
+    DumpCrackPipeline.reattach_instances()
+    CpuPartitioner.reserved_cores = int(APP_CONFIG.get('api_reserved_cores', '1'))
+    BruteScheduler.start(
+        max_running=int(APP_CONFIG.get('brute_concurrency', '1')),
+        is_cpu_partitioning=APP_CONFIG.get('brute_cpu_partitioning', 'false').lower() == 'true',
+    )
+    WebhookNotifier.start(
+        secret=APP_CONFIG.get('webhook_secret', ''), max_attempts=int(APP_CONFIG.get('webhook_max_attempts', '8'))
+    )
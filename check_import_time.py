@@ -0,0 +1,93 @@
+"""
+Checking the cold start time of the entry points.
+Every entry point is imported in a fresh interpreter several times, the best time is compared with its budget.
+The script exits with code 1 if any entry point is over its budget and prints its slowest imports.
+
+Usage:
+    python check_import_time.py [--app 1.0] [--dump 0.5] [--runs 5] [--top 15]
+
+Author:
+    Konstantin S. (https://github.com/ST1LLY)
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def measure(module_name: str, runs: int) -> float:
+    """
+    Measure the cold start time of the module
+
+    Args:
+        module_name (str): the module to import
+        runs (int): the number of imports, every one is in a fresh interpreter
+
+    Returns:
+        float: the best time of the import including the start of the interpreter, in seconds
+    """
+    best = float('inf')
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', f'import {module_name}'], cwd=ROOT_DIR, check=True)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def get_slowest_imports(module_name: str, top: int) -> list[tuple[int, str]]:
+    """
+    Get the slowest imports of the module by -X importtime
+
+    Args:
+        module_name (str): the module to import
+        top (int): the number of the imports
+
+    Returns:
+        list[tuple[int, str]]: (cumulative time in microseconds, imported module) sorted by the time
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module_name}'],
+        cwd=ROOT_DIR,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    imports = []
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        parts = line.removeprefix('import time:').split('|')
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue
+        imports.append((int(parts[1]), parts[2].rstrip()))
+    return sorted(imports, reverse=True)[:top]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Checking the cold start time of the entry points.')
+    parser.add_argument('--app', type=float, default=1.0, help='the budget of app.py, in seconds. Default: 1.0')
+    parser.add_argument(
+        '--dump', type=float, default=0.5, help='the budget of dump_secrets_ntlm.py, in seconds. Default: 0.5'
+    )
+    parser.add_argument('--runs', type=int, default=5, help='the number of imports of every entry point. Default: 5')
+    parser.add_argument('--top', type=int, default=15, help='the number of the slowest imports to print. Default: 15')
+    args = parser.parse_args()
+
+    is_over_budget = False
+    for module_name, budget in (('app', args.app), ('dump_secrets_ntlm', args.dump)):
+        best = measure(module_name, args.runs)
+        is_over = best > budget
+        print(f'{module_name}: {best:.3f} s, budget: {budget:.3f} s{" - OVER BUDGET" if is_over else ""}')
+        if is_over:
+            is_over_budget = True
+            for cumulative, imported in get_slowest_imports(module_name, args.top):
+                print(f'    {cumulative / 1000:8.1f} ms {imported}')
+
+    sys.exit(1 if is_over_budget else 0)
+
+
+if __name__ == '__main__':
+    main()
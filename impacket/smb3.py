@@ -42,10 +42,10 @@ from contextlib import contextmanager
 from pyasn1.type.univ import noValue
 from Cryptodome.Cipher import AES
 
-from impacket import nmb, ntlm, uuid, crypto
+from impacket import nmb, ntlm, uuid, crypto, nt_errors
 from impacket.smb3structs import *
 from impacket.nt_errors import STATUS_SUCCESS, STATUS_MORE_PROCESSING_REQUIRED, STATUS_INVALID_PARAMETER, \
-    STATUS_NO_MORE_FILES, STATUS_PENDING, STATUS_NOT_IMPLEMENTED, ERROR_MESSAGES
+    STATUS_NO_MORE_FILES, STATUS_PENDING, STATUS_NOT_IMPLEMENTED
 from impacket.spnego import SPNEGO_NegTokenInit, TypesMech, SPNEGO_NegTokenResp, ASN1_OID, asn1encode, ASN1_AID
 from impacket.krb5.gssapi import KRB5_AP_REQ
 
@@ -129,7 +129,7 @@ class SessionError(Exception):
         return self.packet
 
     def __str__( self ):
-        return 'SMB SessionError: %s(%s)' % (ERROR_MESSAGES[self.error])
+        return 'SMB SessionError: %s(%s)' % (nt_errors.ERROR_MESSAGES[self.error])
 
 
 class SMB3:
@@ -0,0 +1,116 @@
+"""
+Module to build the stages of the attack plan of hashcat
+
+Author:
+    Konstantin S. (https://github.com/ST1LLY)
+"""
+import os
+from typing import Any
+
+
+class AttackPlan:
+    """
+    Class of the helpers for the attack plan: the stages run one after another,
+    every stage gets the hashes not bruted by the previous ones.
+    A stage is {'attack_mode', 'dictionary_file_path', 'rules_file_path', 'mask'},
+    the unused fields of the attack mode are None.
+    """
+
+    # The attack modes of hashcat (-a)
+    ATTACK_MODES = {
+        'dictionary': '0',
+        'mask': '3',
+        'hybrid_dictionary_mask': '6',
+        'hybrid_mask_dictionary': '7',
+    }
+
+    def __init__(self) -> None:
+        pass
+
+    @staticmethod
+    def get_attack_args(stage: dict[str, Any]) -> tuple[list[str], list[str]]:
+        """
+        Get the args of hashcat for the stage
+
+        Args:
+            stage (dict[str, Any]): the stage
+
+        Returns:
+            tuple[list[str], list[str]]: the args following the hash file and the options of the attack
+        """
+        attack_mode = stage['attack_mode']
+        options = ['-a', AttackPlan.ATTACK_MODES[attack_mode]]
+        if attack_mode == 'dictionary':
+            if stage.get('rules_file_path'):
+                options.extend(['-r', stage['rules_file_path']])
+            return [stage['dictionary_file_path']], options
+        if attack_mode == 'mask':
+            return [stage['mask']], options
+        if attack_mode == 'hybrid_dictionary_mask':
+            return [stage['dictionary_file_path'], stage['mask']], options
+        return [stage['mask'], stage['dictionary_file_path']], options
+
+    @staticmethod
+    def get_key(stage: dict[str, Any]) -> str:
+        """
+        Get the key of the stage, the stages with the same key check the same candidates
+
+        Args:
+            stage (dict[str, Any]): the stage
+
+        Returns:
+            str: the key
+        """
+        return '|'.join(
+            str(stage.get(field)) for field in ('attack_mode', 'dictionary_file_path', 'rules_file_path', 'mask')
+        )
+
+    @staticmethod
+    def shrink_hash_list(hash_file_path: str, output_file_path: str, new_hash_file_path: str) -> int:
+        """
+        Write the hashes of the list not found in the output file of hashcat
+
+        Args:
+            hash_file_path (str): path to the hash list of the previous stage
+            output_file_path (str): path to the output file, the lines are nthash:password
+            new_hash_file_path (str): path to the hash list of the next stage
+
+        Returns:
+            int: the number of hashes in the new list
+        """
+        bruted = set()
+        if os.path.isfile(output_file_path):
+            with open(output_file_path, 'r', encoding='utf-8') as file:
+                bruted = {line.partition(':')[0].lower() for line in file}
+
+        os.makedirs(os.path.dirname(new_hash_file_path), exist_ok=True)
+        hashes_count = 0
+        with open(hash_file_path, 'r', encoding='utf-8') as file, open(
+            new_hash_file_path, 'w', encoding='utf-8'
+        ) as new_file:
+            for line in file:
+                nt_hash = line.strip().lower()
+                if nt_hash and nt_hash not in bruted:
+                    new_file.write(nt_hash + '\n')
+                    hashes_count += 1
+        return hashes_count
+
+    @staticmethod
+    def get_counters(status_data: list[dict[str, str]]) -> dict[str, Any]:
+        """
+        Get the counters of the stage from the status of hashcat
+
+        Args:
+            status_data (list[dict[str, str]]): the status, see HashcatStatusReader
+
+        Returns:
+            dict[str, Any]: {'progress': the progress of the stage,
+                             'cracked_count': the number of hashes bruted by the stage}
+        """
+        counters = {'progress': '', 'cracked_count': 0}
+        for field in status_data:
+            if field['title'] == 'Progress':
+                counters['progress'] = field['value']
+            elif field['title'] == 'Recovered' and field['value'].split('/')[0].isdigit():
+                counters['cracked_count'] = int(field['value'].split('/')[0])
+        return counters
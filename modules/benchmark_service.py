@@ -0,0 +1,550 @@
+"""
+Module to run the benchmarks of hashcat in background and keep their history
+
+Author:
+    Konstantin S. (https://github.com/ST1LLY)
+"""
+import hashlib
+import json
+import logging
+import re
+import sqlite3
+import subprocess
+import threading
+import time
+import uuid
+from datetime import datetime
+from typing import Any
+
+from enviroment import BENCHMARKS_DB_PATH
+from modules.hashcat_tuner import HashcatTuner
+from modules.session_registry import SessionRegistry
+
+
+class BenchmarkService:
+    """
+    Class to run the benchmarks of hashcat as background jobs.
+    A job is kept by SessionRegistry as the session of 'benchmark' kind, so every API worker sees it.
+    The job waits until the running brute sessions and the jobs started before it are finished,
+    the scheduler doesn't start the queued sessions until the job is finished,
+    so the benchmark doesn't share the CPU with the sessions or the other jobs.
+    The speeds of the devices are kept in the history with hashcat version and the devices,
+    the last result is used until hashcat or the devices are changed.
+    The tuning job finds the best workload options of hashcat, see HashcatTuner,
+    they are applied to the brute sessions until hashcat or the devices are changed.
+    """
+
+    # Pause between the checks of the running brute sessions, in seconds
+    poll_interval: float = 5.0
+
+    # The time the version of hashcat and the devices are kept by the API worker, in seconds
+    host_info_ttl: float = 600.0
+
+    # {'version', 'devices', 'fingerprint', 'checked': the time of checking}, None until checked
+    host_info: dict[str, Any] | None = None
+
+    # The multipliers of the speed units of hashcat output
+    SPEED_UNITS = {'': 1, 'k': 10**3, 'M': 10**6, 'G': 10**9, 'T': 10**12, 'P': 10**15}
+
+    def __init__(self) -> None:
+        pass
+
+    @staticmethod
+    def __connect() -> sqlite3.Connection:
+        """
+        Connect to the history creating the tables if needed
+
+        Returns:
+            sqlite3.Connection: the connection
+        """
+        connection = sqlite3.connect(BENCHMARKS_DB_PATH, timeout=30)
+        connection.row_factory = sqlite3.Row
+        connection.execute('PRAGMA journal_mode=WAL')
+        connection.execute(
+            'CREATE TABLE IF NOT EXISTS benchmark_history (id INTEGER PRIMARY KEY AUTOINCREMENT, '
+            'job_id TEXT NOT NULL, hash_mode INTEGER NOT NULL, device_id INTEGER NOT NULL, device_name TEXT NOT NULL, '
+            'speed REAL NOT NULL, speed_info TEXT NOT NULL, hashcat_version TEXT NOT NULL, fingerprint TEXT NOT NULL, '
+            'started TEXT NOT NULL, stopped TEXT NOT NULL)'
+        )
+        connection.execute(
+            'CREATE INDEX IF NOT EXISTS benchmark_history_mode ON benchmark_history (hash_mode, fingerprint, id)'
+        )
+        connection.execute(
+            'CREATE TABLE IF NOT EXISTS tunings (id INTEGER PRIMARY KEY AUTOINCREMENT, job_id TEXT NOT NULL, '
+            'hashcat_version TEXT NOT NULL, fingerprint TEXT NOT NULL, options TEXT NOT NULL, speed REAL NOT NULL, '
+            'default_speed REAL NOT NULL, speedup REAL NOT NULL, candidates TEXT NOT NULL, tuned TEXT NOT NULL)'
+        )
+        return connection
+
+    @staticmethod
+    def __to_tuning_dict(row: sqlite3.Row) -> dict[str, Any]:
+        """
+        Turn the row into the tuning dict
+
+        Args:
+            row (sqlite3.Row): the row of tunings table
+
+        Returns:
+            dict[str, Any]: the tuning, see get_tuning_history
+        """
+        tuning = dict(row)
+        tuning['options'] = json.loads(tuning['options'])
+        tuning['candidates'] = json.loads(tuning['candidates'])
+        return tuning
+
+    @staticmethod
+    def get_host_info() -> dict[str, Any]:
+        """
+        Get the version of hashcat and the devices of the host
+
+        Returns:
+            dict[str, Any]: {'version', 'devices': the names of the devices,
+                   'fingerprint': it's changed when hashcat or the devices are changed, 'checked'}
+        """
+        host_info = BenchmarkService.host_info
+        if host_info is not None and time.time() - host_info['checked'] < BenchmarkService.host_info_ttl:
+            return host_info
+
+        version = subprocess.run(
+            ['hashcat', '--version'], stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=False
+        ).stdout.decode('utf-8').strip()
+        out = subprocess.run(
+            ['hashcat', '-I', '--force'], stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=False
+        ).stdout.decode('utf-8')
+        devices = re.findall(r'^\s*Name\.+:\s*(.+?)\s*$', out, re.MULTILINE)
+        fingerprint = hashlib.sha1(json.dumps([version, devices]).encode('utf-8')).hexdigest()
+
+        BenchmarkService.host_info = {
+            'version': version,
+            'devices': devices,
+            'fingerprint': fingerprint,
+            'checked': time.time(),
+        }
+        return BenchmarkService.host_info
+
+    @staticmethod
+    def __parse_output(out: str) -> list[dict[str, Any]]:
+        """
+        Get the speeds of the devices from the benchmark output
+
+        Args:
+            out (str): the output of hashcat -b
+
+        Returns:
+            list[dict[str, Any]]: [{'device_id', 'device_name', 'speed': hashes per second,
+                                    'speed_info': the raw speed}, ...]
+        """
+        device_names = {
+            int(device_id): name.split(',')[0].strip()
+            for device_id, name in re.findall(r'^\* Device #(\d+): (.+)$', out, re.MULTILINE)
+        }
+        devices = []
+        for device_id, speed_info in re.findall(r'^Speed\.#(\d+)\.+:\s+(.+)$', out, re.MULTILINE):
+            match = re.match(r'([\d.]+)\s*([kMGTP]?)H/s', speed_info)
+            if match is None:
+                continue
+            devices.append(
+                {
+                    'device_id': int(device_id),
+                    'device_name': device_names.get(int(device_id), ''),
+                    'speed': float(match.group(1)) * BenchmarkService.SPEED_UNITS[match.group(2)],
+                    'speed_info': speed_info.strip(),
+                }
+            )
+        return devices
+
+    @staticmethod
+    def run(job_id: str, hash_modes: list[int], is_force: bool = True) -> list[dict[str, Any]]:
+        """
+        Run hashcat -b for every hash mode and keep the speeds in the history
+
+        Args:
+            job_id (str): the job id
+            hash_modes (list[int]): the hash modes
+            is_force (bool): run hascat with --force flag. Default: True
+
+        Returns:
+            list[dict[str, Any]]: the results, see get_history
+
+        Raises:
+            RuntimeError: the benchmark has failed
+        """
+        host_info = BenchmarkService.get_host_info()
+        rows = []
+        for hash_mode in hash_modes:
+            process_args = ['hashcat', '-b', '-m', str(hash_mode), '--force' if is_force else '']
+            logging.info('Running benchmark: %s', process_args)
+            result = subprocess.run(process_args, stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=False)
+            out = result.stdout.decode('utf-8')
+            err = result.stderr.decode('utf-8')
+
+            devices = BenchmarkService.__parse_output(out)
+            if result.returncode != 0 or not devices:
+                logging.error('err: %s', err)
+                raise RuntimeError(f'The benchmark of hash mode {hash_mode} has failed: {err.strip()}')
+
+            started_s = re.search(r'Started: (.+)', out, re.MULTILINE)
+            stopped_s = re.search(r'Stopped: (.+)', out, re.MULTILINE)
+            for device in devices:
+                rows.append(
+                    {
+                        'job_id': job_id,
+                        'hash_mode': hash_mode,
+                        **device,
+                        'hashcat_version': host_info['version'],
+                        'fingerprint': host_info['fingerprint'],
+                        'started': started_s.group(1).strip() if started_s is not None else '',
+                        'stopped': stopped_s.group(1).strip() if stopped_s is not None else '',
+                    }
+                )
+
+        connection = BenchmarkService.__connect()
+        try:
+            with connection:
+                connection.executemany(
+                    'INSERT INTO benchmark_history (job_id, hash_mode, device_id, device_name, speed, speed_info, '
+                    'hashcat_version, fingerprint, started, stopped) VALUES (:job_id, :hash_mode, :device_id, '
+                    ':device_name, :speed, :speed_info, :hashcat_version, :fingerprint, :started, :stopped)',
+                    rows,
+                )
+        finally:
+            connection.close()
+        return rows
+
+    @staticmethod
+    def get_cached(hash_mode: int) -> list[dict[str, Any]]:
+        """
+        Get the speeds of the last benchmark of the hash mode run with the current hashcat and devices
+
+        Args:
+            hash_mode (int): the hash mode
+
+        Returns:
+            list[dict[str, Any]]: the speeds of the devices, see get_history, empty if no benchmark is kept
+        """
+        fingerprint = BenchmarkService.get_host_info()['fingerprint']
+        connection = BenchmarkService.__connect()
+        try:
+            rows = connection.execute(
+                'SELECT * FROM benchmark_history WHERE job_id = ('
+                'SELECT job_id FROM benchmark_history WHERE hash_mode = ? AND fingerprint = ? ORDER BY id DESC LIMIT 1'
+                ') AND hash_mode = ? ORDER BY device_id',
+                (hash_mode, fingerprint, hash_mode),
+            ).fetchall()
+        finally:
+            connection.close()
+        return [dict(row) for row in rows]
+
+    @staticmethod
+    def get_speed(hash_mode: int) -> dict[str, Any] | None:
+        """
+        Get the speed of the host from the last benchmark of the hash mode
+
+        Args:
+            hash_mode (int): the hash mode
+
+        Returns:
+            dict[str, Any] | None: {'speed': hashes per second of all devices,
+                                    'benchmarked': the datetime of the benchmark}
+                         or None if no benchmark is kept
+        """
+        rows = BenchmarkService.get_cached(hash_mode)
+        if not rows:
+            return None
+        return {'speed': sum(row['speed'] for row in rows), 'benchmarked': rows[0]['stopped']}
+
+    @staticmethod
+    def get_history(hash_mode: int | None = None, offset: int = 0, limit: int | None = None) -> list[dict[str, Any]]:
+        """
+        Get the history of the benchmarks, the latest first
+
+        Args:
+            hash_mode (int | None): the hash mode. Default: all
+            offset (int): the number of the results to skip. Default: 0
+            limit (int | None): the max number of the results. Default: all
+
+        Returns:
+            list[dict[str, Any]]: [{'id', 'job_id', 'hash_mode', 'device_id', 'device_name', 'speed': hashes per second,
+                          'speed_info': the raw speed, 'hashcat_version', 'fingerprint', 'started', 'stopped',
+                          'tuned_speedup': the speedup of the last tuning of hashcat and the devices or None}, ...]
+        """
+        query = (
+            'SELECT benchmark_history.*, (SELECT speedup FROM tunings WHERE tunings.fingerprint = '
+            'benchmark_history.fingerprint ORDER BY tunings.id DESC LIMIT 1) AS tuned_speedup FROM benchmark_history'
+        )
+        params: list[Any] = []
+        if hash_mode is not None:
+            query += ' WHERE hash_mode = ?'
+            params.append(hash_mode)
+        query += ' ORDER BY id DESC LIMIT ? OFFSET ?'
+        params.extend([limit if limit is not None else -1, offset])
+
+        connection = BenchmarkService.__connect()
+        try:
+            rows = connection.execute(query, params).fetchall()
+        finally:
+            connection.close()
+        return [dict(row) for row in rows]
+
+    @staticmethod
+    def get_tuning() -> dict[str, Any] | None:
+        """
+        Get the last tuning of the current hashcat and devices
+
+        Returns:
+            dict[str, Any] | None: the tuning, see get_tuning_history, or None if the host hasn't been tuned
+        """
+        fingerprint = BenchmarkService.get_host_info()['fingerprint']
+        connection = BenchmarkService.__connect()
+        try:
+            row = connection.execute(
+                'SELECT * FROM tunings WHERE fingerprint = ? ORDER BY id DESC LIMIT 1', (fingerprint,)
+            ).fetchone()
+        finally:
+            connection.close()
+        return BenchmarkService.__to_tuning_dict(row) if row is not None else None
+
+    @staticmethod
+    def get_tuned_options() -> list[str]:
+        """
+        Get the options of hashcat found by the last tuning of the current hashcat and devices
+
+        Returns:
+            list[str]: the options, empty if the host hasn't been tuned
+        """
+        tuning = BenchmarkService.get_tuning()
+        return tuning['options'] if tuning is not None else []
+
+    @staticmethod
+    def get_tuning_history(offset: int = 0, limit: int | None = None) -> list[dict[str, Any]]:
+        """
+        Get the history of the tunings, the latest first
+
+        Args:
+            offset (int): the number of the tunings to skip. Default: 0
+            limit (int | None): the max number of the tunings. Default: all
+
+        Returns:
+            list[dict[str, Any]]: [{'id', 'job_id', 'hashcat_version', 'fingerprint', 'options': the best options,
+                          'speed': hashes per second with the best options,
+                          'default_speed': hashes per second with the default options,
+                          'speedup': speed / default_speed, 'candidates': [{'options', 'speed'}, ...],
+                          'tuned': the datetime of the tuning}, ...]
+        """
+        connection = BenchmarkService.__connect()
+        try:
+            rows = connection.execute(
+                'SELECT * FROM tunings ORDER BY id DESC LIMIT ? OFFSET ?',
+                (limit if limit is not None else -1, offset),
+            ).fetchall()
+        finally:
+            connection.close()
+        return [BenchmarkService.__to_tuning_dict(row) for row in rows]
+
+    @staticmethod
+    def tune(job_id: str, tuning_params: dict[str, Any], is_force: bool = True) -> dict[str, Any]:
+        """
+        Find the best options of hashcat and keep them for the current hashcat and devices
+
+        Args:
+            job_id (str): the job id
+            tuning_params (dict[str, Any]): {'runtime', 'is_optimized_included'}, see HashcatTuner.tune
+            is_force (bool): run hascat with --force flag. Default: True
+
+        Returns:
+            dict[str, Any]: the tuning, see get_tuning_history
+        """
+        host_info = BenchmarkService.get_host_info()
+        result = HashcatTuner.tune(**tuning_params, is_force=is_force)
+        tuning = {
+            'job_id': job_id,
+            'hashcat_version': host_info['version'],
+            'fingerprint': host_info['fingerprint'],
+            'options': json.dumps(result['options']),
+            'speed': result['speed'],
+            'default_speed': result['default_speed'],
+            'speedup': round(result['speed'] / result['default_speed'], 3),
+            'candidates': json.dumps(result['candidates']),
+            'tuned': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        }
+        connection = BenchmarkService.__connect()
+        try:
+            with connection:
+                connection.execute(
+                    'INSERT INTO tunings (job_id, hashcat_version, fingerprint, options, speed, default_speed, '
+                    'speedup, candidates, tuned) VALUES (:job_id, :hashcat_version, :fingerprint, :options, :speed, '
+                    ':default_speed, :speedup, :candidates, :tuned)',
+                    tuning,
+                )
+        finally:
+            connection.close()
+        return {**tuning, 'options': result['options'], 'candidates': result['candidates']}
+
+    @staticmethod
+    def get_active_jobs(is_queued_included: bool = False) -> list[dict[str, Any]]:
+        """
+        Get the benchmark and tuning jobs run by the alive API workers in the order of starting
+
+        Args:
+            is_queued_included (bool): include the jobs waiting for their turn. Default: False
+
+        Returns:
+            list[dict[str, Any]]: the jobs, see SessionRegistry.get
+        """
+        states = ('running', 'queued') if is_queued_included else ('running',)
+        jobs = SessionRegistry.get_all('benchmark', states=states)
+        jobs = [job for job in jobs if SessionRegistry.is_owner_running(job['data']['owner'])]
+        return sorted(jobs, key=lambda job: (job['data'].get('queued', 0), job['session_name']))
+
+    @staticmethod
+    def is_running(is_queued_included: bool = False) -> bool:
+        """
+        Check if a benchmark job is running on the host
+
+        Args:
+            is_queued_included (bool): the job waiting for its turn is taken as running. Default: False
+
+        Returns:
+            bool: True if a job is running
+        """
+        return bool(BenchmarkService.get_active_jobs(is_queued_included))
+
+    @staticmethod
+    def __is_waiting(job_id: str) -> bool:
+        """
+        Check if the job has to wait: a brute session is running or an earlier job isn't finished
+
+        Args:
+            job_id (str): the job id
+
+        Returns:
+            bool: True if the job has to wait
+        """
+        if any(
+            SessionRegistry.is_running(session) for session in SessionRegistry.get_all('brute', states=('running',))
+        ):
+            return True
+        # The jobs are run one by one in the order of starting, so they don't distort the speeds of each other
+        jobs = BenchmarkService.get_active_jobs(is_queued_included=True)
+        return bool(jobs) and jobs[0]['session_name'] != job_id
+
+    @staticmethod
+    def __perform(job_id: str, hash_modes: list[int], is_force: bool, tuning_params: dict[str, Any] | None) -> None:
+        """
+        The job thread, it waits until no brute session or other job is running and runs the benchmark or the tuning
+
+        Args:
+            job_id (str): the job id
+            hash_modes (list[int]): the hash modes
+            is_force (bool): run hascat with --force flag
+            tuning_params (dict[str, Any] | None): the params of the tuning, see tune, None if it's the benchmark job
+        """
+        while BenchmarkService.__is_waiting(job_id):
+            time.sleep(BenchmarkService.poll_interval)
+
+        SessionRegistry.update(job_id, state='running', data={'started': datetime.now().strftime('%Y-%m-%d %H:%M:%S')})
+        try:
+            if tuning_params is not None:
+                BenchmarkService.tune(job_id, tuning_params, is_force)
+            else:
+                BenchmarkService.run(job_id, hash_modes, is_force)
+            SessionRegistry.update(job_id, state='exited', data={'status': 'success'})
+        except Exception as exc:  # pylint: disable=broad-except
+            logging.exception('The benchmark job %s has failed', job_id)
+            SessionRegistry.update(job_id, state='exited', data={'status': 'error', 'error': str(exc)})
+
+    @staticmethod
+    def start_job(hash_modes: list[int], is_force: bool = True, tuning_params: dict[str, Any] | None = None) -> str:
+        """
+        Start the benchmark job in background
+
+        Args:
+            hash_modes (list[int]): the hash modes, [1000] for the tuning
+            is_force (bool): run hascat with --force flag. Default: True
+            tuning_params (dict[str, Any] | None): the params of the tuning, see tune. Default: the benchmark job
+
+        Returns:
+            str: the job id
+        """
+        job_id = str(uuid.uuid4())
+        SessionRegistry.add(
+            job_id,
+            'benchmark',
+            0,
+            {
+                'hash_modes': hash_modes,
+                'is_tuning': tuning_params is not None,
+                'status': '',
+                'error': '',
+                'queued': time.time(),
+            },
+            'queued',
+        )
+        threading.Thread(
+            target=BenchmarkService.__perform, args=(job_id, hash_modes, is_force, tuning_params), daemon=True
+        ).start()
+        logging.info(
+            'The %s job %s is started for hash modes %s',
+            'tuning' if tuning_params is not None else 'benchmark',
+            job_id,
+            hash_modes,
+        )
+        return job_id
+
+    @staticmethod
+    def get_job_info(job_id: str) -> dict[str, Any]:
+        """
+        Get the info about the benchmark job
+
+        Args:
+            job_id (str): the job id
+
+        Returns:
+            dict[str, Any]: {
+                        'job_id': the job id,
+                        'state': 'not_found' / 'queued' / 'running' / 'success' / 'error',
+                        'error': the error if the state is 'error',
+                        'hash_modes': the hash modes,
+                        'results': the speeds of the devices if the state is 'success', see get_history,
+                        'tuning': the tuning if it's the succeeded tuning job, see get_tuning_history, otherwise None
+                    }
+        """
+        job = SessionRegistry.get(job_id, 'benchmark')
+        if job is None:
+            return {
+                'job_id': job_id,
+                'state': 'not_found',
+                'error': '',
+                'hash_modes': [],
+                'results': [],
+                'tuning': None,
+            }
+
+        data = job['data']
+        state = data['status'] if job['state'] == 'exited' else job['state']
+        error = data['error']
+        # The API worker running the job is gone
+        if job['state'] != 'exited' and not SessionRegistry.is_owner_running(data['owner']):
+            state, error = 'error', 'The API worker running the job is gone'
+
+        results = []
+        tuning = None
+        if state == 'success':
+            connection = BenchmarkService.__connect()
+            try:
+                rows = connection.execute(
+                    'SELECT * FROM benchmark_history WHERE job_id = ? ORDER BY hash_mode, device_id', (job_id,)
+                ).fetchall()
+                tuning_row = connection.execute('SELECT * FROM tunings WHERE job_id = ?', (job_id,)).fetchone()
+            finally:
+                connection.close()
+            results = [dict(row) for row in rows]
+            tuning = BenchmarkService.__to_tuning_dict(tuning_row) if tuning_row is not None else None
+        return {
+            'job_id': job_id,
+            'state': state,
+            'error': error,
+            'hash_modes': data['hash_modes'],
+            'results': results,
+            'tuning': tuning,
+        }
@@ -0,0 +1,219 @@
+"""
+Module to estimate the runtime of the attack plan of hashcat
+
+Author:
+    Konstantin S. (https://github.com/ST1LLY)
+"""
+import logging
+import os
+import sqlite3
+import subprocess
+from datetime import datetime
+from typing import Any
+
+from enviroment import BRUTE_ESTIMATES_DB_PATH
+from modules.benchmark_service import BenchmarkService
+
+
+class BruteEstimator:
+    """
+    Class to estimate the runtime of the stages without starting the attack.
+    The keyspace of a dictionary is got from hashcat --keyspace, it's cached by the fingerprint of the file,
+    so a dictionary is read once until it's changed.
+    The speed is taken from the last benchmark of the host, see BenchmarkService.
+    """
+
+    # The number of candidates of the built-in charsets of hashcat masks
+    CHARSET_SIZES = {'l': 26, 'u': 26, 'd': 10, 'h': 16, 'H': 16, 's': 33, 'a': 95, 'b': 256, '?': 1}
+
+    def __init__(self) -> None:
+        pass
+
+    @staticmethod
+    def __connect() -> sqlite3.Connection:
+        """
+        Connect to the cache creating the table if needed
+
+        Returns:
+            sqlite3.Connection: the connection
+        """
+        connection = sqlite3.connect(BRUTE_ESTIMATES_DB_PATH, timeout=30)
+        connection.execute('PRAGMA journal_mode=WAL')
+        connection.execute(
+            'CREATE TABLE IF NOT EXISTS keyspaces (fingerprint TEXT PRIMARY KEY, keyspace INTEGER NOT NULL, '
+            'added TEXT NOT NULL)'
+        )
+        return connection
+
+    @staticmethod
+    def __get_fingerprint(file_path: str) -> str:
+        """
+        Get the fingerprint of the file, it's changed when the file is changed
+
+        Args:
+            file_path (str): path to the file
+
+        Returns:
+            str: the fingerprint
+        """
+        stat = os.stat(file_path)
+        return f'{os.path.realpath(file_path)}|{stat.st_size}|{stat.st_mtime_ns}'
+
+    @staticmethod
+    def get_dictionary_keyspace(dictionary_file_path: str, is_force: bool = True) -> int:
+        """
+        Get the number of the dictionary words used by hashcat
+
+        Args:
+            dictionary_file_path (str): path to file contained dictionary
+            is_force (bool): run hascat with --force flag. Default: True
+
+        Returns:
+            int: the keyspace
+
+        Raises:
+            ValueError: hashcat has failed to get the keyspace
+        """
+        fingerprint = BruteEstimator.__get_fingerprint(dictionary_file_path)
+        connection = BruteEstimator.__connect()
+        try:
+            row = connection.execute('SELECT keyspace FROM keyspaces WHERE fingerprint = ?', (fingerprint,)).fetchone()
+            if row is not None:
+                return row[0]
+
+            process_args = ['hashcat', '-m', '1000', '-a', '0', '--keyspace', dictionary_file_path]
+            if is_force:
+                process_args.append('--force')
+            try:
+                result = subprocess.run(process_args, stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True)
+                keyspace = int(result.stdout.decode('utf-8').split()[-1])
+            except subprocess.CalledProcessError as exc:
+                stderr = exc.stderr.decode('utf-8', errors='ignore').strip()
+                raise ValueError(
+                    f"Hashcat hasn't got the keyspace of {dictionary_file_path}: {stderr or exc}"
+                ) from exc
+            except (ValueError, IndexError) as exc:
+                raise ValueError(f'Hashcat has printed no keyspace of {dictionary_file_path}') from exc
+
+            with connection:
+                connection.execute(
+                    'INSERT OR REPLACE INTO keyspaces (fingerprint, keyspace, added) VALUES (?, ?, ?)',
+                    (fingerprint, keyspace, datetime.now().strftime('%Y-%m-%d %H:%M:%S')),
+                )
+            logging.info('The keyspace of %s is %d', dictionary_file_path, keyspace)
+            return keyspace
+        finally:
+            connection.close()
+
+    @staticmethod
+    def get_rules_count(rules_file_path: str | None) -> int:
+        """
+        Get the number of the rules, every rule gives a candidate of a dictionary word
+
+        Args:
+            rules_file_path (str | None): path to file contained rules, None if the rules aren't used
+
+        Returns:
+            int: the number of the rules, 1 if the rules aren't used
+        """
+        if not rules_file_path:
+            return 1
+        rules_count = 0
+        with open(rules_file_path, 'r', encoding='utf-8', errors='ignore') as file:
+            for line in file:
+                line = line.strip()
+                if line and not line.startswith('#'):
+                    rules_count += 1
+        return max(rules_count, 1)
+
+    @staticmethod
+    def get_mask_size(mask: str) -> int:
+        """
+        Get the number of the candidates of the mask
+
+        Args:
+            mask (str): the mask of hashcat with the built-in charsets
+
+        Returns:
+            int: the number of the candidates
+
+        Raises:
+            ValueError: the mask has an unknown charset
+        """
+        size = 1
+        i = 0
+        while i < len(mask):
+            if mask[i] == '?':
+                charset = mask[i + 1 : i + 2]
+                if charset not in BruteEstimator.CHARSET_SIZES:
+                    raise ValueError(f'Unknown charset ?{charset} of the mask {mask}')
+                size *= BruteEstimator.CHARSET_SIZES[charset]
+                i += 2
+                continue
+            i += 1
+        return size
+
+    @staticmethod
+    def get_candidates_count(stage: dict[str, Any], is_force: bool = True) -> int:
+        """
+        Get the number of the candidates checked by the stage
+
+        Args:
+            stage (dict[str, Any]): the stage of the attack plan, see AttackPlan
+            is_force (bool): run hascat with --force flag. Default: True
+
+        Returns:
+            int: the number of the candidates
+        """
+        attack_mode = stage['attack_mode']
+        if attack_mode == 'mask':
+            return BruteEstimator.get_mask_size(stage['mask'])
+        keyspace = BruteEstimator.get_dictionary_keyspace(stage['dictionary_file_path'], is_force)
+        if attack_mode == 'dictionary':
+            return keyspace * BruteEstimator.get_rules_count(stage.get('rules_file_path'))
+        return keyspace * BruteEstimator.get_mask_size(stage['mask'])
+
+    @staticmethod
+    def estimate(stages: list[dict[str, Any]], is_force: bool = True) -> dict[str, Any]:
+        """
+        Estimate the runtime of the stages
+
+        Args:
+            stages (list[dict[str, Any]]): the stages of the attack plan, see AttackPlan
+            is_force (bool): run hascat with --force flag. Default: True
+
+        Returns:
+            dict[str, Any]: {
+                        'speed': hashes per second or None if the benchmark hasn't been run,
+                        'benchmarked': the datetime of the benchmark or None,
+                        'stages': [{'attack_mode', 'dictionary_file_path', 'rules_file_path', 'mask',
+                                    'candidates_count', 'seconds': the estimated runtime or None}, ...],
+                        'candidates_count': the sum of the stages,
+                        'seconds': the estimated runtime of all stages or None,
+                        'hint': how to get the runtime if it's None
+                    }
+
+        Raises:
+            ValueError: the mask has an unknown charset or hashcat has failed to get the keyspace
+        """
+        benchmark = BenchmarkService.get_speed(1000) or {'speed': None, 'benchmarked': None}
+        speed = benchmark['speed']
+        stages_estimates = []
+        for stage in stages:
+            candidates_count = BruteEstimator.get_candidates_count(stage, is_force)
+            stages_estimates.append(
+                {
+                    **stage,
+                    'candidates_count': candidates_count,
+                    'seconds': round(candidates_count / speed, 1) if speed else None,
+                }
+            )
+        candidates_count = sum(stage['candidates_count'] for stage in stages_estimates)
+        return {
+            **benchmark,
+            'stages': stages_estimates,
+            'candidates_count': candidates_count,
+            'seconds': round(candidates_count / speed, 1) if speed else None,
+            # The benchmark isn't started by the estimate, it stops the scheduler until the bruting is finished
+            'hint': None if speed else 'No speed of the host is kept, run /technical/benchmark-jobs to get it',
+        }
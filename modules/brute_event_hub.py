@@ -0,0 +1,198 @@
+"""
+Module to push the events of brute sessions to the subscribers
+
+Author:
+    Konstantin S. (https://github.com/ST1LLY)
+"""
+import asyncio
+import logging
+import os
+import threading
+import time
+from typing import Any
+
+from modules.hashcat_performer import HashcatPerformer
+from modules.session_registry import SessionRegistry
+
+
+class BruteEventHub:
+    """
+    Class to watch the brute sessions and push their changes to the subscribers of this API worker.
+    One watcher thread serves all subscribers, so N viewers cost one reading of the registry
+    and the output files rather than N polls.
+    The events are
+        'state': {'session_name', 'state': 'running' / 'queued' / 'exited' / 'removed'} when the process is changed,
+        'status': the info of the session, see HashcatPerformer.get_instance_info, when the status is changed,
+        'cracked': {'session_name', 'nt_hashes': the hashes bruted since the previous event,
+                    'cracked_count': the number of hashes in the output file}.
+    """
+
+    # Pause between the checks of the sessions, in seconds
+    poll_interval: float = 1.0
+
+    # The subscribers {id: {'loop', 'queue', 'session_name': the watched session or None for all}}
+    subscribers: dict[int, dict[str, Any]] = {}
+
+    # The last seen sessions {session name: {'state', 'info', 'output_file_path', 'output_offset', 'cracked_count'}}
+    sessions: dict[str, dict[str, Any]] = {}
+
+    # The sessions have been seen once, the output of the sessions added later is pushed from the start
+    is_primed: bool = False
+
+    # Guard of the subscribers and the last seen sessions
+    lock: threading.Lock = threading.Lock()
+
+    # The watcher thread, None until the first subscriber
+    watcher: threading.Thread | None = None
+
+    def __init__(self) -> None:
+        pass
+
+    @staticmethod
+    def __publish(event: str, data: dict[str, Any]) -> None:
+        """
+        Put the event into the queues of the subscribers watching the session
+
+        Args:
+            event (str): the event name
+            data (dict[str, Any]): the event data, it has session_name
+        """
+        with BruteEventHub.lock:
+            subscribers = list(BruteEventHub.subscribers.values())
+        for subscriber in subscribers:
+            if subscriber['session_name'] in (None, data['session_name']):
+                subscriber['loop'].call_soon_threadsafe(subscriber['queue'].put_nowait, (event, data))
+
+    @staticmethod
+    def __read_cracked(seen: dict[str, Any]) -> list[str]:
+        """
+        Read the hashes appended to the output file of the session
+
+        Args:
+            seen (dict[str, Any]): the last seen session, its output offset is moved
+
+        Returns:
+            list[str]: the bruted NT-hashes
+        """
+        output_file_path = seen['output_file_path']
+        if not output_file_path or not os.path.isfile(output_file_path):
+            return []
+        with open(output_file_path, 'rb') as file:
+            file.seek(seen['output_offset'])
+            content = file.read()
+        # The last line can still be written by hashcat
+        content = content[: content.rfind(b'\n') + 1]
+        seen['output_offset'] += len(content)
+        nt_hashes = [line.partition(b':')[0].decode('utf-8').lower() for line in content.splitlines()]
+        seen['cracked_count'] += len(nt_hashes)
+        return nt_hashes
+
+    @staticmethod
+    def __check() -> None:
+        """
+        Compare the sessions with the last seen ones and publish the changes
+        """
+        infos = {info['session_name']: info for info in HashcatPerformer.get_all_instances_info()}
+        sessions = SessionRegistry.get_all('brute')
+        for session in sessions:
+            session_name = session['session_name']
+            info = infos.get(session_name)
+            seen = BruteEventHub.sessions.get(session_name)
+            if seen is None:
+                output_file_path = session['data'].get('output_file_path', '')
+                output_offset = 0
+                if not BruteEventHub.is_primed and os.path.isfile(output_file_path):
+                    output_offset = os.path.getsize(output_file_path)
+                seen = {
+                    'state': None,
+                    'info': None,
+                    'output_file_path': output_file_path,
+                    'output_offset': output_offset,
+                    'cracked_count': 0,
+                }
+                if output_offset:
+                    with open(output_file_path, 'rb') as file:
+                        seen['cracked_count'] = file.read(output_offset).count(b'\n')
+                with BruteEventHub.lock:
+                    BruteEventHub.sessions[session_name] = seen
+
+            if seen['state'] != session['state']:
+                seen['state'] = session['state']
+                BruteEventHub.__publish('state', {'session_name': session_name, 'state': session['state']})
+            if info is not None and seen['info'] != info:
+                seen['info'] = info
+                BruteEventHub.__publish('status', info)
+            if nt_hashes := BruteEventHub.__read_cracked(seen):
+                BruteEventHub.__publish(
+                    'cracked',
+                    {'session_name': session_name, 'nt_hashes': nt_hashes, 'cracked_count': seen['cracked_count']},
+                )
+
+        session_names = {session['session_name'] for session in sessions}
+        for session_name in list(BruteEventHub.sessions):
+            if session_name not in session_names:
+                with BruteEventHub.lock:
+                    del BruteEventHub.sessions[session_name]
+                BruteEventHub.__publish('state', {'session_name': session_name, 'state': 'removed'})
+        BruteEventHub.is_primed = True
+
+    @staticmethod
+    def __perform() -> None:
+        """
+        The loop of the watcher thread, the sessions are checked while there are subscribers
+        """
+        while True:
+            try:
+                if BruteEventHub.subscribers:
+                    BruteEventHub.__check()
+                else:
+                    # The sessions are seen anew by the next subscribers
+                    with BruteEventHub.lock:
+                        BruteEventHub.sessions = {}
+                        BruteEventHub.is_primed = False
+            except Exception:  # pylint: disable=broad-except
+                logging.exception('The check of brute sessions failed')
+            time.sleep(BruteEventHub.poll_interval)
+
+    @staticmethod
+    def subscribe(session_name: str | None = None) -> tuple[int, asyncio.Queue[tuple[str, dict[str, Any]]]]:
+        """
+        Subscribe to the events, it's called from the event loop the events are read in.
+        The queue gets the current state and status of the sessions seen by the watcher at first.
+
+        Args:
+            session_name (str | None): the watched session. Default: all sessions
+
+        Returns:
+            tuple[int, asyncio.Queue[tuple[str, dict[str, Any]]]]: the subscriber id
+                                                                   and the queue of (event name, event data)
+        """
+        queue: asyncio.Queue[tuple[str, dict[str, Any]]] = asyncio.Queue()
+        with BruteEventHub.lock:
+            subscriber_id = id(queue)
+            for seen_session_name, seen in BruteEventHub.sessions.items():
+                if session_name not in (None, seen_session_name) or seen['state'] is None:
+                    continue
+                queue.put_nowait(('state', {'session_name': seen_session_name, 'state': seen['state']}))
+                if seen['info'] is not None:
+                    queue.put_nowait(('status', seen['info']))
+            BruteEventHub.subscribers[subscriber_id] = {
+                'loop': asyncio.get_running_loop(),
+                'queue': queue,
+                'session_name': session_name,
+            }
+            if BruteEventHub.watcher is None:
+                BruteEventHub.watcher = threading.Thread(target=BruteEventHub.__perform, daemon=True)
+                BruteEventHub.watcher.start()
+        return subscriber_id, queue
+
+    @staticmethod
+    def unsubscribe(subscriber_id: int) -> None:
+        """
+        Unsubscribe from the events
+
+        Args:
+            subscriber_id (int): the subscriber id
+        """
+        with BruteEventHub.lock:
+            BruteEventHub.subscribers.pop(subscriber_id, None)
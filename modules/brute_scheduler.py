@@ -0,0 +1,168 @@
+"""
+Module to schedule the queued instances of hashcat
+
+Author:
+    Konstantin S. (https://github.com/ST1LLY)
+"""
+import fcntl
+import logging
+import threading
+import time
+from typing import Optional, TextIO
+
+from enviroment import BRUTE_SCHEDULER_LOCK_PATH
+from modules.benchmark_service import BenchmarkService
+from modules.cpu_partitioner import CpuPartitioner
+from modules.hashcat_performer import HashcatPerformer
+from modules.session_registry import SessionRegistry
+
+
+class BruteScheduler:
+    """
+    Class to start the queued instances of hashcat within the concurrency budget.
+    The queue is kept by SessionRegistry, the sessions are started by priority, then in the order of queueing.
+    A queued session preempts the running session with lower priority when the budget is exhausted.
+    The queued sessions in coalescing mode with the same dictionary and rules are started as one process.
+    Only one API worker schedules at a time, it's the one holding the lock file.
+    No session is started while a benchmark job is waiting or running, so the benchmark measures the idle host.
+    """
+
+    # The max number of hashcat processes running at the same time
+    max_running: int = 1
+
+    # Give every running session its own set of cores, see CpuPartitioner
+    is_cpu_partitioning: bool = False
+
+    # Pause between the scheduling rounds, in seconds
+    poll_interval: float = 1.0
+
+    # The lock file while this API worker is the scheduling one
+    lock_file: Optional[TextIO] = None
+
+    def __init__(self) -> None:
+        pass
+
+    @staticmethod
+    def __is_scheduling_worker() -> bool:
+        """
+        Check if this API worker schedules, try to become the scheduling one if no worker holds the lock
+
+        Returns:
+            bool: True if this API worker schedules
+        """
+        if BruteScheduler.lock_file is not None:
+            return True
+        # The file is kept open for the life of the worker, the lock is released when the worker is gone
+        # pylint: disable=R1732
+        lock_file = open(BRUTE_SCHEDULER_LOCK_PATH, 'w', encoding='utf-8')
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            lock_file.close()
+            return False
+        BruteScheduler.lock_file = lock_file
+        logging.info('The brute scheduler is run by this API worker')
+        return True
+
+    @staticmethod
+    def schedule() -> None:
+        """
+        Perform the scheduling round: start the queued sessions while the budget allows
+        and preempt the running sessions with lower priority than the first queued one
+        """
+        if BenchmarkService.is_running(is_queued_included=True):
+            return
+
+        sessions = SessionRegistry.get_all('brute')
+        running = [session for session in sessions if SessionRegistry.is_running(session)]
+        queued = []
+        for session in sessions:
+            if session['state'] != 'queued':
+                continue
+            # The process of the preempted session is still writing its restore file, it holds the slot
+            if session['pid'] and SessionRegistry.is_process_running(session['pid'], session['data']['start_time']):
+                running.append(session)
+                continue
+            queued.append(session)
+        queued.sort(key=lambda session: (-session['data'].get('priority', 0), session['data']['queued']))
+
+        # The sessions bruted by one coalesced instance share its process and its cores,
+        # the cores are kept by the session of the coalesced instance
+        groups = {group['session_name']: group for group in SessionRegistry.get_all('brute_group', states=('running',))}
+        busy_cpu_sets = {}
+        for running_session in running:
+            process = running_session['data'].get('group', running_session['session_name'])
+            busy_cpu_sets[process] = (groups[process] if process in groups else running_session)['data'].get('cpu_set')
+        processes = set(busy_cpu_sets)
+        started: set[str] = set()
+        for session in queued:
+            if session['session_name'] in started:
+                continue
+            if len(processes) < BruteScheduler.max_running:
+                cpu_set = None
+                if BruteScheduler.is_cpu_partitioning:
+                    cpu_set = CpuPartitioner.get_free_cpu_set(list(busy_cpu_sets.values()), BruteScheduler.max_running)
+                members = [session]
+                if HashcatPerformer.is_coalescible(session):
+                    members = [
+                        queued_session
+                        for queued_session in queued
+                        if queued_session['session_name'] not in started
+                        and HashcatPerformer.is_coalescible(queued_session)
+                        and queued_session['data']['coalesce']['key'] == session['data']['coalesce']['key']
+                    ]
+                logging.info(
+                    'Starting queued hashcat session_names: %s, cores: %s',
+                    [member['session_name'] for member in members],
+                    cpu_set,
+                )
+                if len(members) > 1:
+                    HashcatPerformer.start_coalesced_instances(members, cpu_set)
+                else:
+                    HashcatPerformer.start_queued_instance(session, cpu_set)
+                started.update(member['session_name'] for member in members)
+                processes.add(session['session_name'])
+                busy_cpu_sets[session['session_name']] = session['data'].get('limits', {}).get('cpu_set') or cpu_set
+                running.append(session)
+                continue
+
+            # The queued session with lower priority can't preempt when this one can't.
+            # The coalesced instance isn't preempted, its sessions can't be restored separately
+            preempted = min(
+                (
+                    running_session
+                    for running_session in running
+                    if running_session['state'] == 'running' and 'group' not in running_session['data']
+                ),
+                key=lambda running_session: running_session['data'].get('priority', 0),
+                default=None,
+            )
+            if preempted is not None and preempted['data'].get('priority', 0) < session['data'].get('priority', 0):
+                HashcatPerformer.preempt_instance(preempted)
+            break
+
+    @staticmethod
+    def __perform() -> None:
+        """
+        The loop of the scheduler thread
+        """
+        while True:
+            try:
+                if BruteScheduler.__is_scheduling_worker():
+                    BruteScheduler.schedule()
+            except Exception:  # pylint: disable=broad-except
+                logging.exception('The brute scheduling round failed')
+            time.sleep(BruteScheduler.poll_interval)
+
+    @staticmethod
+    def start(max_running: int, is_cpu_partitioning: bool = False) -> None:
+        """
+        Start the scheduler thread
+
+        Args:
+            max_running (int): the max number of hashcat processes running at the same time
+            is_cpu_partitioning (bool): give every running session its own set of cores. Default: False
+        """
+        BruteScheduler.max_running = max_running
+        BruteScheduler.is_cpu_partitioning = is_cpu_partitioning
+        threading.Thread(target=BruteScheduler.__perform, daemon=True).start()
@@ -0,0 +1,73 @@
+"""
+Module to split CPU cores between hashcat instances
+
+Author:
+    Konstantin S. (https://github.com/ST1LLY)
+"""
+import os
+
+
+class CpuPartitioner:
+    """
+    Class to split the cores available to the API into disjoint sets for the concurrent hashcat instances.
+    The first reserved_cores cores are left for the API, so it's responsive while bruting.
+    """
+
+    # The number of cores not given to hashcat instances
+    reserved_cores: int = 1
+
+    def __init__(self) -> None:
+        pass
+
+    @staticmethod
+    def get_usable_cores() -> list[int]:
+        """
+        Get the cores available to the API except the reserved ones
+
+        Returns:
+            list[int]: the cores, all available ones if there isn't any left after reserving
+        """
+        cores = sorted(os.sched_getaffinity(0))
+        return cores[CpuPartitioner.reserved_cores :] or cores
+
+    @staticmethod
+    def get_slots(slots_count: int) -> list[list[int]]:
+        """
+        Split the cores into the sets for slots_count instances
+
+        Args:
+            slots_count (int): the max number of instances running at the same time
+
+        Returns:
+            list[list[int]]: the core sets, empty if there are fewer cores than slots
+        """
+        usable_cores = CpuPartitioner.get_usable_cores()
+        if slots_count < 1 or len(usable_cores) < slots_count:
+            return []
+
+        slot_size, rest = divmod(len(usable_cores), slots_count)
+        slots = []
+        start = 0
+        for i in range(slots_count):
+            # The rest cores are spread over the first slots
+            end = start + slot_size + (1 if i < rest else 0)
+            slots.append(usable_cores[start:end])
+            start = end
+        return slots
+
+    @staticmethod
+    def get_free_cpu_set(busy_cpu_sets: list[list[int]], slots_count: int) -> list[int] | None:
+        """
+        Get the core set of the slot not used by the running instances
+
+        Args:
+            busy_cpu_sets (list[list[int]]): the core sets of the running instances
+            slots_count (int): the max number of instances running at the same time
+
+        Returns:
+            list[int] | None: the core set or None if no free slot exists
+        """
+        for slot in CpuPartitioner.get_slots(slots_count):
+            if slot not in busy_cpu_sets:
+                return slot
+        return None
@@ -0,0 +1,138 @@
+"""
+Module to keep the bruted NT-hashes of all sessions
+
+Author:
+    Konstantin S. (https://github.com/ST1LLY)
+"""
+import logging
+import os
+import re
+import sqlite3
+from datetime import datetime
+from typing import Iterable
+
+from enviroment import CRACKED_HASHES_DB_PATH
+
+
+class CrackedHashStore:
+    """
+    Class of the persistent store of bruted NT-hashes shared by all sessions. It replaces the potfile of hashcat.
+    NT-hash isn't salted, so a password bruted for one domain resolves the same hash in any other one.
+    """
+
+    # The max number of SQL variables in one query, SQLite < 3.32 allows 999
+    query_chunk_size: int = 500
+
+    def __init__(self) -> None:
+        pass
+
+    @staticmethod
+    def __connect() -> sqlite3.Connection:
+        """
+        Connect to the store creating the tables if needed
+
+        Returns:
+            sqlite3.Connection: the connection
+        """
+        connection = sqlite3.connect(CRACKED_HASHES_DB_PATH, timeout=30)
+        connection.execute('PRAGMA journal_mode=WAL')
+        connection.execute(
+            'CREATE TABLE IF NOT EXISTS cracked_hashes ('
+            'nt_hash BLOB PRIMARY KEY, password TEXT NOT NULL, session_name TEXT NOT NULL, added TEXT NOT NULL)'
+        )
+        connection.execute(
+            'CREATE TABLE IF NOT EXISTS synced_files (file_path TEXT PRIMARY KEY, offset INTEGER NOT NULL)'
+        )
+        return connection
+
+    @staticmethod
+    def __insert(connection: sqlite3.Connection, passwords: dict[str, str], session_name: str) -> None:
+        """
+        Insert the bruted hashes. The hashes known already are kept as they are.
+
+        Args:
+            connection (sqlite3.Connection): the connection
+            passwords (dict[str, str]): {NT-hash: password}
+            session_name (str): the session bruted the hashes
+        """
+        added = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        connection.executemany(
+            'INSERT OR IGNORE INTO cracked_hashes (nt_hash, password, session_name, added) VALUES (?, ?, ?, ?)',
+            [(bytes.fromhex(nt_hash), password, session_name, added) for nt_hash, password in passwords.items()],
+        )
+
+    @staticmethod
+    def get_passwords(nt_hashes: Iterable[str]) -> dict[str, str]:
+        """
+        Get the passwords of the known hashes
+
+        Args:
+            nt_hashes (Iterable[str]): NT-hashes in hex
+
+        Returns:
+            dict[str, str]: {NT-hash: password} for the hashes found in the store
+        """
+        nt_hashes = list(nt_hashes)
+        passwords = {}
+        connection = CrackedHashStore.__connect()
+        try:
+            for i in range(0, len(nt_hashes), CrackedHashStore.query_chunk_size):
+                chunk = [bytes.fromhex(nt_hash) for nt_hash in nt_hashes[i : i + CrackedHashStore.query_chunk_size]]
+                rows = connection.execute(
+                    f'SELECT nt_hash, password FROM cracked_hashes WHERE nt_hash IN ({",".join("?" * len(chunk))})',
+                    chunk,
+                )
+                for nt_hash, password in rows:
+                    passwords[nt_hash.hex()] = password
+        finally:
+            connection.close()
+        return passwords
+
+    @staticmethod
+    def sync_output_file(file_path: str) -> None:
+        """
+        Add the hashes from the hashcat output file. Only the lines appended since the previous sync are read.
+
+        Args:
+            file_path (str): path to the output file, its name is {hash file name}___{session name}.txt
+        """
+        session_name = os.path.splitext(os.path.basename(file_path).split('___')[-1])[0]
+        connection = CrackedHashStore.__connect()
+        try:
+            row = connection.execute('SELECT offset FROM synced_files WHERE file_path = ?', (file_path,)).fetchone()
+            offset = row[0] if row is not None else 0
+            if os.path.getsize(file_path) <= offset:
+                return
+            with open(file_path, 'rb') as file:
+                file.seek(offset)
+                content = file.read()
+            # The last line can still be written by hashcat
+            content = content[: content.rfind(b'\n') + 1]
+
+            passwords = {}
+            for line in content.decode('utf-8').splitlines():
+                nt_hash, sep, password = line.partition(':')
+                if sep and re.fullmatch(r'[0-9a-fA-F]{32}', nt_hash):
+                    passwords[nt_hash.lower()] = password
+
+            with connection:
+                CrackedHashStore.__insert(connection, passwords, session_name)
+                connection.execute(
+                    'INSERT OR REPLACE INTO synced_files (file_path, offset) VALUES (?, ?)',
+                    (file_path, offset + len(content)),
+                )
+            logging.debug('Synced %d bruted hashes from %s', len(passwords), file_path)
+        finally:
+            connection.close()
+
+    @staticmethod
+    def sync_output_folder(folder_path: str) -> None:
+        """
+        Add the hashes from all hashcat output files of the folder
+
+        Args:
+            folder_path (str): path to folder contained output files
+        """
+        for file_name in os.listdir(folder_path):
+            if '___' in file_name:
+                CrackedHashStore.sync_output_file(os.path.join(folder_path, file_name))
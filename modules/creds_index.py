@@ -0,0 +1,113 @@
+"""
+Module to match bruted NT-hashes with the accounts of dump files
+
+Author:
+    Konstantin S. (https://github.com/ST1LLY)
+"""
+import os
+import re
+import threading
+from collections import OrderedDict
+from typing import Any
+
+
+class CredsIndex:
+    """
+    Class of the cached indexes of dump files and hashcat output files.
+    A dump file is indexed once while its mtime and size are the same,
+    an output file is parsed from the offset reached by the previous call.
+    """
+
+    # The max number of files of every kind kept in the cache
+    max_cached_files: int = 32
+
+    accounts_indexes: OrderedDict[str, dict[str, Any]] = OrderedDict()
+    bruted_passwords: OrderedDict[str, dict[str, Any]] = OrderedDict()
+    lock = threading.Lock()
+
+    def __init__(self) -> None:
+        pass
+
+    @staticmethod
+    def __put(cache: OrderedDict[str, dict[str, Any]], file_path: str, value: dict[str, Any]) -> None:
+        """
+        Put the value into the cache dropping the least recently used one
+
+        Args:
+            cache (OrderedDict[str, dict[str, Any]]): the cache
+            file_path (str): the key
+            value (dict[str, Any]): the value
+        """
+        cache[file_path] = value
+        cache.move_to_end(file_path)
+        while len(cache) > CredsIndex.max_cached_files:
+            cache.popitem(last=False)
+
+    @staticmethod
+    def get_accounts(ntlm_hashes_file_path: str) -> dict[str, list[str]]:
+        """
+        Get NT-hash -> accounts index of the dump file
+
+        Args:
+            ntlm_hashes_file_path (str): path to the dump file, the lines are domain\\user:rid:lmhash:nthash:::
+
+        Returns:
+            dict[str, list[str]]: the accounts of every NT-hash
+        """
+        stat = os.stat(ntlm_hashes_file_path)
+        with CredsIndex.lock:
+            cached = CredsIndex.accounts_indexes.get(ntlm_hashes_file_path)
+            if cached is not None and cached['mtime'] == stat.st_mtime_ns and cached['size'] == stat.st_size:
+                CredsIndex.accounts_indexes.move_to_end(ntlm_hashes_file_path)
+                return cached['accounts']
+
+        accounts: dict[str, list[str]] = {}
+        with open(ntlm_hashes_file_path, 'r', encoding='utf-8') as file:
+            for line in file:
+                parts = line.rstrip('\r\n').split(':')
+                if len(parts) > 3 and re.fullmatch(r'[0-9a-fA-F]{32}', parts[3]):
+                    accounts.setdefault(parts[3].lower(), []).append(parts[0])
+
+        with CredsIndex.lock:
+            CredsIndex.__put(
+                CredsIndex.accounts_indexes,
+                ntlm_hashes_file_path,
+                {'mtime': stat.st_mtime_ns, 'size': stat.st_size, 'accounts': accounts},
+            )
+        return accounts
+
+    @staticmethod
+    def get_bruted_passwords(bruted_hashes_file_path: str) -> dict[str, str]:
+        """
+        Get NT-hash -> password of the hashcat output file. Only the lines appended since the previous call are parsed.
+
+        Args:
+            bruted_hashes_file_path (str): path to the output file, the lines are nthash:password
+
+        Returns:
+            dict[str, str]: the passwords of the bruted NT-hashes
+        """
+        with CredsIndex.lock:
+            cached = CredsIndex.bruted_passwords.get(bruted_hashes_file_path)
+            # Not parsed yet or rewritten since the previous call
+            if cached is None or os.path.getsize(bruted_hashes_file_path) < cached['offset']:
+                cached = {'offset': 0, 'passwords': {}}
+
+            with open(bruted_hashes_file_path, 'rb') as file:
+                file.seek(cached['offset'])
+                content = file.read()
+            # The last line can still be written by hashcat
+            content = content[: content.rfind(b'\n') + 1]
+
+            passwords = cached['passwords']
+            for line in content.decode('utf-8').splitlines():
+                nt_hash, sep, password = line.partition(':')
+                if sep:
+                    passwords[nt_hash.lower()] = password
+
+            CredsIndex.__put(
+                CredsIndex.bruted_passwords,
+                bruted_hashes_file_path,
+                {'offset': cached['offset'] + len(content), 'passwords': passwords},
+            )
+            return passwords
@@ -0,0 +1,271 @@
+"""
+Module to overlap dumping NTLM-hashes and bruting them
+
+Author:
+    Konstantin S. (https://github.com/ST1LLY)
+"""
+import logging
+import os
+import threading
+import time
+from typing import Any
+
+import modules.support_functions as sup_f
+from enviroment import NTLM_HASH_LISTS_DIR
+from modules.dump_ntlm_performer import DumpNTLMPerformer
+from modules.hashcat_performer import HashcatPerformer
+from modules.session_registry import SessionRegistry
+
+
+class DumpCrackPipeline:
+    """
+    Class to brute NT-hashes in batches while the dump is still running.
+    The dump streams the unique NT-hashes of user accounts into its hash list, every batch gets the hashes
+    appended since the previous one and is started as soon as the previous one is finished.
+    Every batch runs the whole keyspace of the dictionary and the rules, so while the dump is running
+    a batch isn't smaller than all the batches before it, the number of the batches grows
+    as the logarithm of the number of the hashes.
+    The pipelines are kept by SessionRegistry, so their info is seen by all API workers.
+    The thread of the pipeline runs in the API worker owning it, another worker resumes the pipeline
+    from the last started batch when the owner is gone.
+    """
+
+    # The session names of the pipelines followed by this API worker
+    instances: set[str] = set()
+
+    # Guard of the followed pipelines
+    lock: threading.Lock = threading.Lock()
+
+    # Pause between the checks of the hash list and the running processes, in seconds
+    poll_interval: float = 1.0
+
+    def __init__(self) -> None:
+        pass
+
+    @staticmethod
+    def __read_new_hashes(instance: dict[str, Any]) -> list[str]:
+        """
+        Read the hashes appended to the hash list since the previous reading
+
+        Args:
+            instance (dict[str, Any]): the pipeline instance
+
+        Returns:
+            list[str]: new NT-hashes
+        """
+        if not os.path.isfile(instance['hash_list_path']):
+            return []
+        with open(instance['hash_list_path'], 'rb') as file:
+            file.seek(instance['read_offset'])
+            content = file.read()
+        # The last line can still be written by the dump
+        content = content[: content.rfind(b'\n') + 1]
+        instance['read_offset'] += len(content)
+        return content.decode('utf-8').splitlines()
+
+    @staticmethod
+    def __run_batch(instance: dict[str, Any], hashes: list[str]) -> None:
+        """
+        Start hashcat for the batch of hashes
+
+        Args:
+            instance (dict[str, Any]): the pipeline instance
+            hashes (list[str]): NT-hashes of the batch
+        """
+        batch_number = len(instance['batches']) + 1
+        # The file name of the batch is the dump session name, so the output file of hashcat
+        # is matched with the .ntds file of the dump by creds/bruted as for a regular brute session
+        batch_dir_path = os.path.join(NTLM_HASH_LISTS_DIR, instance['session_name'], str(batch_number))
+        os.makedirs(batch_dir_path, exist_ok=True)
+        batch_file_path = os.path.join(batch_dir_path, instance['dump_session_name'])
+        with open(batch_file_path, 'w', encoding='utf-8') as file:
+            file.write('\n'.join(hashes) + '\n')
+
+        brute_session_name = HashcatPerformer.run_instance(
+            hash_file_path=batch_file_path,
+            dictionary_file_path=instance['dictionary_file_path'],
+            rules_file_path=instance['rules_file_path'],
+        )
+        instance['batches'].append({'session_name': brute_session_name, 'hashes_count': len(hashes)})
+        # The pipeline is resumed from the hashes not put into the batches yet
+        instance['hash_list_offset'] = instance['read_offset']
+        SessionRegistry.update(
+            instance['session_name'],
+            data={key: instance[key] for key in ('batches', 'hash_list_offset', 'hashes_count')},
+        )
+        logging.info(
+            'Pipeline %s started the batch %d of %d hashes, brute session_name: %s',
+            instance['session_name'],
+            batch_number,
+            len(hashes),
+            brute_session_name,
+        )
+
+    @staticmethod
+    def __perform(session_name: str) -> None:
+        """
+        The loop of the pipeline thread
+
+        Args:
+            session_name (str): session name of the pipeline
+        """
+        instance: dict[str, Any] = {'session_name': session_name, 'status': 'error', 'err_desc': ''}
+        try:
+            session = SessionRegistry.get(session_name, 'dump_crack')
+            if session is None:
+                raise ValueError(f'The pipeline {session_name} is not found')
+            instance.update(session['data'])
+            # The hashes read after the last started batch are read again
+            instance['read_offset'] = instance['hash_list_offset']
+            instance['hashes_count'] = sum(batch['hashes_count'] for batch in instance['batches'])
+            pending_hashes: list[str] = []
+            while True:
+                # The dump status is taken before reading, so no hash is left behind when it's finished
+                dump_status = DumpNTLMPerformer.get_instance_status(instance['dump_session_name'])
+                is_dump_running = dump_status['status'] == 'running'
+
+                if new_hashes := DumpCrackPipeline.__read_new_hashes(instance):
+                    instance['hashes_count'] += len(new_hashes)
+                    pending_hashes.extend(new_hashes)
+                    SessionRegistry.update(session_name, data={'hashes_count': instance['hashes_count']})
+
+                # The queued batch is waiting for the scheduler
+                is_batch_running = bool(instance['batches']) and (
+                    HashcatPerformer.is_instance_queued(instance['batches'][-1]['session_name'])
+                    or HashcatPerformer.is_instance_running(instance['batches'][-1]['session_name'])
+                )
+
+                # While the dump is running the batch isn't smaller than the hashes of the started batches
+                min_batch_size = max(instance['batch_size'], instance['hashes_count'] - len(pending_hashes))
+                if (
+                    not is_batch_running
+                    and pending_hashes
+                    and (len(pending_hashes) >= min_batch_size or not is_dump_running)
+                ):
+                    DumpCrackPipeline.__run_batch(instance, pending_hashes)
+                    pending_hashes = []
+                    continue
+
+                if not is_dump_running and not pending_hashes and not is_batch_running:
+                    if dump_status['status'] == 'finished':
+                        instance['status'] = 'finished'
+                    else:
+                        instance['err_desc'] = dump_status['err_desc'] or f'The dump is {dump_status["status"]}'
+                    break
+
+                time.sleep(DumpCrackPipeline.poll_interval)
+        except Exception as e:  # pylint: disable=broad-except
+            logging.exception('Pipeline %s failed', session_name)
+            instance['status'] = 'error'
+            instance['err_desc'] = str(e)
+        finally:
+            SessionRegistry.update(
+                session_name,
+                state='exited',
+                data={'status': instance['status'], 'err_desc': instance['err_desc']},
+            )
+            with DumpCrackPipeline.lock:
+                DumpCrackPipeline.instances.discard(session_name)
+
+    @staticmethod
+    def __start(session_name: str) -> None:
+        """
+        Start the thread of the pipeline if it isn't followed by this API worker
+
+        Args:
+            session_name (str): session name of the pipeline
+        """
+        with DumpCrackPipeline.lock:
+            if session_name in DumpCrackPipeline.instances:
+                return
+            DumpCrackPipeline.instances.add(session_name)
+        threading.Thread(target=DumpCrackPipeline.__perform, args=(session_name,), daemon=True).start()
+
+    @staticmethod
+    def run_instance(
+        dump_params: dict[str, Any], dictionary_file_path: str, rules_file_path: str, batch_size: int
+    ) -> str:
+        """
+        Run the dump with streaming hashes and the thread starting brute batches
+
+        Args:
+            dump_params (dict[str, Any]): the params of DumpNTLMPerformer.run_instance except stream_hashes
+            dictionary_file_path (str): path to file contained dictionary
+            rules_file_path (str): path to file contained rules
+            batch_size (int): the minimal number of new hashes to start the first batch while the dump is running,
+                              the next ones need at least as many new hashes as all the previous batches have
+
+        Returns:
+            str: session name
+        """
+        session_name = sup_f.generate_uuid()
+        dump_session_name = DumpNTLMPerformer.run_instance(**dump_params, stream_hashes=True)
+
+        SessionRegistry.add(
+            session_name,
+            'dump_crack',
+            0,
+            {
+                'dump_session_name': dump_session_name,
+                'hash_list_path': os.path.join(NTLM_HASH_LISTS_DIR, f'{dump_session_name}.hashlist'),
+                'hash_list_offset': 0,
+                'dictionary_file_path': dictionary_file_path,
+                'rules_file_path': rules_file_path,
+                'batch_size': batch_size,
+                'status': 'running',
+                'err_desc': '',
+                'hashes_count': 0,
+                'batches': [],
+            },
+        )
+        DumpCrackPipeline.__start(session_name)
+
+        return session_name
+
+    @staticmethod
+    def reattach_instances() -> None:
+        """
+        Resume the pipelines left running by the gone API workers
+        """
+        for session in SessionRegistry.get_all('dump_crack'):
+            if session['state'] != 'running' or session['session_name'] in DumpCrackPipeline.instances:
+                continue
+            # The pipeline is followed by another API worker
+            if not SessionRegistry.take_over(session['session_name']):
+                continue
+            logging.info('Resuming pipeline %s', session['session_name'])
+            DumpCrackPipeline.__start(session['session_name'])
+
+    @staticmethod
+    def get_instance_info(session_name: str) -> dict[str, Any]:
+        """
+        Info about the pipeline
+
+        Args:
+            session_name (str): session name of the pipeline
+
+        Returns:
+            dict[str, Any]: {
+                        'session_name': the session name,
+                        'status': 'running' / 'finished' / 'error' / 'not_found',
+                        'err_desc': error description if status = 'error',
+                        'dump_session_name': the session name of the dump,
+                        'hashes_count': the number of unique NT-hashes streamed by the dump,
+                        'batches': the brute session names and the numbers of hashes of the started batches
+                    }
+        """
+        session = SessionRegistry.get(session_name, 'dump_crack')
+        if session is not None:
+            data = session['data']
+            return {
+                'session_name': session_name,
+                **{key: data[key] for key in ('status', 'err_desc', 'dump_session_name', 'hashes_count', 'batches')},
+            }
+        return {
+            'session_name': session_name,
+            'status': 'not_found',
+            'err_desc': '',
+            'dump_session_name': '',
+            'hashes_count': 0,
+            'batches': [],
+        }
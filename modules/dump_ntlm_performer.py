@@ -4,21 +4,29 @@ Module to perform NTLM-hashes dump functionality
 Author:
     Konstantin S. (https://github.com/ST1LLY)
 """
+import json
 import logging
 import os
 import subprocess
 import sys
+from typing import Any
 
 import modules.support_functions as sup_f
-from enviroment import LOGS_DIR, DUMP_NTLM_SCRIPT_PATH
+from enviroment import LOGS_DIR, DUMP_NTLM_SCRIPT_PATH, NTLM_DUMP_RESUMES_DIR
+from modules.dump_worker_pool import DumpWorkerPool
+from modules.process_supervisor import ProcessSupervisor
+from modules.session_registry import SessionRegistry
 
 
 class DumpNTLMPerformer:
     """
-    Class to perform dumping NTLM hashes functionality
+    Class to perform dumping NTLM hashes functionality.
+    The sessions are kept by SessionRegistry, instances holds the processes started by this API worker
+    until their exits are recorded.
+    The status of the session is put into the registry by ProcessSupervisor when its process exits.
     """
 
-    instances: list = []
+    instances: dict[str, dict[str, Any]] = {}
 
     def __init__(self) -> None:
         pass
@@ -30,7 +38,7 @@ class DumpNTLMPerformer:
         return True
 
     @staticmethod
-    def __check_error_or_finished(file_out_path: str, file_err_path: str) -> dict:
+    def __check_error_or_finished(file_out_path: str, file_err_path: str) -> dict[str, str]:
         if 'NTLM-hashes dump file' in (last_line := sup_f.get_last_file_line(file_out_path)):
             return {'status': 'finished', 'err_desc': '', 'hashes_file_path': last_line.split(':')[-1].strip()}
 
@@ -43,73 +51,304 @@ class DumpNTLMPerformer:
         return {}
 
     @staticmethod
-    def run_instance(target: str, just_dc_user: str | None) -> str:
+    def __is_running(session_name: str) -> bool:
+        """
+        Check if the process of the session is running in any API worker
+
+        Args:
+            session_name (str): session name
+
+        Returns:
+            bool: True if the process is running
+        """
+        # The process is watched until ProcessSupervisor reaps it
+        if (instance := DumpNTLMPerformer.instances.get(session_name)) is not None:
+            return ProcessSupervisor.is_watched(instance['pid'])
+        session = SessionRegistry.get(session_name, 'dump')
+        return session is not None and SessionRegistry.is_running(session)
+
+    @staticmethod
+    def __get_script_args(session_name: str, params: dict[str, Any]) -> list[str]:
+        """
+        Get the command line args of the dumping script
+
+        Args:
+            session_name (str): session name
+            params (dict[str, Any]): the params of run_instance
+
+        Returns:
+            list[str]: script args
+        """
+        script_args = [
+            '--target',
+            params['target'],
+            '--session-name',
+            session_name,
+        ]
+        if params['just_dc_user'] is not None:
+            script_args.extend(['--just-dc-user', params['just_dc_user']])
+        if not params['bulk_replication']:
+            script_args.append('--per-user-replication')
+        script_args.extend(['--drsuapi-workers', str(params['drsuapi_workers'])])
+        if params['incremental']:
+            script_args.append('--incremental')
+        if params['stream_hashes']:
+            script_args.append('--stream-hashes')
+        return script_args
+
+    @staticmethod
+    def __on_exit(session_name: str, exit_code: int | None) -> None:
+        """
+        Put the status of the exited process into the session
+
+        Args:
+            session_name (str): session name
+            exit_code (int | None): the exit code of the process, None if it's unknown
+        """
+        file_out_path = os.path.join(LOGS_DIR, f'ntlm_dumping_{session_name}.log')
+        file_err_path = os.path.join(LOGS_DIR, f'ntlm_dumping_{session_name}_errors.log')
+        result = DumpNTLMPerformer.__check_error_or_finished(file_out_path, file_err_path)
+        if not result and exit_code is not None and exit_code > 0:
+            result = {
+                'status': 'error',
+                'err_desc': f'The process has exited with code {exit_code}',
+                'hashes_file_path': '',
+            }
+        # The process killed by a signal can be resumed
+        result = result or {'status': 'interrupted', 'err_desc': '', 'hashes_file_path': ''}
+        SessionRegistry.update(session_name, state='exited', data={'result': result})
+
+    @staticmethod
+    def __watch(
+        session_name: str, pid: int, process: subprocess.Popen[bytes] | None = None, is_pooled: bool = False
+    ) -> None:
+        """
+        Watch the process of the session by ProcessSupervisor
+
+        Args:
+            session_name (str): session name
+            pid (int): PID of the process
+            process (subprocess.Popen[bytes] | None): the process if it's the child of this API worker. Default: None
+            is_pooled (bool): the process is the worker of DumpWorkerPool. Default: False
+        """
+
+        def on_exit(exit_code: int | None) -> None:
+            try:
+                DumpNTLMPerformer.__on_exit(session_name, exit_code)
+            finally:
+                # The resumed session is run by a new process
+                if DumpNTLMPerformer.instances.get(session_name, {}).get('pid') == pid:
+                    del DumpNTLMPerformer.instances[session_name]
+
+        ProcessSupervisor.watch(
+            session_name,
+            pid,
+            process,
+            on_exit=on_exit,
+            get_exit_code=(lambda: DumpWorkerPool.get_exit_code(pid)) if is_pooled else None,
+        )
+
+    @staticmethod
+    def __init_subprocess(
+        session_name: str, script_args: list[str], is_resume: bool = False, callback_url: str | None = None
+    ) -> None:
+        """
+        Init dumping subprocess, it's forked by DumpWorkerPool if the pool is started
+
+        Args:
+            session_name (str): session name
+            script_args (list[str]): the command line args of the dumping script
+            is_resume (bool): the output log of the interrupted run is kept. Default: False
+            callback_url (str | None): the URL notified when the session is finished or failed. Default: None
+        """
+        file_out_path = os.path.join(LOGS_DIR, f'ntlm_dumping_{session_name}.log')
+        file_err_path = os.path.join(LOGS_DIR, f'ntlm_dumping_{session_name}_errors.log')
+
+        logging.info('Run dump ntlm process %s', script_args)
+
+        pid = 0
+        if DumpWorkerPool.is_started():
+            # The logs are created here, the worker appends to them
+            with open(file_out_path, 'a' if is_resume else 'w', encoding='utf-8'):
+                pass
+            with open(file_err_path, 'w', encoding='utf-8'):
+                pass
+            try:
+                pid = DumpWorkerPool.run(script_args, file_out_path, file_err_path)
+            except OSError:
+                logging.exception('The dump worker pool has failed, the dump is run by the interpreter')
+
+        opened_subprocess = None
+        if not pid:
+            # We should interact with the run process further and can't use with statement here
+            # pylint: disable=R1732
+            opened_subprocess = subprocess.Popen(
+                [sys.executable, DUMP_NTLM_SCRIPT_PATH, *script_args],
+                stdout=open(file_out_path, 'a' if is_resume else 'w', encoding='utf-8'),
+                stdin=subprocess.PIPE,
+                stderr=open(file_err_path, 'w', encoding='utf-8'),
+            )
+            pid = opened_subprocess.pid
+
+        DumpNTLMPerformer.instances[session_name] = {
+            'session_name': session_name,
+            'subprocess': opened_subprocess,
+            'pid': pid,
+            'file_out_path': file_out_path,
+            'file_err_path': file_err_path,
+        }
+        SessionRegistry.add(
+            session_name,
+            'dump',
+            pid,
+            {
+                'file_out_path': file_out_path,
+                'file_err_path': file_err_path,
+                'callback_url': callback_url,
+                'result': None,
+            },
+        )
+        DumpNTLMPerformer.__watch(session_name, pid, opened_subprocess, is_pooled=opened_subprocess is None)
+
+    @staticmethod
+    def run_instance(
+        target: str,
+        just_dc_user: str | None,
+        bulk_replication: bool = True,
+        drsuapi_workers: int = 1,
+        incremental: bool = False,
+        stream_hashes: bool = False,
+        callback_url: str | None = None,
+    ) -> str:
         """
         Run the instance of bruting process
 
         Args:
             target (str): The format is [[domain/]username[:password]@]<targetName or address>
             just_dc_user (str | None): The specified AD user
+            bulk_replication (bool): replicate the whole domain NC by pages. Default: True
+            drsuapi_workers (int): the number of parallel DRSUAPI bindings used by the per user replication.
+                                   Default: 1
+            incremental (bool): replicate only the changes since the previous dump of the same DC. Default: False
+            stream_hashes (bool): stream the unique NT-hashes of user accounts
+                                  into files/hash_lists/<session name>.hashlist while dumping. Default: False
+            callback_url (str | None): the URL notified when the session is finished or failed, see WebhookNotifier.
+                                       Default: None
 
         Returns:
             str: session name
         """
         session_name = sup_f.generate_uuid()
-        file_out_path = os.path.join(LOGS_DIR, f'ntlm_dumping_{session_name}.log')
-        file_err_path = os.path.join(LOGS_DIR, f'ntlm_dumping_{session_name}_errors.log')
+        params = {
+            'target': target,
+            'just_dc_user': just_dc_user,
+            'bulk_replication': bulk_replication,
+            'drsuapi_workers': drsuapi_workers,
+            'incremental': incremental,
+            'stream_hashes': stream_hashes,
+            'callback_url': callback_url,
+        }
 
-        process_args = [sys.executable, DUMP_NTLM_SCRIPT_PATH, '--target', target, '--session-name', session_name]
-        if just_dc_user is not None:
-            process_args.extend(['--just-dc-user', just_dc_user])
+        # The params are kept to resume the session if its process is killed
+        with open(os.path.join(NTLM_DUMP_RESUMES_DIR, f'{session_name}.params.json'), 'w', encoding='utf-8') as file:
+            json.dump(params, file)
 
-        logging.info('Run dump ntlm process %s', process_args)
-
-        # We should interact with the run process further and can't use with statement here
-        # pylint: disable=R1732
-        subprocess.Popen(
-            process_args,
-            stdout=open(file_out_path, 'w', encoding='utf-8'),
-            stdin=subprocess.PIPE,
-            stderr=open(file_err_path, 'w', encoding='utf-8'),
+        DumpNTLMPerformer.__init_subprocess(
+            session_name, DumpNTLMPerformer.__get_script_args(session_name, params), callback_url=callback_url
         )
 
-        DumpNTLMPerformer.instances.append(
-            {'session_name': session_name, 'file_out_path': file_out_path, 'file_err_path': file_err_path}
+        return session_name
+
+    @staticmethod
+    def resume_instance(session_name: str) -> dict[str, str]:
+        """
+        Resume the interrupted instance of dumping process from its last checkpoint
+
+        Args:
+            session_name (str): uuid of the interrupted job
+
+        Returns:
+            dict: {
+                'status': 'success' / 'not_found' / 'running',
+                'session_name': session name
+            }
+        """
+        params_file_path = os.path.join(NTLM_DUMP_RESUMES_DIR, f'{session_name}.params.json')
+        resume_file_path = os.path.join(NTLM_DUMP_RESUMES_DIR, f'{session_name}.resume')
+
+        # The resume file is removed when the dump is finished
+        if not (os.path.isfile(params_file_path) and os.path.isfile(resume_file_path)):
+            return {'status': 'not_found', 'session_name': session_name}
+
+        if DumpNTLMPerformer.__is_running(session_name):
+            return {'status': 'running', 'session_name': session_name}
+
+        with open(params_file_path, 'r', encoding='utf-8') as file:
+            params = json.load(file)
+
+        DumpNTLMPerformer.__init_subprocess(
+            session_name,
+            DumpNTLMPerformer.__get_script_args(session_name, params),
+            is_resume=True,
+            callback_url=params.get('callback_url'),
         )
 
-        return session_name
+        return {'status': 'success', 'session_name': session_name}
+
+    @staticmethod
+    def reattach_instances() -> None:
+        """
+        Watch the processes of dumping left running by the previous run of the API.
+        The sessions with the gone processes get their status at once.
+        """
+        for session in SessionRegistry.get_all('dump'):
+            session_name = session['session_name']
+            if session['state'] != 'running' or session_name in DumpNTLMPerformer.instances:
+                continue
+            # The session is watched by another API worker
+            if not SessionRegistry.take_over(session_name):
+                continue
+            if SessionRegistry.is_running(session):
+                logging.info('Reattaching to dump ntlm session_name: %s, pid: %s', session_name, session['pid'])
+                DumpNTLMPerformer.__watch(session_name, session['pid'])
+                continue
+            logging.info('The process of dump ntlm session_name: %s is gone', session_name)
+            DumpNTLMPerformer.__on_exit(session_name, None)
 
     @classmethod
-    def get_instance_status(cls, session_name: str) -> dict[str, str]:
+    def get_instance_status(cls, session_name: str) -> dict[str, Any]:
         """
 
         Args:
             session_name (str): uuid of running job
 
         Returns:
-            dict[str, str]:
+            dict[str, Any]:
                 status: error/finished/running/interrupted
                 err_desc: error description if status = 'error'
                 hashes_file_path: path to file with NTLM-hashes if status = 'finished'
+                exit_code: the exit code of the process, None if it's running or unknown
+                end_time: the datetime of the exit of the process, None if it's running or unknown
         """
+        session = SessionRegistry.get(session_name, 'dump')
+        exit_info: dict[str, Any] = {'exit_code': None, 'end_time': None}
+        if session is not None:
+            exit_info = {'exit_code': session['data'].get('exit_code'), 'end_time': session['data'].get('end_time')}
+            # The status is put by the supervisor when the process exits
+            if session['state'] == 'exited' and session['data'].get('result'):
+                return {**session['data']['result'], **exit_info}
 
-        is_instance_found = False
+        if cls.__is_running(session_name):
+            return {'status': 'running', 'err_desc': '', 'hashes_file_path': '', **exit_info}
 
+        # The sessions without the status are left by the killed API workers or by the previous versions
         file_out_path = os.path.join(LOGS_DIR, f'ntlm_dumping_{session_name}.log')
         file_err_path = os.path.join(LOGS_DIR, f'ntlm_dumping_{session_name}_errors.log')
 
         if not (os.path.exists(file_out_path) or os.path.exists(file_err_path)):
-            return {'status': 'not_found', 'err_desc': '', 'hashes_file_path': ''}
-
-        for instance in DumpNTLMPerformer.instances:
-            if instance['session_name'] == session_name:
-                is_instance_found = True
-                break
+            return {'status': 'not_found', 'err_desc': '', 'hashes_file_path': '', **exit_info}
 
         if status := cls.__check_error_or_finished(file_out_path, file_err_path):
-            return status
-
-        if is_instance_found:
-            return {'status': 'running', 'err_desc': '', 'hashes_file_path': ''}
+            return {**status, **exit_info}
 
-        return {'status': 'interrupted', 'err_desc': '', 'hashes_file_path': ''}
+        return {'status': 'interrupted', 'err_desc': '', 'hashes_file_path': '', **exit_info}
@@ -45,6 +45,10 @@ class DumpSecrets:
         self.__resumeFileName = options.resumefile
         self.__canProcessSAMLSA = True
         self.__kdcHost = options.dc_ip
+        self.__bulkReplication = options.bulk_replication
+        self.__drsuapiWorkers = options.drsuapi_workers
+        self.__replicationState = options.replication_state
+        self.__perSecretCallback = options.per_secret_callback
         self.__options = options
 
         if options.hashes is not None:
@@ -179,6 +183,10 @@ class DumpSecrets:
                 outputFileName=self.__outputFileName,
                 justUser=self.justUser,
                 printUserStatus=self.__printUserStatus,
+                bulkReplication=self.__bulkReplication,
+                drsuapiWorkers=self.__drsuapiWorkers,
+                replicationState=self.__replicationState,
+                perSecretCallback=self.__perSecretCallback,
             )
             try:
                 self.__NTDSHashes.dump()
@@ -235,6 +243,11 @@ class DumpSecrets:
                 if not isinstance(e, KeyboardInterrupt):
                     raise
 
+    def getReplicationState(self):
+        if self.__NTDSHashes is None:
+            return None
+        return self.__NTDSHashes.getReplicationState()
+
     def cleanup(self):
         logging.info('Cleaning up... ')
         if self.__remoteOps:
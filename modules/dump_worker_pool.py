@@ -0,0 +1,264 @@
+"""
+Module to start the dumping processes from a pre-warmed server process
+
+Author:
+    Konstantin S. (https://github.com/ST1LLY)
+"""
+import importlib
+import json
+import logging
+import os
+import queue
+import selectors
+import signal
+import subprocess
+import sys
+import threading
+import traceback
+import types
+from typing import Any
+
+from enviroment import DUMP_NTLM_SCRIPT_PATH, LOGS_DIR, ROOT_DIR
+
+
+class DumpWorkerPool:
+    """
+    Class to run the dumping jobs in the workers forked from the server process.
+    The server imports the dumping script with impacket and reads the config once,
+    every job is a fresh fork of it, so a job starts in milliseconds and a crashed job doesn't affect
+    the server or the other jobs. The jobs are sent to the server over its stdin,
+    the server replies the PIDs of the workers and their exit codes over its stdout.
+    The server is started again on the next job if it dies, the workers outlive the server.
+    """
+
+    # The module name of the dumping script
+    module_name: str = os.path.splitext(os.path.basename(DUMP_NTLM_SCRIPT_PATH))[0]
+
+    # The time to wait for the server to reply, in seconds
+    reply_timeout: float = 10.0
+
+    # The server process, None if the pool isn't started
+    server: subprocess.Popen[str] | None = None
+
+    # The PIDs of the started workers replied by the server
+    started: queue.Queue[int] = queue.Queue()
+
+    # The exit codes of the workers replied by the server {pid: exit code}
+    exit_codes: dict[int, int] = {}
+
+    # Guard of the server and notifying of the exit codes
+    lock: threading.Condition = threading.Condition()
+
+    def __init__(self) -> None:
+        pass
+
+    @staticmethod
+    def __read_replies(server: subprocess.Popen[str]) -> None:
+        """
+        The loop of the thread reading the replies of the server, it's finished when the server exits
+
+        Args:
+            server (subprocess.Popen[str]): the server process
+        """
+        # The stdout of the server is always a pipe, see __ensure_server
+        for line in server.stdout if server.stdout is not None else ():
+            try:
+                reply = json.loads(line)
+            except ValueError:
+                logging.warning('The dump worker pool has replied %s', repr(line))
+                continue
+            if reply['event'] == 'started':
+                DumpWorkerPool.started.put(reply['pid'])
+            elif reply['event'] == 'exited':
+                with DumpWorkerPool.lock:
+                    DumpWorkerPool.exit_codes[reply['pid']] = reply['exit_code']
+                    DumpWorkerPool.lock.notify_all()
+        server.wait()
+        logging.warning('The dump worker pool server has exited with code %s', server.returncode)
+        with DumpWorkerPool.lock:
+            DumpWorkerPool.lock.notify_all()
+
+    @staticmethod
+    def __ensure_server() -> subprocess.Popen[str]:
+        """
+        Start the server if it isn't running, it's called under the lock
+
+        Returns:
+            subprocess.Popen[str]: the server process
+        """
+        if DumpWorkerPool.server is not None and DumpWorkerPool.server.poll() is None:
+            return DumpWorkerPool.server
+        # We should interact with the run process further and can't use with statement here
+        # pylint: disable=R1732
+        DumpWorkerPool.server = subprocess.Popen(
+            [sys.executable, '-m', __name__],
+            cwd=ROOT_DIR,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=open(os.path.join(LOGS_DIR, 'dump_worker_pool_errors.log'), 'a', encoding='utf-8'),
+            text=True,
+            bufsize=1,
+        )
+        DumpWorkerPool.started = queue.Queue()
+        threading.Thread(target=DumpWorkerPool.__read_replies, args=(DumpWorkerPool.server,), daemon=True).start()
+        logging.info('The dump worker pool server is started, pid: %s', DumpWorkerPool.server.pid)
+        return DumpWorkerPool.server
+
+    @staticmethod
+    def start() -> None:
+        """
+        Start the server, so the first dump doesn't wait for the imports
+        """
+        with DumpWorkerPool.lock:
+            DumpWorkerPool.__ensure_server()
+
+    @staticmethod
+    def is_started() -> bool:
+        """
+        Check if the pool is started
+
+        Returns:
+            bool: True if the pool is started
+        """
+        return DumpWorkerPool.server is not None
+
+    @staticmethod
+    def run(script_args: list[str], file_out_path: str, file_err_path: str) -> int:
+        """
+        Run the dumping job in a new worker
+
+        Args:
+            script_args (list[str]): the command line args of the dumping script
+            file_out_path (str): path to the log file of stdout, the output is appended
+            file_err_path (str): path to the log file of stderr, the output is appended
+
+        Returns:
+            int: PID of the worker
+
+        Raises:
+            OSError: the server has failed to start the worker
+        """
+        job = {'script_args': script_args, 'file_out_path': file_out_path, 'file_err_path': file_err_path}
+        # The jobs are sent one by one, so the replied PID is the PID of the sent job
+        with DumpWorkerPool.lock:
+            server = DumpWorkerPool.__ensure_server()
+            try:
+                if server.stdin is None:
+                    raise OSError('The stdin of the server is closed')
+                server.stdin.write(json.dumps(job) + '\n')
+                server.stdin.flush()
+                return DumpWorkerPool.started.get(timeout=DumpWorkerPool.reply_timeout)
+            except (OSError, ValueError, queue.Empty) as exc:
+                # The server is started again by the next job
+                server.kill()
+                raise OSError(f"The dump worker pool server hasn't started the job: {exc!r}") from exc
+
+    @staticmethod
+    def get_exit_code(pid: int) -> int | None:
+        """
+        Get the exit code of the exited worker, it's replied by the server right after the exit
+
+        Args:
+            pid (int): PID of the worker
+
+        Returns:
+            int | None: the exit code, negative if the worker is killed by a signal,
+                        None if the server has exited before replying it
+        """
+
+        def is_replied() -> bool:
+            server = DumpWorkerPool.server
+            return pid in DumpWorkerPool.exit_codes or server is None or server.poll() is not None
+
+        with DumpWorkerPool.lock:
+            DumpWorkerPool.lock.wait_for(is_replied, timeout=DumpWorkerPool.reply_timeout)
+            return DumpWorkerPool.exit_codes.pop(pid, None)
+
+    @staticmethod
+    def __run_job(job: dict[str, Any], module: types.ModuleType) -> None:
+        """
+        Run the dumping script in the forked worker, the worker exits with the exit code of the script
+
+        Args:
+            job (dict[str, Any]): {'script_args', 'file_out_path', 'file_err_path'}, see run
+            module (types.ModuleType): the imported dumping script
+        """
+        exit_code = 0
+        try:
+            signal.set_wakeup_fd(-1)
+            signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+            signal.signal(signal.SIGINT, signal.default_int_handler)
+            null_fd = os.open(os.devnull, os.O_RDONLY)
+            os.dup2(null_fd, 0)
+            os.close(null_fd)
+            for fd, file_path in ((1, job['file_out_path']), (2, job['file_err_path'])):
+                file_fd = os.open(file_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+                os.dup2(file_fd, fd)
+                os.close(file_fd)
+            sys.argv = [DUMP_NTLM_SCRIPT_PATH, *job['script_args']]
+            module.main(job['script_args'])
+        except SystemExit as exc:
+            exit_code = exc.code if isinstance(exc.code, int) else int(exc.code is not None)
+        except BaseException:  # pylint: disable=broad-except
+            traceback.print_exc()
+            exit_code = 1
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os._exit(exit_code)  # pylint: disable=protected-access
+
+    @staticmethod
+    def serve() -> None:
+        """
+        The loop of the server process, it's finished when the API closes the stdin of the server
+        """
+        module = importlib.import_module(DumpWorkerPool.module_name)
+
+        # The exits of the workers wake the loop up
+        wakeup_r, wakeup_w = os.pipe()
+        os.set_blocking(wakeup_r, False)
+        os.set_blocking(wakeup_w, False)
+        signal.set_wakeup_fd(wakeup_w)
+        signal.signal(signal.SIGCHLD, lambda *_: None)
+        # The server exits when the API closes its stdin, the workers get the interrupt themselves
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+        selector = selectors.DefaultSelector()
+        selector.register(sys.stdin, selectors.EVENT_READ)
+        selector.register(wakeup_r, selectors.EVENT_READ)
+
+        def reply(data: dict[str, Any]) -> None:
+            sys.stdout.write(json.dumps(data) + '\n')
+            sys.stdout.flush()
+
+        is_serving = True
+        while is_serving:
+            for key, _ in selector.select():
+                if key.fileobj == wakeup_r:
+                    os.read(wakeup_r, 4096)
+                    continue
+                line = sys.stdin.readline()
+                if not line:
+                    is_serving = False
+                    break
+                job = json.loads(line)
+                if (pid := os.fork()) == 0:
+                    selector.close()
+                    os.close(wakeup_r)
+                    os.close(wakeup_w)
+                    DumpWorkerPool.__run_job(job, module)
+                reply({'event': 'started', 'pid': pid})
+
+            # The exited workers are reaped and their exit codes are replied
+            while True:
+                try:
+                    pid, status = os.waitpid(-1, os.WNOHANG)
+                except ChildProcessError:
+                    break
+                if pid == 0:
+                    break
+                reply({'event': 'exited', 'pid': pid, 'exit_code': os.waitstatus_to_exitcode(status)})
+
+
+if __name__ == '__main__':
+    DumpWorkerPool.serve()
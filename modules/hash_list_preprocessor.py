@@ -0,0 +1,115 @@
+"""
+Module to prepare the list of NT-hashes before bruting
+
+Author:
+    Konstantin S. (https://github.com/ST1LLY)
+"""
+import logging
+import os
+import re
+from typing import Any
+
+from modules.cracked_hash_store import CrackedHashStore
+
+
+class HashListPreprocessor:
+    """
+    Class to turn a dump file into the list of hashes worth bruting
+    """
+
+    # NT-hash of the empty password
+    EMPTY_NT_HASH = '31d6cfe0d16ae931b73c59d7e0c089c0'
+
+    # LM-hash of the empty password, it is also stored when LM-hash is disabled
+    BLANK_LM_HASH = 'aad3b435b51404eeaad3b435b51404ee'
+
+    def __init__(self) -> None:
+        pass
+
+    @staticmethod
+    def __parse_line(line: str) -> tuple[str, str, str]:
+        """
+        Parse the line of the hash file
+
+        Args:
+            line (str): domain\\user:rid:lmhash:nthash::: from a dump or just nthash
+
+        Returns:
+            tuple[str, str, str]: account, lmhash and nthash. Account and lmhash are empty for a bare hash
+        """
+        parts = line.split(':')
+        if len(parts) < 4:
+            return '', '', parts[0].lower()
+        return parts[0], parts[2].lower(), parts[3].lower()
+
+    @staticmethod
+    def preprocess(hash_file_path: str, output_dir_path: str, exclude_machine_accounts: bool = True) -> dict[str, Any]:
+        """
+        Write the unique NT-hashes to brute into output_dir_path.
+        The hashes of machine accounts only are skipped, their passwords are random,
+        the hash of the empty password and the hashes bruted by any previous session are resolved without bruting.
+
+        Args:
+            hash_file_path (str): path to the dump file or the file contained NT-hashes only
+            output_dir_path (str): the dir for the output files
+            exclude_machine_accounts (bool): skip the hashes used by machine accounts ($) only. Default: True
+
+        Returns:
+            dict[str, Any]: {
+                        'hash_file_path': path to the file with the unique hashes to brute. Its name is the name of
+                                          hash_file_path, so the output of hashcat is matched with the dump file,
+                        'resolved': {NT-hash: password} for the hashes resolved without bruting,
+                        'stats': the counters of the classified hashes
+                    }
+        """
+        accounts: dict[str, list[str]] = {}
+        stats = {'lines': 0, 'unique': 0, 'machine_only': 0, 'resolved': 0, 'known': 0, 'lm_stored': 0, 'to_brute': 0}
+
+        with open(hash_file_path, 'r', encoding='utf-8') as file:
+            for line in file:
+                line = line.strip()
+                if not line:
+                    continue
+                stats['lines'] += 1
+                account, lm_hash, nt_hash = HashListPreprocessor.__parse_line(line)
+                if not re.fullmatch(r'[0-9a-f]{32}', nt_hash):
+                    logging.warning('Line %s of %s has not got NT-hash, skipping', repr(line), hash_file_path)
+                    continue
+                accounts.setdefault(nt_hash, [])
+                if account:
+                    accounts[nt_hash].append(account)
+                if lm_hash and lm_hash != HashListPreprocessor.BLANK_LM_HASH:
+                    stats['lm_stored'] += 1
+
+        resolved = {}
+        hashes_to_brute = []
+        for nt_hash, hash_accounts in accounts.items():
+            if nt_hash == HashListPreprocessor.EMPTY_NT_HASH:
+                resolved[nt_hash] = ''
+            elif exclude_machine_accounts and hash_accounts and all(acc.endswith('$') for acc in hash_accounts):
+                stats['machine_only'] += 1
+            else:
+                hashes_to_brute.append(nt_hash)
+
+        known = CrackedHashStore.get_passwords(hashes_to_brute)
+        if known:
+            resolved.update(known)
+            hashes_to_brute = [nt_hash for nt_hash in hashes_to_brute if nt_hash not in known]
+        stats['known'] = len(known)
+        stats['unique'] = len(accounts)
+        stats['resolved'] = len(resolved)
+        stats['to_brute'] = len(hashes_to_brute)
+
+        os.makedirs(output_dir_path, exist_ok=True)
+        output_hash_file_path = os.path.join(output_dir_path, os.path.basename(hash_file_path))
+        with open(output_hash_file_path, 'w', encoding='utf-8') as file:
+            for nt_hash in hashes_to_brute:
+                file.write(nt_hash + '\n')
+
+        logging.info('Preprocessed %s: %s', hash_file_path, stats)
+
+        return {
+            'hash_file_path': output_hash_file_path,
+            'resolved': resolved,
+            'stats': stats,
+        }
@@ -0,0 +1,119 @@
+"""
+Module to route the output of the coalesced hashcat instance to the sessions
+
+Author:
+    Konstantin S. (https://github.com/ST1LLY)
+"""
+import logging
+import threading
+import time
+from typing import Callable, Optional
+
+
+class HashcatOutputRouter:
+    """
+    Class to follow the output file of hashcat bruting the hashes of several sessions at once.
+    Every bruted hash is appended to the output files of the sessions having the hash,
+    so creds/bruted works for every session as for the session bruted alone.
+    """
+
+    # Pause between the checks of the output file, in seconds
+    poll_interval: float = 1.0
+
+    def __init__(self) -> None:
+        pass
+
+    @staticmethod
+    def get_routes(members: dict[str, str]) -> dict[str, list[str]]:
+        """
+        Get the output files of the sessions for every hash
+
+        Args:
+            members (dict[str, str]): {path to the hash list of the session: path to the output file of the session}
+
+        Returns:
+            dict[str, list[str]]: {NT-hash: the output files of the sessions having it}
+        """
+        routes: dict[str, list[str]] = {}
+        for hash_file_path, output_file_path in members.items():
+            with open(hash_file_path, 'r', encoding='utf-8') as file:
+                for line in file:
+                    if nt_hash := line.strip().lower():
+                        routes.setdefault(nt_hash, []).append(output_file_path)
+        return routes
+
+    @staticmethod
+    def __perform(
+        output_file_path: str,
+        routes: dict[str, list[str]],
+        offset: int,
+        is_running: Callable[[], bool],
+        on_routed: Optional[Callable[[int], None]],
+    ) -> None:
+        """
+        The loop of the router thread, it is finished when the process is finished and its output is routed
+
+        Args:
+            output_file_path (str): path to the output file of the coalesced instance
+            routes (dict[str, list[str]]): see get_routes
+            offset (int): the offset of the output file to start routing from
+            is_running (Callable[[], bool]): check if the process is running
+            on_routed (Optional[Callable[[int], None]]): called with the offset of the routed output
+        """
+        while True:
+            # The process state is taken before reading, so no line is left behind when it's finished
+            is_process_running = is_running()
+            content = b''
+            try:
+                with open(output_file_path, 'rb') as file:
+                    file.seek(offset)
+                    content = file.read()
+            except FileNotFoundError:
+                # Hashcat creates the output file with the first bruted hash
+                pass
+            # The last line can still be written by hashcat
+            content = content[: content.rfind(b'\n') + 1]
+            if not content:
+                if not is_process_running:
+                    break
+                time.sleep(HashcatOutputRouter.poll_interval)
+                continue
+
+            lines_by_file: dict[str, list[str]] = {}
+            for line in content.decode('utf-8').splitlines():
+                nt_hash = line.partition(':')[0].lower()
+                if nt_hash not in routes:
+                    logging.warning('Bruted hash %s has no session to route to', nt_hash)
+                for session_output_file_path in routes.get(nt_hash, []):
+                    lines_by_file.setdefault(session_output_file_path, []).append(line + '\n')
+            for session_output_file_path, lines in lines_by_file.items():
+                with open(session_output_file_path, 'a', encoding='utf-8') as file:
+                    file.writelines(lines)
+
+            offset += len(content)
+            if on_routed is not None:
+                on_routed(offset)
+
+    @staticmethod
+    def start(
+        output_file_path: str,
+        routes: dict[str, list[str]],
+        is_running: Callable[[], bool],
+        offset: int = 0,
+        on_routed: Optional[Callable[[int], None]] = None,
+    ) -> None:
+        """
+        Start the router thread
+
+        Args:
+            output_file_path (str): path to the output file of the coalesced instance
+            routes (dict[str, list[str]]): see get_routes
+            is_running (Callable[[], bool]): check if the process is running
+            offset (int): the offset of the output file to start routing from. Default: 0
+            on_routed (Optional[Callable[[int], None]]): called with the offset of the routed output. Default: None
+        """
+        threading.Thread(
+            target=HashcatOutputRouter.__perform,
+            args=(output_file_path, routes, offset, is_running, on_routed),
+            daemon=True,
+        ).start()
@@ -6,12 +6,22 @@ Author:
 """
 import logging
 import os
-import re
+import shutil
+import signal
 import subprocess
+import threading
 import time
 import uuid
+from typing import Any, Callable
 
-import modules.support_functions as sup_f
+from modules.attack_plan import AttackPlan
+from modules.benchmark_service import BenchmarkService
+from modules.cracked_hash_store import CrackedHashStore
+from modules.hash_list_preprocessor import HashListPreprocessor
+from modules.hashcat_output_router import HashcatOutputRouter
+from modules.hashcat_status_reader import HashcatStatusReader
+from modules.process_supervisor import ProcessSupervisor
+from modules.session_registry import SessionRegistry
 
 
 class NotAllowedFileName(Exception):
@@ -22,122 +32,469 @@ class NotAllowedFileName(Exception):
 
 class HashcatPerformer:
     """
-    Class to perform hashcat functionality
+    Class to perform hashcat functionality.
+    The sessions are kept by SessionRegistry, instances holds the processes followed by this API worker
+    until their exits are recorded and their statuses are read to the end.
     """
 
-    instances: list = []
+    instances: dict[str, dict[str, Any]] = {}
+
+    # Guard of the instances
+    lock: threading.Lock = threading.Lock()
+
+    # The interval of printing the status by hashcat, in seconds
+    status_timer: int = 5
+
+    # The exit codes of hashcat failures, -1 and -2 (GPU watchdog alarm) as the process exit status
+    ERROR_EXIT_CODES = (255, 254)
+
     output_folder: str
     restores_folder: str
     logs_folder: str
+    hash_lists_folder: str
 
     def __init__(self) -> None:
         pass
 
     @staticmethod
-    def __set_instance(instance: dict) -> None:
+    def __set_instance(instance: dict[str, Any]) -> None:
         """
-        Set new instance to managed list
+        Set new instance to managed instances
 
         Args:
-            instance (dict): dict with info of new instance
+            instance (dict[str, Any]): dict with info of new instance
         """
-        HashcatPerformer.instances.append(instance)
+        HashcatPerformer.instances[instance['session_name']] = instance
 
     @staticmethod
-    def __get_found_instance_info(certain_instance: dict) -> dict[str, str | list[dict[str, str]]]:
+    def __release_instance(instance: dict[str, Any], follower: str) -> None:
+        """
+        Remove the instance from managed instances when all its followers are finished
+
+        Args:
+            instance (dict[str, Any]): the instance
+            follower (str): the finished follower, 'supervisor' when the exit is recorded,
+                            'reader' when the status is read to the end
+        """
+        with HashcatPerformer.lock:
+            instance['followers'].discard(follower)
+            # The session can be run by a new instance already
+            if not instance['followers'] and HashcatPerformer.instances.get(instance['session_name']) is instance:
+                del HashcatPerformer.instances[instance['session_name']]
+
+    @staticmethod
+    def __get_found_instance_info(session: dict[str, Any]) -> dict[str, str | list[dict[str, str]]]:
         """
         Info about the found instance of hashcat.
         Check on existence by session name has been done before.
 
         Args:
-            certain_instance (dict): found instance of hashcat
+            session (dict[str, Any]): found session of hashcat in SessionRegistry
 
         Returns:
             dict:   {
                         'session_name': the session name,
-                        'state': 'found' / 'undefined',
+                        'state': 'found' / 'undefined' / 'queued',
                         'status_data': empty list if the state is 'undefined',
                                         otherwise list of values from
-                                        hashcat status output
+                                        hashcat status output, the last one before preemption if 'queued',
+                        'stages': the info about the stages of the attack plan, see __get_stages_info,
+                        'exit_code': the exit code of the last process, None if it's running or unknown,
+                        'end_time': the datetime of the exit of the last process, None if it's running or unknown
                     }
         """
-        # Performing '[s]tatus' option during the execution of the process
-        proc = certain_instance['subprocess']
-
-        # If the subprocess is running
-        if proc.poll() is None:
-            proc.stdin.write(b's\n')
-            proc.stdin.flush()
-            # Pause for waiting for log output file filling
-            time.sleep(0.05)
-
-        # Getting last rest of log output file
-        stdout = sup_f.read_file_to_lst(certain_instance['file_out_path'])[-40:]
-
-        # Searching a beginning of the part in stdout about performing status
-        start_i = None
-        for i, line in reversed(list(enumerate(stdout))):
-            if 'Session...' in line:
-                start_i = i
-                break
-
-        # The part containing info about performing status hasn't been found
-        if start_i is None:
-            return {'session_name': certain_instance['session_name'], 'state': 'undefined', 'status_data': []}
-
-        # Collecting information about performing status
-        status_data = []
-        for line in stdout[start_i:]:
-
-            # Checking the ending of the status block
-            if line == '':
-                break
-
-            splited = line.split('.:')
-            if len(splited) != 2:
-                logging.warning("line: %s hasn't been splitted to two part", repr(line))
-                continue
-            status_data.append({'title': splited[0].strip('. \t\n\r'), 'value': splited[1].strip(' \t\n\r')})
+        # The latest status is put into the registry by the reader of the instance stdout
+        status_data = session['data']['status_data']
+        instance_info = {
+            'session_name': session['session_name'],
+            'state': 'found',
+            'status_data': status_data,
+            'stages': HashcatPerformer.__get_stages_info(session),
+            # The exit is put into the registry by ProcessSupervisor
+            'exit_code': session['data'].get('exit_code'),
+            'end_time': session['data'].get('end_time'),
+        }
+
+        # The instance waits for the scheduler
+        if session['state'] == 'queued':
+            return {**instance_info, 'state': 'queued'}
+
+        # The status hasn't been printed yet
+        if not status_data:
+            return {**instance_info, 'state': 'undefined'}
+
+        return instance_info
+
+    @staticmethod
+    def __follow(
+        session_name: str,
+        instance: dict[str, Any],
+        offset: int,
+        is_running: Callable[[], bool],
+        members: list[str] | None = None,
+    ) -> None:
+        """
+        Start reading the status of the instance from its log into the registry
+
+        Args:
+            session_name (str): session name
+            instance (dict[str, Any]): the instance
+            offset (int): the offset of the log file to start reading from
+            is_running (Callable[[], bool]): check if the process is running
+            members (list[str] | None): the sessions bruted by the coalesced instance. Default: None
+        """
+        members = members or []
+
+        def on_status(status_data: list[dict[str, str]], log_offset: int) -> None:
+            SessionRegistry.update(session_name, data={'status_data': status_data, 'log_offset': log_offset})
+            for member in members:
+                SessionRegistry.update(member, data={'status_data': status_data})
+
+        def on_exit() -> None:
+            try:
+                if HashcatPerformer.__finish_stage(session_name):
+                    return
+                # The preempted session is queued already
+                SessionRegistry.update(session_name, state='exited', expected_state='running')
+                for member in members:
+                    HashcatPerformer.__finish_stage(member)
+                    SessionRegistry.update(member, state='exited', expected_state='running')
+            finally:
+                HashcatPerformer.__release_instance(instance, 'reader')
+
+        HashcatStatusReader.start(
+            instance, instance['file_out_path'], is_running, offset=offset, on_status=on_status, on_exit=on_exit
+        )
+
+    @staticmethod
+    def __route(session_name: str, group_data: dict[str, Any], is_running: Callable[[], bool]) -> None:
+        """
+        Start routing the output of the coalesced instance to the output files of its sessions
 
-        return {'session_name': certain_instance['session_name'], 'state': 'found', 'status_data': status_data}
+        Args:
+            session_name (str): session name of the coalesced instance
+            group_data (dict[str, Any]): the data of the coalesced instance in the registry
+            is_running (Callable[[], bool]): check if the process is running
+        """
+
+        def on_routed(route_offset: int) -> None:
+            SessionRegistry.update(session_name, data={'route_offset': route_offset})
+
+        HashcatOutputRouter.start(
+            group_data['output_file_path'],
+            HashcatOutputRouter.get_routes(group_data['routes']),
+            is_running,
+            offset=group_data.get('route_offset', 0),
+            on_routed=on_routed,
+        )
 
     @staticmethod
-    def __init_subprocess(session_name: str, process_args: list) -> None:
+    def __limit_process_args(process_args: list[str], limits: dict[str, Any]) -> list[str]:
+        """
+        Prefix the process args with the tools setting CPU affinity, nice and I/O priority of the process.
+        The tools exec the process, so the PID is the PID of hashcat. The limit of a missing tool is skipped.
+
+        Args:
+            process_args (list[str]): params to run subprocess
+            limits (dict[str, Any]): {'cpu_set': the cores or None, 'nice': the niceness,
+                                      'io_class': 'best-effort' / 'idle'}
+
+        Returns:
+            list[str]: the params to run subprocess with the limits
+        """
+        prefix = []
+        if limits.get('cpu_set'):
+            prefix.append(['taskset', '-c', ','.join(str(core) for core in limits['cpu_set'])])
+        if limits.get('nice'):
+            prefix.append(['nice', '-n', str(limits['nice'])])
+        if limits.get('io_class') == 'idle':
+            prefix.append(['ionice', '-c', '3'])
+
+        limited_args = []
+        for tool_args in prefix:
+            if shutil.which(tool_args[0]) is None:
+                logging.warning("%s isn't found, the process is run without its limit", tool_args[0])
+                continue
+            limited_args.extend(tool_args)
+        return limited_args + process_args
+
+    @staticmethod
+    def __init_subprocess(
+        session_name: str,
+        process_args: list[str],
+        is_restore: bool = False,
+        limits: dict[str, Any] | None = None,
+        group_data: dict[str, Any] | None = None,
+    ) -> None:
         """
         Init hashcat subprocess
 
         Args:
             session_name(str): session name
-            process_args (list): params to run subprocess
+            process_args (list[str]): params to run subprocess
+            is_restore (bool): the output log of the interrupted run is kept. Default: False
+            limits (dict[str, Any] | None): CPU affinity, nice and I/O priority of the process,
+                                            see __limit_process_args.
+                                            Default: no limits
+            group_data (dict[str, Any] | None): {'members': the sessions bruted by the process,
+                                                 'routes': {the hash list of the session:
+                                                            the output file of the session},
+                                                 'output_file_path': the output file of the process}
+                                                if the process is the coalesced instance. Default: None
 
         """
+        limits = limits or {}
+        process_args = HashcatPerformer.__limit_process_args(process_args, limits)
         logging.info('Running subprocess: %s', process_args)
 
         file_out_path = os.path.join(HashcatPerformer.logs_folder, f'hashcat_{session_name}.log')
         file_err_path = os.path.join(HashcatPerformer.logs_folder, f'hashcat_{session_name}_errors.log')
+        log_offset = os.path.getsize(file_out_path) if is_restore and os.path.isfile(file_out_path) else 0
 
-        # We should interact with the run process further and can't use with statement here
+        # We should interact with the run process further and can't use with statement here.
+        # Stdout is written to the log directly, so the process isn't bound to the API process
         # pylint: disable=R1732
         opened_subprocess = subprocess.Popen(
             process_args,
-            stdout=open(file_out_path, 'w', encoding='utf-8'),
-            stdin=subprocess.PIPE,
+            stdout=open(file_out_path, 'a' if is_restore else 'w', encoding='utf-8'),
+            stdin=subprocess.DEVNULL,
             stderr=open(file_err_path, 'w', encoding='utf-8'),
         )
 
-        HashcatPerformer.__set_instance(
+        instance = {
+            'session_name': session_name,
+            'subprocess': opened_subprocess,
+            'file_out_path': file_out_path,
+            'file_err_path': file_err_path,
+            'followers': {'supervisor', 'reader'},
+        }
+        SessionRegistry.add(
+            session_name,
+            'brute' if group_data is None else 'brute_group',
+            opened_subprocess.pid,
             {
-                'session_name': session_name,
-                'subprocess': opened_subprocess,
                 'file_out_path': file_out_path,
                 'file_err_path': file_err_path,
-            }
+                'status_data': [],
+                'log_offset': log_offset,
+                'cpu_set': limits.get('cpu_set'),
+                **(group_data or {}),
+            },
+        )
+        HashcatPerformer.__set_instance(instance)
+        ProcessSupervisor.watch(
+            session_name,
+            opened_subprocess.pid,
+            opened_subprocess,
+            on_exit=lambda _: HashcatPerformer.__release_instance(instance, 'supervisor'),
         )
 
+        def is_running() -> bool:
+            # The return code is set by ProcessSupervisor reaping the process
+            return opened_subprocess.returncode is None
+
+        members = []
+        if group_data is not None:
+            members = group_data['members']
+            # The sessions are running while the coalesced instance is running
+            for member in members:
+                SessionRegistry.add(member, 'brute', opened_subprocess.pid, {'group': session_name})
+            HashcatPerformer.__route(session_name, group_data, is_running)
+        HashcatPerformer.__follow(session_name, instance, log_offset, is_running, members)
+
         logging.info('Subprocess started with session_name: %s', session_name)
 
     @staticmethod
-    def set_working_folders(output_folder: str, restores_folder: str, logs_folder: str) -> None:
+    def __enqueue(session_name: str, data: dict[str, Any]) -> None:
+        """
+        Put the session into the queue of the scheduler
+
+        Args:
+            session_name (str): session name
+            data (dict[str, Any]): the keys to update in the session data
+        """
+        SessionRegistry.add(
+            session_name, 'brute', 0, {'status_data': [], 'log_offset': 0, **data, 'queued': time.time()}, 'queued'
+        )
+        logging.info('Hashcat session_name: %s is queued', session_name)
+
+    @staticmethod
+    def start_queued_instance(session: dict[str, Any], cpu_set: list[int] | None = None) -> None:
+        """
+        Start the process of the queued session. The session is restored if its restore file exists.
+
+        Args:
+            session (dict[str, Any]): the queued session, see SessionRegistry.get
+            cpu_set (list[int] | None): the cores given by the scheduler if the session hasn't got its own ones.
+                                        Default: all cores
+        """
+        session_name = session['session_name']
+        restore_file_path = os.path.join(HashcatPerformer.restores_folder, f'{session_name}.restore')
+        limits = session['data'].get('limits', {})
+        limits = {**limits, 'cpu_set': limits.get('cpu_set') or cpu_set}
+
+        if os.path.isfile(restore_file_path):
+            process_args = ['hashcat', '--restore', f'--restore-file-path={restore_file_path}']
+            HashcatPerformer.__init_subprocess(session_name, process_args, is_restore=True, limits=limits)
+        elif 'process_args' in session['data']:
+            HashcatPerformer.__init_subprocess(session_name, session['data']['process_args'], limits=limits)
+        else:
+            logging.error("Hashcat session_name: %s has neither the restore file nor the run params", session_name)
+            SessionRegistry.update(session_name, state='exited')
+
+    @staticmethod
+    def is_coalescible(session: dict[str, Any]) -> bool:
+        """
+        Check if the queued session can be bruted by one process with the other sessions
+
+        Args:
+            session (dict[str, Any]): the queued session, see SessionRegistry.get
+
+        Returns:
+            bool: True if the session is queued in coalescing mode and hasn't been started before
+        """
+        restore_file_path = os.path.join(HashcatPerformer.restores_folder, f'{session["session_name"]}.restore')
+        return 'coalesce' in session['data'] and not os.path.isfile(restore_file_path)
+
+    @staticmethod
+    def start_coalesced_instances(sessions: list[dict[str, Any]], cpu_set: list[int] | None = None) -> None:
+        """
+        Start one process of hashcat bruting the hashes of all the sessions.
+        The sessions must be coalescible and have the same coalesce key, see is_coalescible.
+        The bruted hashes are routed to the output files of the sessions.
+
+        Args:
+            sessions (list[dict[str, Any]]): the queued sessions, see SessionRegistry.get
+            cpu_set (list[int] | None): the cores given by the scheduler if the first session hasn't got its own ones.
+                                        Default: all cores
+        """
+        session_name = str(uuid.uuid4())
+        group_dir_path = os.path.join(HashcatPerformer.hash_lists_folder, session_name)
+        os.makedirs(group_dir_path, exist_ok=True)
+
+        routes: dict[str, str] = {}
+        nt_hashes: set[str] = set()
+        for session in sessions:
+            coalesce = session['data']['coalesce']
+            routes[coalesce['hash_file_path']] = coalesce['output_file_path']
+            with open(coalesce['hash_file_path'], 'r', encoding='utf-8') as file:
+                nt_hashes.update(line.strip() for line in file if line.strip())
+
+        hash_file_path = os.path.join(group_dir_path, 'hashes')
+        with open(hash_file_path, 'w', encoding='utf-8') as file:
+            file.writelines(nt_hash + '\n' for nt_hash in nt_hashes)
+
+        coalesce = sessions[0]['data']['coalesce']
+        output_file_path = os.path.join(group_dir_path, 'output.txt')
+        process_args = HashcatPerformer.__get_process_args(
+            session_name, hash_file_path, coalesce['stage'], output_file_path, coalesce['is_force']
+        )
+        limits = sessions[0]['data'].get('limits', {})
+        limits = {**limits, 'cpu_set': limits.get('cpu_set') or cpu_set}
+
+        members = [session['session_name'] for session in sessions]
+        logging.info('Coalescing hashcat sessions %s into session_name: %s', members, session_name)
+        HashcatPerformer.__init_subprocess(
+            session_name,
+            process_args,
+            limits=limits,
+            group_data={'members': members, 'routes': routes, 'output_file_path': output_file_path},
+        )
+
+    @staticmethod
+    def preempt_instance(session: dict[str, Any]) -> None:
+        """
+        Stop the process of the running session and put the session back into the queue.
+        Hashcat keeps the restore file when it's interrupted, so the session is continued from the last restore point.
+
+        Args:
+            session (dict[str, Any]): the running session, see SessionRegistry.get
+        """
+        session_name = session['session_name']
+        if not SessionRegistry.update(
+            session_name,
+            state='queued',
+            data={'preemptions': session['data'].get('preemptions', 0) + 1},
+            expected_state='running',
+        ):
+            return
+        logging.info('Preempting hashcat session_name: %s, pid: %s', session_name, session['pid'])
+        try:
+            os.kill(session['pid'], signal.SIGINT)
+        except ProcessLookupError:
+            pass
+
+    @staticmethod
+    def reattach_instances(is_auto_restore: bool = False) -> None:
+        """
+        Reattach to the processes of hashcat left running by the previous run of the API.
+        The status is read from the log offset saved in the registry.
+        The sessions with the finished processes are marked as exited and optionally restored.
+
+        Args:
+            is_auto_restore (bool): re-run the sessions with the killed processes if their restore files exist.
+                                    Default: False
+        """
+        for session in SessionRegistry.get_all('brute_group') + SessionRegistry.get_all('brute'):
+            session_name = session['session_name']
+            if session['state'] != 'running' or session_name in HashcatPerformer.instances:
+                continue
+            # The session bruted by the coalesced instance is reattached with it
+            if 'group' in session['data']:
+                continue
+            # The session is followed by another API worker
+            if not SessionRegistry.take_over(session_name):
+                continue
+
+            if SessionRegistry.is_running(session):
+                logging.info('Reattaching to hashcat session_name: %s, pid: %s', session_name, session['pid'])
+                instance = {
+                    'session_name': session_name,
+                    'subprocess': None,
+                    'file_out_path': session['data']['file_out_path'],
+                    'file_err_path': session['data']['file_err_path'],
+                    'status_data': session['data']['status_data'],
+                    'followers': {'supervisor', 'reader'},
+                }
+                HashcatPerformer.__set_instance(instance)
+
+                # The defaults bind the instance and the process of this session
+                def on_exit(_: int | None, instance: dict[str, Any] = instance) -> None:
+                    HashcatPerformer.__release_instance(instance, 'supervisor')
+
+                def is_running(pid: int = session['pid']) -> bool:
+                    return ProcessSupervisor.is_watched(pid)
+
+                ProcessSupervisor.watch(session_name, session['pid'], on_exit=on_exit)
+                if session['kind'] == 'brute_group':
+                    HashcatPerformer.__route(session_name, session['data'], is_running)
+                HashcatPerformer.__follow(
+                    session_name,
+                    instance,
+                    session['data'].get('log_offset', 0),
+                    is_running,
+                    session['data'].get('members'),
+                )
+                continue
+
+            logging.info('The process of hashcat session_name: %s is gone', session_name)
+            if HashcatPerformer.__finish_stage(session_name):
+                continue
+            SessionRegistry.update(session_name, state='exited', expected_state='running')
+            for member in session['data'].get('members', []):
+                HashcatPerformer.__finish_stage(member)
+                SessionRegistry.update(member, state='exited', expected_state='running')
+            # Hashcat removes the restore file when the session is finished.
+            # The coalesced instance isn't restored, the output of its restored process wouldn't be routed
+            if (
+                is_auto_restore
+                and session['kind'] == 'brute'
+                and HashcatPerformer.re_run_instance(session_name)['status'] == 'success'
+            ):
+                logging.info('Hashcat session_name: %s is restored', session_name)
+
+    @staticmethod
+    def set_working_folders(output_folder: str, restores_folder: str, logs_folder: str, hash_lists_folder: str) -> None:
         """
         Set working folders for class
 
@@ -145,13 +502,15 @@ class HashcatPerformer:
             output_folder (str): path to folder contained output files
             restores_folder (str): path to folder contained restores files
             logs_folder (str): path to folder contained logs files
+            hash_lists_folder (str): path to folder contained preprocessed hash lists
         """
         HashcatPerformer.output_folder = output_folder
         HashcatPerformer.restores_folder = restores_folder
         HashcatPerformer.logs_folder = logs_folder
+        HashcatPerformer.hash_lists_folder = hash_lists_folder
 
     @staticmethod
-    def get_instance_info(session_name: str) -> dict:
+    def get_instance_info(session_name: str) -> dict[str, Any]:
         """
         Info about run instance of hashcat
 
@@ -159,7 +518,7 @@ class HashcatPerformer:
             session_name (str): session_name of hashcat
 
         Returns:
-            dict:   {
+            dict[str, Any]: {
                         'session_name': the session name,
                         'state': 'not_found' / 'found' / 'undefined',
                         'status_data':  empty list if the state is 'not_found'
@@ -167,46 +526,148 @@ class HashcatPerformer:
                                         values from hashcat status output
                         }
         """
-        # Searching the instance in running instances
-        certain_instance = {}
-        for instance in HashcatPerformer.instances:
-            if instance['session_name'] == session_name:
-                certain_instance = instance
-                break
+        session = SessionRegistry.get(session_name, 'brute')
 
         # The instance hasn't been found
-        if not certain_instance:
-            return {'session_name': session_name, 'state': 'not_found', 'status_data': []}
+        if session is None:
+            return {
+                'session_name': session_name,
+                'state': 'not_found',
+                'status_data': [],
+                'stages': [],
+                'exit_code': None,
+                'end_time': None,
+            }
+
+        return HashcatPerformer.__get_found_instance_info(session)
+
+    @staticmethod
+    def get_instance_status(session_name: str) -> dict[str, Any]:
+        """
+        Get the status of the process of hashcat instance
+
+        Args:
+            session_name (str): session_name of hashcat
+
+        Returns:
+            dict[str, Any]:
+                status: not_found/queued/running/finished/interrupted/error
+                err_desc: error description if status = 'error'
+                output_file_path: path to file with bruted hashes
+                exit_code: the exit code of the last process, None if it's running or unknown
+                end_time: the datetime of the exit of the last process, None if it's running or unknown
+        """
+        session = SessionRegistry.get(session_name, 'brute')
+        if session is None:
+            return {'status': 'not_found', 'err_desc': '', 'output_file_path': '', 'exit_code': None, 'end_time': None}
+
+        data = session['data']
+        # The exit of the coalesced instance is put into its own session
+        process_data = data
+        if 'group' in data and (group := SessionRegistry.get(data['group'], 'brute_group')) is not None:
+            process_data = group['data']
+        output_file_path = data.get('output_file_path', '')
+        exit_code = process_data.get('exit_code')
+        exit_info = {'exit_code': exit_code, 'end_time': process_data.get('end_time')}
+        if session['state'] in ('queued', 'running'):
+            return {'status': session['state'], 'err_desc': '', 'output_file_path': output_file_path, **exit_info}
+
+        # Every hash of the session has been resolved without running hashcat
+        if data.get('stages') and data['stages'][0]['hashes_count'] == 0:
+            return {'status': 'finished', 'err_desc': '', 'output_file_path': output_file_path, **exit_info}
+
+        # Hashcat keeps the restore file when it's interrupted
+        restore_file_path = os.path.join(HashcatPerformer.restores_folder, f'{data.get("group", session_name)}.restore')
+        if os.path.isfile(restore_file_path):
+            return {'status': 'interrupted', 'err_desc': '', 'output_file_path': output_file_path, **exit_info}
+
+        # Hashcat exits with -1 on an error and prints no status if it fails to start
+        if exit_code in HashcatPerformer.ERROR_EXIT_CODES or not data['status_data']:
+            return {
+                'status': 'error',
+                'err_desc': f'Check file {process_data.get("file_err_path", "")} for additional info',
+                'output_file_path': output_file_path,
+                **exit_info,
+            }
+
+        return {'status': 'finished', 'err_desc': '', 'output_file_path': output_file_path, **exit_info}
+
+    @staticmethod
+    def is_instance_running(session_name: str) -> bool:
+        """
+        Check if the process of the instance is still running
+
+        Args:
+            session_name (str): session_name of hashcat
+
+        Returns:
+            bool: True if the process is running
+        """
+        instance = HashcatPerformer.instances.get(session_name)
+        if instance is not None and instance['subprocess'] is not None:
+            return instance['subprocess'].returncode is None
+        session = SessionRegistry.get(session_name, 'brute')
+        return session is not None and SessionRegistry.is_running(session)
 
-        return HashcatPerformer.__get_found_instance_info(certain_instance)
+    @staticmethod
+    def is_instance_queued(session_name: str) -> bool:
+        """
+        Check if the instance waits for the scheduler
+
+        Args:
+            session_name (str): session_name of hashcat
+
+        Returns:
+            bool: True if the instance is queued
+        """
+        session = SessionRegistry.get(session_name, 'brute')
+        return session is not None and session['state'] == 'queued'
 
     @staticmethod
-    def get_all_instances_info() -> list[dict[str, str | list[dict[str, str]]]]:
+    def get_all_instances_info(
+        state: str | None = None, offset: int = 0, limit: int | None = None
+    ) -> list[dict[str, str | list[dict[str, str]]]]:
         """
-        Get info about all run instances of hashcat
+        Get info about run instances of hashcat.
+        The info is taken from the status put into the registry by the readers, the processes aren't touched.
+
+        Args:
+            state (str | None): return only the instances in the state 'found' / 'undefined' / 'queued'. Default: all
+            offset (int): the number of instances to skip. Default: 0
+            limit (int | None): the max number of instances to return. Default: all
 
         Returns:
-            list[dict[str, str | list[dict[str, str]]]]: Info about all run instances
+            list[dict[str, str | list[dict[str, str]]]]: Info about run instances
         """
 
-        # Gathering info about all run instances of hashcat
-        instances_info = []
-        for instance in HashcatPerformer.instances:
-            instances_info.append(HashcatPerformer.__get_found_instance_info(instance))
+        # The state of the info comes from the state of the process and the printed status,
+        # see __get_found_instance_info
+        filters: dict[str | None, dict[str, Any]] = {
+            None: {},
+            'queued': {'states': ('queued',)},
+            'found': {'states': ('running', 'exited'), 'has_status_data': True},
+            'undefined': {'states': ('running', 'exited'), 'has_status_data': False},
+        }
+        if state not in filters:
+            raise ValueError(f'Unknown state {state} of the instances')
 
-        return instances_info
+        # Gathering info about run instances of hashcat of all API workers
+        return [
+            HashcatPerformer.__get_found_instance_info(session)
+            for session in SessionRegistry.get_all('brute', offset=offset, limit=limit, **filters[state])
+        ]
 
     @staticmethod
     def re_run_instance(session_name: str) -> dict[str, str]:
         """
-        Re-run instance of hashcat
+        Re-run instance of hashcat. The instance is queued and restored by the scheduler.
 
         Args:
             session_name (str): name for hascat session
 
         Returns:
             dict: {
-                'status': 'success' / 'not_found',
+                'status': 'success' / 'not_found' / 'running',
                 'session_name': session name
             }
         """
@@ -216,118 +677,249 @@ class HashcatPerformer:
         # Checking if the restore file for the session exists
         if not os.path.isfile(restore_file_path):
             return {'status': 'not_found', 'session_name': session_name}
-        # This restore file exists
-        process_args = ['hashcat', '--restore', f'--restore-file-path={restore_file_path}']
 
-        HashcatPerformer.__init_subprocess(session_name, process_args)
+        # The second process mustn't use the same restore file
+        if HashcatPerformer.is_instance_running(session_name):
+            return {'status': 'running', 'session_name': session_name}
+
+        # This restore file exists, the scheduler restores the session
+        if not HashcatPerformer.is_instance_queued(session_name):
+            HashcatPerformer.__enqueue(session_name, {})
 
         return {'status': 'success', 'session_name': session_name}
 
     @staticmethod
-    def run_instance(
-        hash_file_path: str, dictionary_file_path: str, rules_file_path: str, is_force: bool = True
-    ) -> str:
+    def __get_process_args(
+        session_name: str, hash_file_path: str, stage: dict[str, Any], output_file_path: str, is_force: bool
+    ) -> list[str]:
         """
-        Run instance of hashcat
+        Get the params to run hashcat. The workload options found by the tuning of the host are applied.
 
         Args:
+            session_name (str): session name
             hash_file_path (str): path to file contained hashes
-            dictionary_file_path (str): path to file contained dictionary
-            rules_file_path (str): path to file contained rules
-            is_force (bool): run hascat with --force flag. Default: True
-
+            stage (dict[str, Any]): the stage of the attack plan, see AttackPlan
+            output_file_path (str): path to file for bruted hashes
+            is_force (bool): run hascat with --force flag
 
         Returns:
-            str: name for hascat session
-
-        Raises:
-            NotAllowedFileName: hash filename contains not allowed filename
+            list[str]: params to run subprocess
         """
-
-        # Generating a unique session name
-        session_name = str(uuid.uuid4())
-
-        # Implementing run command
         restore_file_path = os.path.join(HashcatPerformer.restores_folder, f'{session_name}.restore')
-
-        # This restore file doesn't exist
-        hash_file_name = os.path.basename(hash_file_path)
-
-        # Checking restrictions for names
-
-        if '___' in hash_file_name:
-            raise NotAllowedFileName(f"Name {hash_file_name} of file with hashes can't contained '___'")
-
-        process_args = [
+        attack_args, attack_options = AttackPlan.get_attack_args(stage)
+        return [
             'hashcat',
             '-m',
             '1000',
+            *attack_options,
             hash_file_path,
-            dictionary_file_path,
-            '-r',
-            rules_file_path,
+            *attack_args,
             f'--session={session_name}',
             '--restore-file-path=' + restore_file_path,
             '-o',
-            os.path.join(HashcatPerformer.output_folder, f'{hash_file_name}___{session_name}.txt'),
+            output_file_path,
             '--potfile-disable',
+            '--status',
+            '--status-json',
+            f'--status-timer={HashcatPerformer.status_timer}',
+            *BenchmarkService.get_tuned_options(),
             '--force' if is_force else '',
         ]
-        HashcatPerformer.__init_subprocess(session_name, process_args)
-        return session_name
 
     @staticmethod
-    def run_benchmark(is_force: bool = True) -> dict[str, str | list]:
+    def __finish_stage(session_name: str) -> bool:
         """
-        Run hashcat -b -m 1000
+        Queue the next stage of the attack plan when the stage of the session is finished.
+        The next stage gets the hashes not bruted so far.
+        The session bruted by the coalesced instance has the only stage, it's finished with the instance.
 
         Args:
-            is_force (bool): run hascat with --force flag. Default: True
+            session_name (str): session name
 
         Returns:
-            dict[str, str]: {
-                'status': 'success' / 'error'
-                'started': time of starting benchmark
-                'stopped': time of ending benchmark
-                'speeds': list of measures of speeds
-            }
+            bool: True if the next stage is queued
         """
+        session = SessionRegistry.get(session_name, 'brute')
+        if session is None or session['state'] != 'running' or 'stages' not in session['data']:
+            return False
+        data = session['data']
+        # Hashcat keeps the restore file when the stage is interrupted and prints no status if it fails to start
+        restore_file_path = os.path.join(HashcatPerformer.restores_folder, f'{data.get("group", session_name)}.restore')
+        if os.path.isfile(restore_file_path) or not data['status_data']:
+            return False
+
+        stages = data['stages']
+        stage_i = data['stage']
+        stages[stage_i].update(AttackPlan.get_counters(data['status_data']), state='finished')
+        if stage_i + 1 == len(stages):
+            SessionRegistry.update(session_name, data={'stages': stages})
+            return False
+
+        hash_file_path = os.path.join(
+            HashcatPerformer.hash_lists_folder, session_name, str(stage_i + 2), os.path.basename(data['hash_file_path'])
+        )
+        hashes_count = AttackPlan.shrink_hash_list(data['hash_file_path'], data['output_file_path'], hash_file_path)
+        if hashes_count == 0:
+            for stage in stages[stage_i + 1 :]:
+                stage['state'] = 'skipped'
+            SessionRegistry.update(session_name, data={'stages': stages})
+            return False
+
+        stages[stage_i + 1]['hashes_count'] = hashes_count
+        logging.info(
+            'Hashcat session_name: %s goes to the stage %d with %d hashes', session_name, stage_i + 2, hashes_count
+        )
+        return SessionRegistry.update(
+            session_name,
+            state='queued',
+            data={
+                'stage': stage_i + 1,
+                'stages': stages,
+                'hash_file_path': hash_file_path,
+                'process_args': HashcatPerformer.__get_process_args(
+                    session_name, hash_file_path, stages[stage_i + 1], data['output_file_path'], data['is_force']
+                ),
+                'status_data': [],
+                'queued': time.time(),
+            },
+            expected_state='running',
+        )
 
-        process_args = ['hashcat', '-b', '-m', '1000', '--force' if is_force else '']
+    @staticmethod
+    def __get_stages_info(session: dict[str, Any]) -> list[dict[str, Any]]:
+        """
+        Get the info about the stages of the attack plan of the session
 
-        # Running a benchmark process
-        result = subprocess.run(process_args, stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True)
+        Args:
+            session (dict[str, Any]): found session of hashcat in SessionRegistry
 
-        # Getting output of the process
-        out = result.stdout.decode('utf-8')
-        err = result.stderr.decode('utf-8')
+        Returns:
+            list[dict[str, Any]]: [{'attack_mode', 'dictionary_file_path', 'rules_file_path', 'mask',
+                          'state': 'pending' / 'queued' / 'running' / 'interrupted' / 'finished' / 'skipped',
+                          'hashes_count', 'cracked_count', 'progress'}, ...]
+        """
+        stages = []
+        for stage_i, stage in enumerate(session['data'].get('stages', [])):
+            stage = dict(stage)
+            if stage_i == session['data']['stage'] and stage['state'] == 'pending':
+                stage['state'] = {'running': 'running', 'queued': 'queued'}.get(session['state'], 'interrupted')
+                stage.update(AttackPlan.get_counters(session['data']['status_data']))
+            stages.append(stage)
+        return stages
 
-        logging.info('out: %s', out)
+    @staticmethod
+    def run_instance(
+        hash_file_path: str,
+        dictionary_file_path: str,
+        rules_file_path: str,
+        is_force: bool = True,
+        exclude_machine_accounts: bool = True,
+        priority: int = 0,
+        limits: dict[str, Any] | None = None,
+        coalesce: bool = False,
+        stages: list[dict[str, Any]] | None = None,
+        callback_url: str | None = None,
+    ) -> str:
+        """
+        Queue instance of hashcat, the scheduler starts it when the concurrency budget allows.
+        Hashcat gets the unique hashes worth bruting, the hashes resolved without bruting
+        are written into the output file before. The session is finished at once if there is nothing to brute.
+        The stages of the attack plan are queued one after another with the hashes not bruted by the previous ones.
 
-        # Getting started and stopped times of the benchmark
-        started_s = re.search(r'Started: (.+)', out, re.MULTILINE)
-        stopped_s = re.search(r'Stopped: (.+)', out, re.MULTILINE)
+        Args:
+            hash_file_path (str): path to file contained hashes
+            dictionary_file_path (str): path to file contained dictionary, used if stages aren't set
+            rules_file_path (str): path to file contained rules, used if stages aren't set
+            is_force (bool): run hascat with --force flag. Default: True
+            exclude_machine_accounts (bool): don't brute the hashes used by machine accounts only. Default: True
+            priority (int): the session with higher priority is started first and preempts the lower ones.
+                            Default: 0
+            limits (dict[str, Any] | None): {'cpu_set': the cores or None to take them from the scheduler,
+                                             'nice': the niceness, 'io_class': 'best-effort' / 'idle'}.
+                                            Default: no limits
+            coalesce (bool): brute in one process with the other queued sessions using the same dictionary and rules.
+                             The session with several stages isn't coalesced. Default: False
+            stages (list[dict[str, Any]] | None): the stages of the attack plan, see AttackPlan.
+                                                 Default: one dictionary stage with dictionary_file_path
+                                                 and rules_file_path
+            callback_url (str | None): the URL notified when the session is finished or failed, see WebhookNotifier.
+                                       Default: None
+
+        Returns:
+            str: name for hascat session
 
-        started = started_s.group(1) if started_s is not None else ''
-        stopped = stopped_s.group(1) if stopped_s is not None else ''
+        Raises:
+            NotAllowedFileName: hash filename contains not allowed filename
+        """
 
-        # If an error has occurred during the benchmark
-        if err:
-            logging.error('err: %s', err)
+        # Generating a unique session name
+        session_name = str(uuid.uuid4())
 
-            return {
-                'status': 'error',
-                'started': started,
-                'stopped': stopped,
-                'speeds': [],
-            }
+        hash_file_name = os.path.basename(hash_file_path)
+
+        # Checking restrictions for names
+
+        if '___' in hash_file_name:
+            raise NotAllowedFileName(f"Name {hash_file_name} of file with hashes can't contained '___'")
 
-        # Getting information about speeds
-        speeds = re.findall(r'(?<=\.\.:)\s+(.+)', out)
+        # The hashes bruted by the other sessions so far are resolved by the store
+        CrackedHashStore.sync_output_folder(HashcatPerformer.output_folder)
+        preprocessed = HashListPreprocessor.preprocess(
+            hash_file_path, os.path.join(HashcatPerformer.hash_lists_folder, session_name), exclude_machine_accounts
+        )
 
-        return {
-            'status': 'success',
-            'started': started,
-            'stopped': stopped,
-            'speeds': speeds,
+        # Hashcat appends the bruted hashes to the output file
+        output_file_path = os.path.join(HashcatPerformer.output_folder, f'{hash_file_name}___{session_name}.txt')
+        is_resolved = preprocessed['stats']['to_brute'] == 0
+        if preprocessed['resolved'] or is_resolved:
+            with open(output_file_path, 'w', encoding='utf-8') as file:
+                for nt_hash, password in preprocessed['resolved'].items():
+                    file.write(f'{nt_hash}:{password}\n')
+
+        if not stages:
+            stages = [
+                {
+                    'attack_mode': 'dictionary',
+                    'dictionary_file_path': dictionary_file_path,
+                    'rules_file_path': rules_file_path,
+                    'mask': None,
+                }
+            ]
+        stages = [
+            {**stage, 'state': 'pending', 'hashes_count': 0, 'cracked_count': 0, 'progress': ''} for stage in stages
+        ]
+        stages[0]['hashes_count'] = preprocessed['stats']['to_brute']
+
+        data = {
+            'priority': priority,
+            'limits': limits or {},
+            'stages': stages,
+            'stage': 0,
+            'hash_file_path': preprocessed['hash_file_path'],
+            'output_file_path': output_file_path,
+            'is_force': is_force,
+            'callback_url': callback_url,
         }
+
+        # Every hash is resolved without bruting, hashcat would fail with no hashes loaded
+        if is_resolved:
+            stages[0]['state'] = 'finished'
+            for stage in stages[1:]:
+                stage['state'] = 'skipped'
+            SessionRegistry.add(session_name, 'brute', 0, {'status_data': [], 'log_offset': 0, **data}, 'exited')
+            logging.info('Hashcat session_name: %s has no hashes to brute, it is finished', session_name)
+            return session_name
+
+        data['process_args'] = HashcatPerformer.__get_process_args(
+            session_name, preprocessed['hash_file_path'], stages[0], output_file_path, is_force
+        )
+        if coalesce and len(stages) == 1:
+            data['coalesce'] = {
+                'key': f'{AttackPlan.get_key(stages[0])}|{is_force}',
+                'hash_file_path': preprocessed['hash_file_path'],
+                'output_file_path': output_file_path,
+                'stage': stages[0],
+                'is_force': is_force,
+            }
+        HashcatPerformer.__enqueue(session_name, data)
+        return session_name
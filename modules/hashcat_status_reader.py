@@ -0,0 +1,228 @@
+"""
+Module to read the status of hashcat instances in background
+
+Author:
+    Konstantin S. (https://github.com/ST1LLY)
+"""
+import json
+import logging
+import threading
+import time
+from typing import Any, Callable, Optional
+
+
+class HashcatStatusReader:
+    """
+    Class to read stdout of hashcat started with --status --status-json --status-timer.
+    The reader thread follows the log file stdout is written to and keeps the latest status in the instance,
+    so getting the status doesn't touch the process or the log. The process doesn't depend on the reader,
+    so it survives the restart of the API and the reading is continued from the saved offset.
+    """
+
+    # Pause between the checks of the log file, in seconds
+    poll_interval: float = 0.5
+
+    # The names of hashcat status codes, see status.c of hashcat
+    STATUS_NAMES = {
+        0: 'Initializing',
+        1: 'Autotuning',
+        2: 'Selftest',
+        3: 'Running',
+        4: 'Paused',
+        5: 'Exhausted',
+        6: 'Cracked',
+        7: 'Aborted',
+        8: 'Quit',
+        9: 'Bypass',
+        10: 'Aborted (Checkpoint)',
+        11: 'Aborted (Runtime)',
+        12: 'Running (Checkpoint Quit requested)',
+        13: 'Error',
+        14: 'Aborted (Finish)',
+        15: 'Autodetect',
+    }
+
+    def __init__(self) -> None:
+        pass
+
+    @staticmethod
+    def __percent(done: int, total: int) -> str:
+        """
+        Format the share as hashcat does
+
+        Args:
+            done (int): the done part
+            total (int): the total
+
+        Returns:
+            str: done/total (xx.xx%)
+        """
+        return f'{done}/{total} ({done * 100 / total if total else 0:.2f}%)'
+
+    @staticmethod
+    def __format_json_status(status: dict[str, Any]) -> list[dict[str, str]]:
+        """
+        Turn the JSON status into the fields of hashcat text status
+
+        Args:
+            status (dict[str, Any]): the status printed by --status-json
+
+        Returns:
+            list[dict[str, str]]: [{'title': the field name, 'value': the field value}, ...]
+        """
+        status_code = status.get('status')
+        status_data = [
+            {'title': 'Session', 'value': str(status.get('session', ''))},
+            {
+                'title': 'Status',
+                'value': (
+                    HashcatStatusReader.STATUS_NAMES.get(status_code, str(status_code))
+                    if isinstance(status_code, int)
+                    else str(status_code or '')
+                ),
+            },
+            {'title': 'Hash.Target', 'value': str(status.get('target', ''))},
+        ]
+        if status.get('time_start'):
+            status_data.append({'title': 'Time.Started', 'value': time.ctime(status['time_start'])})
+        if status.get('estimated_stop'):
+            status_data.append({'title': 'Time.Estimated', 'value': time.ctime(status['estimated_stop'])})
+
+        guess = status.get('guess', {})
+        if guess.get('guess_base'):
+            status_data.append({'title': 'Guess.Base', 'value': f'File ({guess["guess_base"]})'})
+        if guess.get('guess_mod'):
+            status_data.append({'title': 'Guess.Mod', 'value': f'Rules ({guess["guess_mod"]})'})
+
+        for device in status.get('devices', []):
+            status_data.append(
+                {'title': f'Speed.#{device.get("device_id", "")}', 'value': f'{device.get("speed", 0)} H/s'}
+            )
+
+        if 'recovered_hashes' in status:
+            status_data.append(
+                {'title': 'Recovered', 'value': HashcatStatusReader.__percent(*status['recovered_hashes']) + ' Digests'}
+            )
+        if 'progress' in status:
+            status_data.append({'title': 'Progress', 'value': HashcatStatusReader.__percent(*status['progress'])})
+        if 'rejected' in status:
+            status_data.append({'title': 'Rejected', 'value': str(status['rejected'])})
+        if 'restore_point' in status:
+            status_data.append({'title': 'Restore.Point', 'value': str(status['restore_point'])})
+        return status_data
+
+    @staticmethod
+    def __parse_line(line: str, reader: dict[str, Any]) -> list[dict[str, str]] | None:
+        """
+        Parse the line of stdout
+
+        Args:
+            line (str): the line without the line break
+            reader (dict[str, Any]): the state of the reader, 'text_block' is the text status block being read
+
+        Returns:
+            list[dict[str, str]] | None: the status if the line completes one
+        """
+        line = line.strip()
+        if line.startswith('{'):
+            try:
+                return HashcatStatusReader.__format_json_status(json.loads(line))
+            except (ValueError, TypeError):
+                logging.warning('line: %s is not the status of hashcat', repr(line))
+                return None
+
+        # The text status block printed by the sessions started without --status-json
+        if line.startswith('Session...'):
+            reader['text_block'] = []
+        if reader['text_block'] is None:
+            return None
+        # The ending of the status block
+        if not line:
+            status_data = reader['text_block']
+            reader['text_block'] = None
+            return status_data
+        splited = line.split('.:')
+        if len(splited) != 2:
+            logging.warning("line: %s hasn't been splitted to two part", repr(line))
+            return None
+        reader['text_block'].append({'title': splited[0].strip('. \t\n\r'), 'value': splited[1].strip(' \t\n\r')})
+        return None
+
+    @staticmethod
+    def __perform(
+        instance: dict[str, Any],
+        log_file_path: str,
+        offset: int,
+        is_running: Callable[[], bool],
+        on_status: Optional[Callable[[list[dict[str, str]], int], None]],
+        on_exit: Optional[Callable[[], None]],
+    ) -> None:
+        """
+        The loop of the reader thread, it is finished when the process is finished and its log is read
+
+        Args:
+            instance (dict[str, Any]): the hashcat instance
+            log_file_path (str): path to the log file of stdout
+            offset (int): the offset of the log file to start reading from
+            is_running (Callable[[], bool]): check if the process is running
+            on_status (Optional[Callable[[list[dict[str, str]], int], None]]): called with every new status
+                                                                               and the log offset after it
+            on_exit (Optional[Callable[[], None]]): called when the process is finished
+        """
+        reader: dict[str, Any] = {'text_block': None}
+        rest = b''
+        with open(log_file_path, 'rb') as log_file:
+            log_file.seek(offset)
+            while True:
+                # The process state is taken before reading, so no line is left behind when it's finished
+                is_process_running = is_running()
+                content = log_file.read()
+                if not content:
+                    if not is_process_running:
+                        break
+                    time.sleep(HashcatStatusReader.poll_interval)
+                    continue
+
+                lines = (rest + content).split(b'\n')
+                # The last line can still be written by hashcat
+                rest = lines.pop()
+                for line in lines:
+                    offset += len(line) + 1
+                    status_data = HashcatStatusReader.__parse_line(line.decode('utf-8', errors='replace'), reader)
+                    if status_data is None:
+                        continue
+                    instance['status_data'] = status_data
+                    if on_status is not None:
+                        on_status(status_data, offset)
+
+        if on_exit is not None:
+            on_exit()
+
+    @staticmethod
+    def start(
+        instance: dict[str, Any],
+        log_file_path: str,
+        is_running: Callable[[], bool],
+        offset: int = 0,
+        on_status: Optional[Callable[[list[dict[str, str]], int], None]] = None,
+        on_exit: Optional[Callable[[], None]] = None,
+    ) -> None:
+        """
+        Start the reader thread for the instance. The latest status is kept in instance['status_data'].
+
+        Args:
+            instance (dict[str, Any]): the hashcat instance
+            log_file_path (str): path to the log file stdout of hashcat is written to
+            is_running (Callable[[], bool]): check if the process is running
+            offset (int): the offset of the log file to start reading from. Default: 0
+            on_status (Optional[Callable[[list[dict[str, str]], int], None]]): called with every new status
+                                                                               and the log offset after it.
+                                                                               Default: None
+            on_exit (Optional[Callable[[], None]]): called when the process is finished. Default: None
+        """
+        instance.setdefault('status_data', [])
+        threading.Thread(
+            target=HashcatStatusReader.__perform,
+            args=(instance, log_file_path, offset, is_running, on_status, on_exit),
+            daemon=True,
+        ).start()
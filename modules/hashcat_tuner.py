@@ -0,0 +1,147 @@
+"""
+Module to tune the workload params of hashcat for the host
+
+Author:
+    Konstantin S. (https://github.com/ST1LLY)
+"""
+import json
+import logging
+import os
+import subprocess
+import tempfile
+from typing import Any
+
+
+class HashcatTuner:
+    """
+    Class to find the workload params of hashcat giving the best speed of NTLM bruting on the host.
+    Every candidate is run for a short time against a list of random NT-hashes,
+    the speed is taken from the status of hashcat. The candidates are tried in rounds,
+    every round varies one group of params keeping the best ones of the previous rounds.
+    """
+
+    # The number of hashes in the list, about the number of the accounts of a domain
+    hashes_count: int = 1000
+
+    # The mask bruted by the candidates, it's long enough not to be exhausted while measuring
+    mask: str = '?a?a?a?a?a?a?a?a'
+
+    # The rounds of the candidates, a candidate is the list of hashcat options
+    ROUNDS = [
+        # The workload profile
+        [['-w', '3'], ['-w', '4']],
+        # The kernel accel and loops, hashcat tunes them itself by default
+        [['-n', '64', '-u', '256'], ['-n', '256', '-u', '512'], ['-n', '1024', '-u', '1024']],
+        # The kernel threads
+        [['-T', '64'], ['-T', '256'], ['-T', '1024']],
+    ]
+
+    def __init__(self) -> None:
+        pass
+
+    @staticmethod
+    def __measure(hash_file_path: str, options: list[str], runtime: int, is_force: bool) -> float:
+        """
+        Run hashcat with the options and get its speed
+
+        Args:
+            hash_file_path (str): path to file contained hashes
+            options (list[str]): the options of hashcat
+            runtime (int): the time of the run, in seconds
+            is_force (bool): run hascat with --force flag
+
+        Returns:
+            float: hashes per second of all devices, 0 if hashcat has failed with the options
+        """
+        process_args = [
+            'hashcat',
+            '-m',
+            '1000',
+            '-a',
+            '3',
+            hash_file_path,
+            HashcatTuner.mask,
+            *options,
+            f'--runtime={runtime}',
+            '-o',
+            os.devnull,
+            '--potfile-disable',
+            '--restore-disable',
+            '--logfile-disable',
+            '--status',
+            '--status-json',
+            '--status-timer=1',
+            '--force' if is_force else '',
+        ]
+        logging.info('Running tuning candidate: %s', process_args)
+        result = subprocess.run(process_args, stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=False)
+
+        speeds = []
+        for line in result.stdout.decode('utf-8').splitlines():
+            if not line.startswith('{'):
+                continue
+            try:
+                status = json.loads(line)
+            except ValueError:
+                continue
+            speeds.append(sum(device.get('speed', 0) for device in status.get('devices', [])))
+        # The first status is printed while hashcat is warming up
+        speeds = speeds[1:] or speeds
+        return sum(speeds) / len(speeds) if speeds else 0.0
+
+    @staticmethod
+    def tune(runtime: int = 10, is_optimized_included: bool = False, is_force: bool = True) -> dict[str, Any]:
+        """
+        Find the best options of hashcat
+
+        Args:
+            runtime (int): the time of the run of every candidate, in seconds. Default: 10
+            is_optimized_included (bool): try the optimized kernels, they limit the password length to 27.
+                                          Default: False
+            is_force (bool): run hascat with --force flag. Default: True
+
+        Returns:
+            dict[str, Any]: {
+                        'options': the best options, empty if the default ones are the best,
+                        'speed': hashes per second with the best options,
+                        'default_speed': hashes per second with the default options,
+                        'candidates': [{'options', 'speed'}, ...]
+                    }
+
+        Raises:
+            RuntimeError: hashcat has failed with the default options
+        """
+        rounds = HashcatTuner.ROUNDS
+        if is_optimized_included:
+            rounds = [[['-O']], *rounds]
+
+        with tempfile.TemporaryDirectory() as dir_path:
+            hash_file_path = os.path.join(dir_path, 'hashes.txt')
+            with open(hash_file_path, 'w', encoding='utf-8') as file:
+                for _ in range(HashcatTuner.hashes_count):
+                    file.write(os.urandom(16).hex() + '\n')
+
+            default_speed = HashcatTuner.__measure(hash_file_path, [], runtime, is_force)
+            if not default_speed:
+                raise RuntimeError('Hashcat has failed with the default options')
+            candidates: list[dict[str, Any]] = [{'options': [], 'speed': default_speed}]
+            best = candidates[0]
+            for options_round in rounds:
+                round_best = best
+                for options in options_round:
+                    candidate_options = [*best['options'], *options]
+                    speed = HashcatTuner.__measure(hash_file_path, candidate_options, runtime, is_force)
+                    candidates.append({'options': candidate_options, 'speed': speed})
+                    if speed > round_best['speed']:
+                        round_best = candidates[-1]
+                best = round_best
+
+        logging.info(
+            'The best options of hashcat: %s, %.0f H/s, default %.0f H/s', best['options'], best['speed'], default_speed
+        )
+        return {
+            'options': best['options'],
+            'speed': best['speed'],
+            'default_speed': default_speed,
+            'candidates': candidates,
+        }
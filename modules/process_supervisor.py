@@ -0,0 +1,199 @@
+"""
+Module to supervise the processes of the sessions
+
+Author:
+    Konstantin S. (https://github.com/ST1LLY)
+"""
+import logging
+import os
+import selectors
+import subprocess
+import threading
+from datetime import datetime
+from typing import Any, Callable, Optional
+
+import modules.support_functions as sup_f
+from modules.session_registry import SessionRegistry
+
+
+class ProcessSupervisor:
+    """
+    Class to get notified when the processes of the sessions exit.
+    One thread waits on the pidfds of all watched processes, so an exit is seen at once without polling.
+    The child processes are reaped, their exit codes and end times are put into the session in the registry.
+    The processes of other API workers are watched too, their exit codes are unknown
+    unless the watcher gets them from the parent of the process.
+    If pidfd isn't supported by the kernel, the processes are polled.
+    """
+
+    # Pause between the polls of the processes without pidfd, in seconds
+    poll_interval: float = 1.0
+
+    # The watched processes {pid: {'session_name', 'pid', 'process', 'pidfd', 'on_exit', 'get_exit_code'}}
+    processes: dict[int, dict[str, Any]] = {}
+
+    # Guard of the watched processes
+    lock: threading.Lock = threading.Lock()
+
+    # The selector of the pidfds and the wakeup pipe, None until the first process is watched
+    selector: Optional[selectors.BaseSelector] = None
+
+    # The pipe to wake the thread up when a process is added, (read fd, write fd)
+    wakeup: tuple[int, int] = (-1, -1)
+
+    def __init__(self) -> None:
+        pass
+
+    @staticmethod
+    def __open_pidfd(pid: int) -> int | None:
+        """
+        Open the pidfd of the process
+
+        Args:
+            pid (int): PID of the process
+
+        Returns:
+            int | None: the pidfd or None if pidfd isn't supported or the process is gone
+        """
+        if not hasattr(os, 'pidfd_open'):
+            return None
+        try:
+            return os.pidfd_open(pid)
+        except OSError:
+            return None
+
+    @staticmethod
+    def __is_exited(watched: dict[str, Any]) -> bool:
+        """
+        Check if the process without pidfd has exited
+
+        Args:
+            watched (dict[str, Any]): the watched process
+
+        Returns:
+            bool: True if the process has exited
+        """
+        if watched['process'] is not None:
+            return watched['process'].poll() is not None
+        return not sup_f.is_process_running(watched['pid'])
+
+    @staticmethod
+    def __on_exit(watched: dict[str, Any]) -> None:
+        """
+        Reap the process and record its exit
+
+        Args:
+            watched (dict[str, Any]): the watched process
+        """
+        with ProcessSupervisor.lock:
+            # The selector is created before the first process with pidfd is watched
+            if watched['pidfd'] is not None and ProcessSupervisor.selector is not None:
+                ProcessSupervisor.selector.unregister(watched['pidfd'])
+                os.close(watched['pidfd'])
+
+        exit_code = None
+        if watched['process'] is not None:
+            # The process has exited, so waiting doesn't block
+            exit_code = watched['process'].wait()
+        elif watched['get_exit_code'] is not None:
+            exit_code = watched['get_exit_code']()
+        logging.info(
+            'The process of session_name: %s, pid: %s has exited with code %s',
+            watched['session_name'],
+            watched['pid'],
+            exit_code,
+        )
+        try:
+            SessionRegistry.record_exit(
+                watched['session_name'], watched['pid'], exit_code, datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            )
+            if watched['on_exit'] is not None:
+                watched['on_exit'](exit_code)
+        except Exception:  # pylint: disable=broad-except
+            logging.exception('The exit handler of session_name: %s failed', watched['session_name'])
+        finally:
+            # The process is watched until its exit is recorded, so its session isn't seen in between
+            with ProcessSupervisor.lock:
+                ProcessSupervisor.processes.pop(watched['pid'], None)
+
+    @staticmethod
+    def __perform(selector: selectors.BaseSelector) -> None:
+        """
+        The loop of the supervisor thread
+
+        Args:
+            selector (selectors.BaseSelector): the selector of the pidfds and the wakeup pipe
+        """
+        while True:
+            with ProcessSupervisor.lock:
+                polled = [watched for watched in ProcessSupervisor.processes.values() if watched['pidfd'] is None]
+            try:
+                events = selector.select(ProcessSupervisor.poll_interval if polled else None)
+                for key, _ in events:
+                    if key.data is None:
+                        os.read(ProcessSupervisor.wakeup[0], 4096)
+                        continue
+                    ProcessSupervisor.__on_exit(key.data)
+                for watched in polled:
+                    if ProcessSupervisor.__is_exited(watched):
+                        ProcessSupervisor.__on_exit(watched)
+            except Exception:  # pylint: disable=broad-except
+                logging.exception('The supervising round failed')
+
+    @staticmethod
+    def watch(
+        session_name: str,
+        pid: int,
+        process: subprocess.Popen[Any] | None = None,
+        on_exit: Optional[Callable[[int | None], None]] = None,
+        get_exit_code: Optional[Callable[[], int | None]] = None,
+    ) -> None:
+        """
+        Watch the process of the session
+
+        Args:
+            session_name (str): session name
+            pid (int): PID of the process
+            process (subprocess.Popen[Any] | None): the process if it's the child of this API worker. Default: None
+            on_exit (Optional[Callable[[int | None], None]]): called with the exit code when the process exits,
+                                                             the code is None if it's unknown. Default: None
+            get_exit_code (Optional[Callable[[], int | None]]): called when the process exits to get the exit code
+                                                                if the process isn't the child. Default: None
+        """
+        with ProcessSupervisor.lock:
+            if ProcessSupervisor.selector is None:
+                ProcessSupervisor.selector = selectors.DefaultSelector()
+                ProcessSupervisor.wakeup = os.pipe()
+                os.set_blocking(ProcessSupervisor.wakeup[0], False)
+                ProcessSupervisor.selector.register(ProcessSupervisor.wakeup[0], selectors.EVENT_READ, None)
+                threading.Thread(
+                    target=ProcessSupervisor.__perform, args=(ProcessSupervisor.selector,), daemon=True
+                ).start()
+
+            watched: dict[str, Any] = {
+                'session_name': session_name,
+                'pid': pid,
+                'process': process,
+                'pidfd': ProcessSupervisor.__open_pidfd(pid),
+                'on_exit': on_exit,
+                'get_exit_code': get_exit_code,
+            }
+            ProcessSupervisor.processes[pid] = watched
+            if watched['pidfd'] is not None:
+                # The pidfd becomes readable when the process exits
+                ProcessSupervisor.selector.register(watched['pidfd'], selectors.EVENT_READ, watched)
+        os.write(ProcessSupervisor.wakeup[1], b'\0')
+
+    @staticmethod
+    def is_watched(pid: int) -> bool:
+        """
+        Check if the process is watched by this API worker
+
+        Args:
+            pid (int): PID of the process
+
+        Returns:
+            bool: True if the process is watched, so it hasn't exited yet
+        """
+        with ProcessSupervisor.lock:
+            return pid in ProcessSupervisor.processes
@@ -0,0 +1,345 @@
+"""
+Module to keep the sessions of dump and brute processes
+
+Author:
+    Konstantin S. (https://github.com/ST1LLY)
+"""
+import json
+import os
+import sqlite3
+from datetime import datetime
+from typing import Any
+
+import modules.support_functions as sup_f
+from enviroment import SESSIONS_DB_PATH
+
+
+class SessionRegistry:
+    """
+    Class of the persistent registry of sessions shared by all API worker processes.
+    A session is found by its name, the process objects are kept only by the worker started it,
+    so the other workers check the process by its PID.
+    The PID is checked together with the process start time, so a reused PID isn't taken for the process.
+    The owner of a session is the API worker following the process, another worker takes the session over
+    when the owner is gone.
+    """
+
+    # The owner token of this API worker, PID:start time
+    owner: str = f'{os.getpid()}:{sup_f.get_process_start_time(os.getpid())}'
+
+    def __init__(self) -> None:
+        pass
+
+    @staticmethod
+    def __connect() -> sqlite3.Connection:
+        """
+        Connect to the registry creating the table if needed
+
+        Returns:
+            sqlite3.Connection: the connection
+        """
+        connection = sqlite3.connect(SESSIONS_DB_PATH, timeout=30)
+        connection.row_factory = sqlite3.Row
+        connection.execute('PRAGMA journal_mode=WAL')
+        connection.execute(
+            'CREATE TABLE IF NOT EXISTS sessions ('
+            'session_name TEXT PRIMARY KEY, kind TEXT NOT NULL, pid INTEGER NOT NULL, state TEXT NOT NULL, '
+            'data TEXT NOT NULL, created TEXT NOT NULL, updated TEXT NOT NULL)'
+        )
+        connection.execute('CREATE INDEX IF NOT EXISTS sessions_kind ON sessions (kind, created)')
+        return connection
+
+    @staticmethod
+    def __to_dict(row: sqlite3.Row) -> dict[str, Any]:
+        """
+        Turn the row into the session dict
+
+        Args:
+            row (sqlite3.Row): the row of sessions table
+
+        Returns:
+            dict[str, Any]: the session
+        """
+        session = dict(row)
+        session['data'] = json.loads(session['data'])
+        return session
+
+    @staticmethod
+    def add(session_name: str, kind: str, pid: int, data: dict[str, Any], state: str = 'running') -> None:
+        """
+        Add the session of the process owned by this API worker.
+        If the session exists, its process is replaced and its data is updated by the data.
+
+        Args:
+            session_name (str): session name
+            kind (str): 'dump' / 'brute' / 'brute_group' / 'benchmark' / 'dump_crack'
+            pid (int): PID of the process, 0 if the process isn't started yet
+            data (dict[str, Any]): the file paths and the other info of the session
+            state (str): the state of the process, 'running' / 'queued' / 'exited'. Default: 'running'
+        """
+        data = {
+            **data,
+            'start_time': sup_f.get_process_start_time(pid) if pid else None,
+            'owner': SessionRegistry.owner,
+            # The exit of the previous process of the session is cleared
+            'exit_code': None,
+            'end_time': None,
+        }
+        now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        connection = SessionRegistry.__connect()
+        try:
+            with connection:
+                # The session is read and written in one transaction, so no write of another worker is lost
+                connection.execute('BEGIN IMMEDIATE')
+                row = connection.execute(
+                    'SELECT data, created FROM sessions WHERE session_name = ?', (session_name,)
+                ).fetchone()
+                created = now
+                if row is not None:
+                    created = row['created']
+                    data = {**json.loads(row['data']), **data}
+                connection.execute(
+                    'INSERT OR REPLACE INTO sessions (session_name, kind, pid, state, data, created, updated) '
+                    'VALUES (?, ?, ?, ?, ?, ?, ?)',
+                    (session_name, kind, pid, state, json.dumps(data), created, now),
+                )
+        finally:
+            connection.close()
+
+    @staticmethod
+    def update(
+        session_name: str,
+        state: str | None = None,
+        data: dict[str, Any] | None = None,
+        expected_state: str | None = None,
+    ) -> bool:
+        """
+        Update the session
+
+        Args:
+            session_name (str): session name
+            state (str | None): new state of the process, 'running' / 'queued' / 'exited'. Default: not changed
+            data (dict[str, Any] | None): the keys to update in the session data. Default: not changed
+            expected_state (str | None): update only if the session is in this state. Default: any state
+
+        Returns:
+            bool: True if the session has been updated
+        """
+        connection = SessionRegistry.__connect()
+        try:
+            with connection:
+                # The state is checked and written in one transaction, so expected_state is compare-and-set
+                connection.execute('BEGIN IMMEDIATE')
+                row = connection.execute(
+                    'SELECT state, data FROM sessions WHERE session_name = ?', (session_name,)
+                ).fetchone()
+                if row is None or expected_state not in (None, row['state']):
+                    return False
+                session_data = json.loads(row['data'])
+                session_data.update(data or {})
+                # The state is written only if it's passed
+                connection.execute(
+                    'UPDATE sessions SET state = COALESCE(?, state), data = ?, updated = ? WHERE session_name = ?',
+                    (
+                        state,
+                        json.dumps(session_data),
+                        datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                        session_name,
+                    ),
+                )
+            return True
+        finally:
+            connection.close()
+
+    @staticmethod
+    def record_exit(session_name: str, pid: int, exit_code: int | None, end_time: str) -> bool:
+        """
+        Put the exit of the process into the session, if the session hasn't been given another process
+
+        Args:
+            session_name (str): session name
+            pid (int): PID of the exited process
+            exit_code (int | None): the exit code, negative if the process is killed by a signal,
+                                    None if it's unknown
+            end_time (str): the datetime of the exit
+
+        Returns:
+            bool: True if the session has been updated
+        """
+        connection = SessionRegistry.__connect()
+        try:
+            with connection:
+                connection.execute('BEGIN IMMEDIATE')
+                row = connection.execute(
+                    'SELECT pid, data FROM sessions WHERE session_name = ?', (session_name,)
+                ).fetchone()
+                if row is None or row['pid'] != pid:
+                    return False
+                session_data = json.loads(row['data'])
+                session_data.update({'exit_code': exit_code, 'end_time': end_time})
+                connection.execute(
+                    'UPDATE sessions SET data = ?, updated = ? WHERE session_name = ?',
+                    (json.dumps(session_data), datetime.now().strftime('%Y-%m-%d %H:%M:%S'), session_name),
+                )
+            return True
+        finally:
+            connection.close()
+
+    @staticmethod
+    def get(session_name: str, kind: str) -> dict[str, Any] | None:
+        """
+        Get the session
+
+        Args:
+            session_name (str): session name
+            kind (str): 'dump' / 'brute'
+
+        Returns:
+            dict[str, Any] | None: {'session_name', 'kind', 'pid', 'state', 'data', 'created', 'updated'}
+                         or None if the session isn't found
+        """
+        connection = SessionRegistry.__connect()
+        try:
+            row = connection.execute(
+                'SELECT * FROM sessions WHERE session_name = ? AND kind = ?', (session_name, kind)
+            ).fetchone()
+        finally:
+            connection.close()
+        return SessionRegistry.__to_dict(row) if row is not None else None
+
+    @staticmethod
+    def get_all(
+        kind: str,
+        states: tuple[str, ...] | None = None,
+        has_status_data: bool | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Get all sessions of the kind in the order of starting.
+        The sessions are filtered and paginated by the query, only the returned rows are decoded.
+
+        Args:
+            kind (str): 'dump' / 'brute'
+            states (tuple[str, ...] | None): return only the sessions in these states. Default: all
+            has_status_data (bool | None): return only the sessions with (True) or without (False)
+                                           the printed status in the data. Default: all
+            offset (int): the number of sessions to skip. Default: 0
+            limit (int | None): the max number of sessions to return. Default: all
+
+        Returns:
+            list[dict[str, Any]]: the sessions, see get
+        """
+        query = 'SELECT * FROM sessions WHERE kind = ?'
+        params: list[Any] = [kind]
+        if states is not None:
+            query += f' AND state IN ({", ".join("?" * len(states))})'
+            params.extend(states)
+        if has_status_data is not None:
+            query += f" AND COALESCE(json_array_length(data, '$.status_data'), 0) {'>' if has_status_data else '='} 0"
+        # LIMIT -1 is no limit
+        query += ' ORDER BY created LIMIT ? OFFSET ?'
+        params.extend((-1 if limit is None else limit, offset))
+
+        connection = SessionRegistry.__connect()
+        try:
+            rows = connection.execute(query, params).fetchall()
+        finally:
+            connection.close()
+        return [SessionRegistry.__to_dict(row) for row in rows]
+
+    @staticmethod
+    def delete(session_name: str) -> None:
+        """
+        Delete the session
+
+        Args:
+            session_name (str): session name
+        """
+        connection = SessionRegistry.__connect()
+        try:
+            with connection:
+                connection.execute('DELETE FROM sessions WHERE session_name = ?', (session_name,))
+        finally:
+            connection.close()
+
+    @staticmethod
+    def is_process_running(pid: int, start_time: int | None) -> bool:
+        """
+        Check if the process is running and it's the same process
+
+        Args:
+            pid (int): PID of the process
+            start_time (int | None): the start time of the process, None if it wasn't got
+
+        Returns:
+            bool: True if the process is running
+        """
+        if not sup_f.is_process_running(pid):
+            return False
+        return start_time is None or sup_f.get_process_start_time(pid) == start_time
+
+    @staticmethod
+    def is_running(session: dict[str, Any]) -> bool:
+        """
+        Check if the process of the session is running
+
+        Args:
+            session (dict[str, Any]): the session, see get
+
+        Returns:
+            bool: True if the process is running
+        """
+        return session['state'] == 'running' and SessionRegistry.is_process_running(
+            session['pid'], session['data'].get('start_time')
+        )
+
+    @staticmethod
+    def is_owner_running(owner: str) -> bool:
+        """
+        Check if the API worker owning the session is running
+
+        Args:
+            owner (str): the owner token of the session, PID:start time
+
+        Returns:
+            bool: True if the owner is running
+        """
+        owner_pid, _, owner_start_time = owner.partition(':')
+        return owner_pid.isdigit() and SessionRegistry.is_process_running(
+            int(owner_pid), int(owner_start_time) if owner_start_time.isdigit() else None
+        )
+
+    @staticmethod
+    def take_over(session_name: str) -> bool:
+        """
+        Make this API worker the owner of the session if its owner is gone
+
+        Args:
+            session_name (str): session name
+
+        Returns:
+            bool: True if this API worker is the owner now
+        """
+        connection = SessionRegistry.__connect()
+        try:
+            # The transaction is started at once, so two workers can't take the session over both
+            connection.execute('BEGIN IMMEDIATE')
+            row = connection.execute('SELECT data FROM sessions WHERE session_name = ?', (session_name,)).fetchone()
+            if row is None:
+                connection.rollback()
+                return False
+            session_data = json.loads(row['data'])
+            owner = session_data.get('owner', '')
+            if owner != SessionRegistry.owner:
+                if SessionRegistry.is_owner_running(owner):
+                    connection.rollback()
+                    return False
+                session_data['owner'] = SessionRegistry.owner
+                connection.execute(
+                    'UPDATE sessions SET data = ? WHERE session_name = ?', (json.dumps(session_data), session_name)
+                )
+            connection.commit()
+            return True
+        finally:
+            connection.close()
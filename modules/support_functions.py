@@ -18,7 +18,7 @@ def read_file_to_lst(file_path: str) -> List[str]:
         return file.read().splitlines()
 
 
-def get_file_names_in_dir(dir_path: str) -> list:
+def get_file_names_in_dir(dir_path: str) -> list[str]:
     """
     Get a list of filenames from a dir
 
@@ -92,7 +92,7 @@ def init_custome_logger(
     return logger
 
 
-def get_config(config_path: str, config_section: str) -> dict:
+def get_config(config_path: str, config_section: str) -> dict[str, str]:
     """
     Getting a config section from a config file
     """
@@ -159,3 +159,48 @@ def delete_if_exists(file_path: str) -> None:
     """
     if os.path.exists(file_path):
         os.remove(file_path)
+
+
+def get_process_start_time(pid: int) -> Optional[int]:
+    """
+    Get the start time of the process, it tells the process from another one got the same PID later
+
+    Args:
+        pid (int): PID of the process
+
+    Returns:
+        Optional[int]: the start time in clock ticks after the system boot or None if it can't be got
+    """
+    try:
+        with open(f'/proc/{pid}/stat', encoding='utf-8') as file:
+            # The fields follow the process name in parentheses, starttime is the 22nd field
+            return int(file.read().rsplit(')', 1)[1].split()[19])
+    except (OSError, IndexError, ValueError):
+        return None
+
+
+def is_process_running(pid: int) -> bool:
+    """
+    Check if the process is running. The exited process not waited by its parent yet (zombie) isn't running.
+
+    Args:
+        pid (int): PID of the process
+
+    Returns:
+        bool: True if the process is running
+    """
+    stat_file_path = f'/proc/{pid}/stat'
+    if os.path.isdir('/proc/self'):
+        try:
+            with open(stat_file_path, encoding='utf-8') as file:
+                # The state follows the process name in parentheses
+                return file.read().rsplit(')', 1)[1].split()[0] != 'Z'
+        except FileNotFoundError:
+            return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
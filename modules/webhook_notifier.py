@@ -0,0 +1,281 @@
+"""
+Module to notify the callback URLs of the sessions about their completion
+
+Author:
+    Konstantin S. (https://github.com/ST1LLY)
+"""
+import hashlib
+import hmac
+import json
+import logging
+import sqlite3
+import threading
+import time
+import urllib.error
+import urllib.request
+from datetime import datetime
+from typing import Any
+
+from enviroment import WEBHOOKS_DB_PATH
+from modules.dump_ntlm_performer import DumpNTLMPerformer
+from modules.hashcat_performer import HashcatPerformer
+from modules.session_registry import SessionRegistry
+
+
+class WebhookNotifier:
+    """
+    Class to POST the completion or failure event of the session to its callback URL.
+    The watcher thread finds the sessions finished since the last check, the events are put into the outbox
+    once per run of the session process, so a resumed session is notified again when it finishes.
+    The events are delivered with retries and exponential backoff. Every API worker runs the watcher,
+    an event is claimed by one of them before delivering.
+    The body is signed by HMAC-SHA256 of '{timestamp}.{body}' with the webhook secret.
+    """
+
+    # Pause between the checks of the sessions, in seconds
+    poll_interval: float = 2.0
+
+    # The secret to sign the events, they aren't signed if it's empty
+    secret: str = ''
+
+    # The max number of delivery attempts of an event
+    max_attempts: int = 8
+
+    # The pause before the second attempt, it's doubled for every next one, in seconds
+    backoff_base: float = 5.0
+
+    # The max pause between the attempts, in seconds
+    backoff_max: float = 3600.0
+
+    # The timeout of the request to the callback URL, in seconds
+    request_timeout: float = 10.0
+
+    # The runs of the sessions the events are put for, (session name, process start time)
+    known_runs: set[tuple[str, str]] = set()
+
+    def __init__(self) -> None:
+        pass
+
+    @staticmethod
+    def __connect() -> sqlite3.Connection:
+        """
+        Connect to the outbox creating the table if needed
+
+        Returns:
+            sqlite3.Connection: the connection
+        """
+        connection = sqlite3.connect(WEBHOOKS_DB_PATH, timeout=30)
+        connection.row_factory = sqlite3.Row
+        connection.execute('PRAGMA journal_mode=WAL')
+        connection.execute(
+            'CREATE TABLE IF NOT EXISTS webhook_events (id INTEGER PRIMARY KEY AUTOINCREMENT, '
+            'session_name TEXT NOT NULL, run TEXT NOT NULL, event TEXT NOT NULL, url TEXT NOT NULL, '
+            'payload TEXT NOT NULL, state TEXT NOT NULL, attempts INTEGER NOT NULL, next_attempt REAL NOT NULL, '
+            'last_error TEXT NOT NULL, created TEXT NOT NULL, UNIQUE (session_name, run))'
+        )
+        connection.execute('CREATE INDEX IF NOT EXISTS webhook_events_due ON webhook_events (state, next_attempt)')
+        return connection
+
+    @staticmethod
+    def __get_dump_event(session: dict[str, Any]) -> dict[str, Any] | None:
+        """
+        Get the event of the dumping session if its process is finished
+
+        Args:
+            session (dict[str, Any]): the session, see SessionRegistry.get
+
+        Returns:
+            dict[str, Any] | None: the event payload or None if the session is running
+        """
+        if SessionRegistry.is_running(session):
+            return None
+        status = DumpNTLMPerformer.get_instance_status(session['session_name'])
+        if status['status'] in ('running', 'not_found'):
+            return None
+        return {
+            'event': 'dump.finished' if status['status'] == 'finished' else 'dump.failed',
+            'kind': 'dump',
+            **status,
+        }
+
+    @staticmethod
+    def __get_brute_event(session: dict[str, Any]) -> dict[str, Any] | None:
+        """
+        Get the event of the bruting session if it's exited
+
+        Args:
+            session (dict[str, Any]): the session, see SessionRegistry.get
+
+        Returns:
+            dict[str, Any] | None: the event payload or None if the session is running or queued
+        """
+        if session['state'] != 'exited':
+            return None
+        status = HashcatPerformer.get_instance_status(session['session_name'])
+        if status['status'] not in ('finished', 'interrupted', 'error'):
+            return None
+        return {
+            'event': 'brute.finished' if status['status'] == 'finished' else 'brute.failed',
+            'kind': 'brute',
+            **status,
+        }
+
+    @staticmethod
+    def __put_events() -> None:
+        """
+        Put the events of the sessions finished since the last check into the outbox
+        """
+        events = []
+        for kind, get_event in (
+            ('dump', WebhookNotifier.__get_dump_event),
+            ('brute', WebhookNotifier.__get_brute_event),
+        ):
+            for session in SessionRegistry.get_all(kind):
+                url = session['data'].get('callback_url')
+                run = (session['session_name'], str(session['data'].get('start_time')))
+                if not url or run in WebhookNotifier.known_runs:
+                    continue
+                if (payload := get_event(session)) is not None:
+                    events.append((run, url, {'session_name': session['session_name'], **payload}))
+        if not events:
+            return
+
+        now = time.time()
+        created = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        connection = WebhookNotifier.__connect()
+        try:
+            with connection:
+                for run, url, payload in events:
+                    # The event of the run may have been put by another API worker
+                    connection.execute(
+                        'INSERT OR IGNORE INTO webhook_events (session_name, run, event, url, payload, state, '
+                        'attempts, next_attempt, last_error, created) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                        (run[0], run[1], payload['event'], url, json.dumps(payload), 'pending', 0, now, '', created),
+                    )
+                    WebhookNotifier.known_runs.add(run)
+                    logging.info('The event %s of session_name: %s is put to %s', payload['event'], run[0], url)
+        finally:
+            connection.close()
+
+    @staticmethod
+    def __send(event: sqlite3.Row) -> str:
+        """
+        POST the event to its callback URL
+
+        Args:
+            event (sqlite3.Row): the row of webhook_events table
+
+        Returns:
+            str: the error, empty if the event is delivered
+        """
+        timestamp = str(int(time.time()))
+        body = json.dumps({**json.loads(event['payload']), 'timestamp': int(timestamp)}).encode('utf-8')
+        headers = {
+            'Content-Type': 'application/json',
+            'X-Webhook-Event': event['event'],
+            'X-Webhook-Delivery': str(event['id']),
+            'X-Webhook-Timestamp': timestamp,
+        }
+        if WebhookNotifier.secret:
+            signature = hmac.new(
+                WebhookNotifier.secret.encode('utf-8'), timestamp.encode('utf-8') + b'.' + body, hashlib.sha256
+            ).hexdigest()
+            headers['X-Webhook-Signature'] = f'sha256={signature}'
+
+        request = urllib.request.Request(event['url'], data=body, headers=headers, method='POST')
+        try:
+            with urllib.request.urlopen(request, timeout=WebhookNotifier.request_timeout) as response:
+                if 200 <= response.status < 300:
+                    return ''
+                return f'HTTP {response.status}'
+        except urllib.error.HTTPError as exc:
+            return f'HTTP {exc.code}'
+        except (urllib.error.URLError, OSError) as exc:
+            return str(exc)
+
+    @staticmethod
+    def __deliver() -> None:
+        """
+        Deliver the events due for an attempt
+        """
+        now = time.time()
+        connection = WebhookNotifier.__connect()
+        try:
+            events = connection.execute(
+                "SELECT * FROM webhook_events WHERE state = 'pending' AND next_attempt <= ? ORDER BY id", (now,)
+            ).fetchall()
+            for event in events:
+                # The event is leased, so no other API worker sends it meanwhile
+                with connection:
+                    is_claimed = connection.execute(
+                        'UPDATE webhook_events SET next_attempt = ? WHERE id = ? AND next_attempt = ?',
+                        (now + WebhookNotifier.request_timeout * 3, event['id'], event['next_attempt']),
+                    ).rowcount
+                if not is_claimed:
+                    continue
+
+                error = WebhookNotifier.__send(event)
+                attempts = event['attempts'] + 1
+                if not error:
+                    state = 'delivered'
+                elif attempts >= WebhookNotifier.max_attempts:
+                    state = 'failed'
+                else:
+                    state = 'pending'
+                next_attempt = time.time() + min(
+                    WebhookNotifier.backoff_base * 2 ** (attempts - 1), WebhookNotifier.backoff_max
+                )
+                with connection:
+                    connection.execute(
+                        'UPDATE webhook_events SET state = ?, attempts = ?, next_attempt = ?, last_error = ? '
+                        'WHERE id = ?',
+                        (state, attempts, next_attempt, error, event['id']),
+                    )
+                if error:
+                    logging.warning(
+                        'The event %s of session_name: %s to %s has failed, attempt %d: %s',
+                        event['event'],
+                        event['session_name'],
+                        event['url'],
+                        attempts,
+                        error,
+                    )
+        finally:
+            connection.close()
+
+    @staticmethod
+    def __perform() -> None:
+        """
+        The loop of the watcher thread
+        """
+        while True:
+            try:
+                WebhookNotifier.__put_events()
+                WebhookNotifier.__deliver()
+            except Exception:  # pylint: disable=broad-except
+                logging.exception('The webhook round failed')
+            time.sleep(WebhookNotifier.poll_interval)
+
+    @staticmethod
+    def start(secret: str = '', max_attempts: int = 8) -> None:
+        """
+        Start the watcher thread
+
+        Args:
+            secret (str): the secret to sign the events. Default: the events aren't signed
+            max_attempts (int): the max number of delivery attempts of an event. Default: 8
+        """
+        WebhookNotifier.secret = secret
+        WebhookNotifier.max_attempts = max_attempts
+        if not secret:
+            logging.warning('webhook_secret is not set, the webhook events are not signed')
+
+        connection = WebhookNotifier.__connect()
+        try:
+            WebhookNotifier.known_runs = {
+                (row['session_name'], row['run'])
+                for row in connection.execute('SELECT session_name, run FROM webhook_events')
+            }
+        finally:
+            connection.close()
+        threading.Thread(target=WebhookNotifier.__perform, daemon=True).start()
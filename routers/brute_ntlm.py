@@ -4,12 +4,16 @@ The module contains routers for NTLM bruting logic
 Author:
     Konstantin S. (https://github.com/ST1LLY)
 """
+import asyncio
+import json
 import os
 from enum import Enum
+from typing import Any, AsyncIterator
 from uuid import UUID
 
-from fastapi import APIRouter, Depends
-from pydantic import BaseModel, Field
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
+from pydantic import AnyHttpUrl, BaseModel, Field, root_validator, validator
 
 from enviroment import (
     LOGS_DIR,
@@ -17,12 +21,19 @@ from enviroment import (
     HASHCAT_BRUTED_HASHES_DIR,
     HASHCAT_DICTIONARIES_DIR,
     HASHCAT_RULES_DIR,
+    NTLM_HASH_LISTS_DIR,
 )
+from modules.brute_estimator import BruteEstimator
+from modules.brute_event_hub import BruteEventHub
+from modules.cpu_partitioner import CpuPartitioner
 from modules.hashcat_performer import HashcatPerformer
-from .common import common_query_session_params
+from .common import PaginationParams, common_query_pagination_params, common_query_session_params
 
 HashcatPerformer().set_working_folders(
-    output_folder=HASHCAT_BRUTED_HASHES_DIR, restores_folder=HASHCAT_RESTORES_DIR, logs_folder=LOGS_DIR
+    output_folder=HASHCAT_BRUTED_HASHES_DIR,
+    restores_folder=HASHCAT_RESTORES_DIR,
+    logs_folder=LOGS_DIR,
+    hash_lists_folder=NTLM_HASH_LISTS_DIR,
 )
 
 router = APIRouter(
@@ -30,6 +41,9 @@ router = APIRouter(
     tags=['brute-ntlm'],
 )
 
+# The pause after which a comment is sent to keep the idle stream open, in seconds
+STREAM_KEEP_ALIVE_INTERVAL = 15.0
+
 
 class BruteNTLMSessionData(BaseModel):
     """
@@ -46,6 +60,7 @@ class ReRunBruteNTLMSessionStatus(str, Enum):
 
     SUCCESS = 'success'
     NOT_FOUND = 'not_found'
+    RUNNING = 'running'
 
 
 class ReRunBruteNTLMSessionData(BruteNTLMSessionData):
@@ -56,14 +71,139 @@ class ReRunBruteNTLMSessionData(BruteNTLMSessionData):
     status: ReRunBruteNTLMSessionStatus = Field(default=..., title='The status of the re-running session')
 
 
-class RunParams(BaseModel):
+class BruteNTLMIOClass(str, Enum):
     """
-    The params for running NTLM bruting session
+    The values of I/O scheduling class of hashcat process
+    """
+
+    BEST_EFFORT = 'best-effort'
+    IDLE = 'idle'
+
+
+class BruteNTLMAttackMode(str, Enum):
+    """
+    The values of attack mode of the stage
+    """
+
+    DICTIONARY = 'dictionary'
+    MASK = 'mask'
+    HYBRID_DICTIONARY_MASK = 'hybrid_dictionary_mask'
+    HYBRID_MASK_DICTIONARY = 'hybrid_mask_dictionary'
+
+
+class BruteNTLMStage(BaseModel):
+    """
+    The stage of the attack plan
+    """
+
+    attack_mode: BruteNTLMAttackMode = Field(default=..., title='The attack mode of hashcat')
+    dictionary_file_name: str | None = Field(
+        default=None, title='The dictionary file name in files/dictionaries, required by all modes except mask'
+    )
+    rules_file_name: str | None = Field(
+        default=None, title='The rules file name in files/rules, used by dictionary mode only'
+    )
+    mask: str | None = Field(default=None, title='The mask of hashcat, required by all modes except dictionary')
+
+    @root_validator(skip_on_failure=True)
+    @classmethod
+    def check_attack_mode_params(cls, values: dict[str, Any]) -> dict[str, Any]:
+        """
+        Check the params required by the attack mode are set
+        """
+        attack_mode = values['attack_mode']
+        if attack_mode != BruteNTLMAttackMode.MASK and not values.get('dictionary_file_name'):
+            raise ValueError(f'dictionary_file_name is required by {attack_mode.value} mode')
+        if attack_mode != BruteNTLMAttackMode.DICTIONARY and not values.get('mask'):
+            raise ValueError(f'mask is required by {attack_mode.value} mode')
+        return values
+
+
+class AttackParams(BaseModel):
+    """
+    The params of the attack of NTLM bruting session
     """
 
-    hash_file_path: str = Field(default=..., title='The full path of file in files/ntlm_hashes')
     dictionary_file_name: str = Field(default='rockyou.txt', title='The dictionary file name in files/dictionaries')
     rules_file_name: str = Field(default='InsidePro-PasswordsPro.rule', title='The rules file name in files/rules')
+    stages: list[BruteNTLMStage] = Field(
+        default=[],
+        title='The stages run one after another with the hashes not bruted by the previous ones, '
+        'the dictionary and rules are used as the only stage by default',
+    )
+
+
+class RunParams(AttackParams):
+    """
+    The params for running NTLM bruting session
+    """
+
+    hash_file_path: str = Field(default=..., title='The full path of file in files/ntlm_hashes')
+    exclude_machine_accounts: bool = Field(
+        default=True, title="Don't brute the hashes used by machine accounts ($) only, their passwords are random"
+    )
+    priority: int = Field(
+        default=0, ge=0, le=10, title='The instance with higher priority is started first and preempts the lower ones'
+    )
+    cpu_set: list[int] | None = Field(
+        default=None, title='The cores for hashcat process, the scheduler gives a free set of cores by default'
+    )
+    nice: int = Field(default=0, ge=0, le=19, title='The niceness of hashcat process')
+    io_class: BruteNTLMIOClass = Field(
+        default=BruteNTLMIOClass.BEST_EFFORT, title='The I/O scheduling class of hashcat process'
+    )
+    coalesce: bool = Field(
+        default=False,
+        title='Brute in one hashcat process with the other queued instances using the same dictionary and rules',
+    )
+    callback_url: AnyHttpUrl | None = Field(
+        default=None, title='The URL the signed event is POSTed to when the session is finished or failed'
+    )
+
+    @validator('cpu_set')
+    @classmethod
+    def check_cpu_set(cls, cpu_set: list[int] | None) -> list[int] | None:
+        """
+        Check the cores are available to the API and aren't reserved for it
+        """
+        if cpu_set is None:
+            return cpu_set
+        if not cpu_set:
+            raise ValueError('cpu_set must contain at least one core')
+        usable_cores = CpuPartitioner.get_usable_cores()
+        if wrong_cores := sorted(set(cpu_set) - set(usable_cores)):
+            raise ValueError(f'The cores {wrong_cores} are not usable by hashcat, the usable cores are {usable_cores}')
+        return sorted(set(cpu_set))
+
+
+class BruteNTLMStageEstimate(BaseModel):
+    """
+    The estimate of the stage of the attack plan
+    """
+
+    attack_mode: BruteNTLMAttackMode = Field(default=..., title='The attack mode of hashcat')
+    dictionary_file_path: str | None = Field(default=None, title='The dictionary file path')
+    rules_file_path: str | None = Field(default=None, title='The rules file path')
+    mask: str | None = Field(default=None, title='The mask of hashcat')
+    candidates_count: int = Field(default=..., title='The number of candidates checked for every hash')
+    seconds: float | None = Field(default=..., title='The estimated runtime, null if no speed of the host is kept')
+
+
+class BruteNTLMEstimateData(BaseModel):
+    """
+    The estimate of the runtime of the attack plan
+    """
+
+    speed: float | None = Field(
+        default=..., title='The speed of the host, hashes per second, null if no benchmark is kept'
+    )
+    benchmarked: str | None = Field(default=..., title='The datetime of the benchmark the speed is taken from')
+    stages: list[BruteNTLMStageEstimate] = Field(default=..., title='The estimates of the stages')
+    candidates_count: int = Field(default=..., title='The number of candidates of all stages')
+    seconds: float | None = Field(
+        default=..., title='The estimated runtime of all stages, the later stages get fewer hashes and can be faster'
+    )
+    hint: str | None = Field(default=None, title='How to get the runtime if it is null')
 
 
 class BruteNTLMInstanceInfoState(str, Enum):
@@ -74,6 +214,17 @@ class BruteNTLMInstanceInfoState(str, Enum):
     FOUND = 'found'
     NOT_FOUND = 'not_found'
     UNDEFINED = 'undefined'
+    QUEUED = 'queued'
+
+
+class BruteNTLMInstanceInfoStateFilter(str, Enum):
+    """
+    The values of state filter of the information of bruting processes, the instances found only are listed
+    """
+
+    FOUND = 'found'
+    UNDEFINED = 'undefined'
+    QUEUED = 'queued'
 
 
 class BruteNTLMInstanceInfoStatusFields(BaseModel):
@@ -85,6 +236,34 @@ class BruteNTLMInstanceInfoStatusFields(BaseModel):
     value: str = Field(default=..., title='The value of an output attr')
 
 
+class BruteNTLMStageInfoState(str, Enum):
+    """
+    The values of state field in the information of the stage
+    """
+
+    PENDING = 'pending'
+    QUEUED = 'queued'
+    RUNNING = 'running'
+    INTERRUPTED = 'interrupted'
+    FINISHED = 'finished'
+    SKIPPED = 'skipped'
+
+
+class BruteNTLMStageInfo(BaseModel):
+    """
+    The information of the stage of the attack plan
+    """
+
+    attack_mode: BruteNTLMAttackMode = Field(default=..., title='The attack mode of hashcat')
+    dictionary_file_path: str | None = Field(default=None, title='The dictionary file path')
+    rules_file_path: str | None = Field(default=None, title='The rules file path')
+    mask: str | None = Field(default=None, title='The mask of hashcat')
+    state: BruteNTLMStageInfoState = Field(default=..., title='The state of the stage')
+    hashes_count: int = Field(default=..., title='The number of hashes given to the stage, 0 if not started yet')
+    cracked_count: int = Field(default=..., title='The number of hashes bruted by the stage')
+    progress: str = Field(default=..., title='The progress of the stage from hashcat status output')
+
+
 class BruteNTLMInstanceInfoData(BruteNTLMSessionData):
     """
     The information of NTLM bruting session
@@ -94,10 +273,47 @@ class BruteNTLMInstanceInfoData(BruteNTLMSessionData):
     status_data: list[BruteNTLMInstanceInfoStatusFields] = Field(
         default=..., title='The list of values from hashcat status output'
     )
+    stages: list[BruteNTLMStageInfo] = Field(default=[], title='The stages of the attack plan')
+    exit_code: int | None = Field(default=None, title='The exit code of the last process, None if running or unknown')
+    end_time: str | None = Field(default=None, title='The datetime of the exit of the last process')
+
+
+def get_stages(data: AttackParams) -> list[dict[str, Any]]:
+    """
+    Get the stages of the attack plan with the full paths of the files
+
+    Args:
+        data (AttackParams): the params of the attack
+
+    Returns:
+        list[dict[str, Any]]: the stages, see AttackPlan
+    """
+    if not data.stages:
+        return [
+            {
+                'attack_mode': BruteNTLMAttackMode.DICTIONARY.value,
+                'dictionary_file_path': os.path.join(HASHCAT_DICTIONARIES_DIR, data.dictionary_file_name),
+                'rules_file_path': os.path.join(HASHCAT_RULES_DIR, data.rules_file_name),
+                'mask': None,
+            }
+        ]
+    return [
+        {
+            'attack_mode': stage.attack_mode.value,
+            'dictionary_file_path': os.path.join(HASHCAT_DICTIONARIES_DIR, stage.dictionary_file_name)
+            if stage.dictionary_file_name
+            else None,
+            'rules_file_path': os.path.join(HASHCAT_RULES_DIR, stage.rules_file_name)
+            if stage.rules_file_name
+            else None,
+            'mask': stage.mask,
+        }
+        for stage in data.stages
+    ]
 
 
 @router.post(
-    '/run', description='Run an instance for bruting', response_model=BruteNTLMSessionData
+    '/run', description='Queue an instance for bruting', response_model=BruteNTLMSessionData
 )
 def run(data: RunParams) -> dict[str, str]:
     """
@@ -108,10 +324,34 @@ def run(data: RunParams) -> dict[str, str]:
             hash_file_path=data.hash_file_path,
             dictionary_file_path=os.path.join(HASHCAT_DICTIONARIES_DIR, data.dictionary_file_name),
             rules_file_path=os.path.join(HASHCAT_RULES_DIR, data.rules_file_name),
+            exclude_machine_accounts=data.exclude_machine_accounts,
+            priority=data.priority,
+            limits={'cpu_set': data.cpu_set, 'nice': data.nice, 'io_class': data.io_class.value},
+            coalesce=data.coalesce,
+            stages=get_stages(data),
+            callback_url=data.callback_url,
         )
     }
 
 
+@router.post(
+    '/estimate',
+    description='Estimate the runtime of the attack without starting it. '
+    'If no speed of the host is kept, the runtime is null, run /technical/benchmark-jobs to get the speed',
+    response_model=BruteNTLMEstimateData,
+)
+def estimate(data: AttackParams) -> dict[str, Any]:
+    """
+    See the description param of router decorator
+    """
+    try:
+        return BruteEstimator.estimate(get_stages(data))
+    except FileNotFoundError as exc:
+        raise HTTPException(status_code=404, detail='File not found') from exc
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+
+
 @router.post(
     '/re-run',
     description='Re-run an instance of hashcat to brute NTLM-hashes if the restore file exists',
@@ -138,11 +378,43 @@ def info(commons: dict[str, UUID] = Depends(common_query_session_params)) -> dic
 
 @router.get(
     '/info-all',
-    description='Get information about all running instances',
+    description='Get information about all running instances, optionally filtered by state',
     response_model=list[BruteNTLMInstanceInfoData],
 )
-def info_all() -> list[dict[str, str | list[dict[str, str]]]]:
+def info_all(
+    state: BruteNTLMInstanceInfoStateFilter | None = None,
+    pagination: PaginationParams = Depends(common_query_pagination_params),
+) -> list[dict[str, str | list[dict[str, str]]]]:
+    """
+    See the description param of router decorator
+    """
+    return HashcatPerformer().get_all_instances_info(
+        state=state.value if state is not None else None, offset=pagination['offset'], limit=pagination['limit']
+    )
+
+
+@router.get(
+    '/stream',
+    description='Stream the events of one or all instances as server-sent events: '
+    'state (the process is running / queued / exited / removed), status (as /info returns) '
+    'and cracked (the hashes bruted since the previous event)',
+)
+async def stream(session_name: UUID | None = None) -> StreamingResponse:
     """
     See the description param of router decorator
     """
-    return HashcatPerformer().get_all_instances_info()
+
+    async def get_events() -> AsyncIterator[str]:
+        subscriber_id, queue = BruteEventHub.subscribe(str(session_name) if session_name is not None else None)
+        try:
+            while True:
+                try:
+                    event, data = await asyncio.wait_for(queue.get(), timeout=STREAM_KEEP_ALIVE_INTERVAL)
+                except asyncio.TimeoutError:
+                    yield ': keep-alive\n\n'
+                    continue
+                yield f'event: {event}\ndata: {json.dumps(data)}\n\n'
+        finally:
+            BruteEventHub.unsubscribe(subscriber_id)
+
+    return StreamingResponse(get_events(), media_type='text/event-stream', headers={'Cache-Control': 'no-cache'})
@@ -4,11 +4,33 @@ The module contains common structures for routers
 Author:
     Konstantin S. (https://github.com/ST1LLY)
 """
+from typing import TypedDict
 from uuid import UUID
 
+from fastapi import Query
+
+
+class PaginationParams(TypedDict):
+    """
+    The pagination params of requests of lists
+    """
+
+    offset: int
+    limit: int | None
+
 
 def common_query_session_params(session_name: UUID) -> dict[str, UUID]:
     """
     The session param for requests
     """
     return {'session_name': session_name}
+
+
+def common_query_pagination_params(
+    offset: int = Query(default=0, ge=0, title='The number of items to skip'),
+    limit: int | None = Query(default=None, ge=1, le=1000, title='The max number of items to return, all by default'),
+) -> PaginationParams:
+    """
+    The pagination params for requests of lists
+    """
+    return {'offset': offset or 0, 'limit': limit}
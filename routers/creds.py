@@ -13,17 +13,23 @@ from fastapi import APIRouter, Depends
 from pydantic import BaseModel, Field
 
 import modules.support_functions as sup_f
+from modules.cracked_hash_store import CrackedHashStore
+from modules.creds_index import CredsIndex
 from enviroment import (
     LOGS_DIR,
     HASHCAT_RESTORES_DIR,
     HASHCAT_BRUTED_HASHES_DIR,
     NTLM_HASHES_DIR,
+    NTLM_HASH_LISTS_DIR,
 )
 from modules.hashcat_performer import HashcatPerformer
 from .common import common_query_session_params
 
 HashcatPerformer().set_working_folders(
-    output_folder=HASHCAT_BRUTED_HASHES_DIR, restores_folder=HASHCAT_RESTORES_DIR, logs_folder=LOGS_DIR
+    output_folder=HASHCAT_BRUTED_HASHES_DIR,
+    restores_folder=HASHCAT_RESTORES_DIR,
+    logs_folder=LOGS_DIR,
+    hash_lists_folder=NTLM_HASH_LISTS_DIR,
 )
 
 router = APIRouter(
@@ -41,6 +47,15 @@ class CredsStatus(str, Enum):
     NOT_FOUND = 'not_found'
 
 
+class BrutedAccSource(str, Enum):
+    """
+    The values of source field of a bruted acc
+    """
+
+    SESSION = 'session'
+    STORE = 'store'
+
+
 class BrutedAcc(BaseModel):
     """
     The params of a bruted acc
@@ -48,6 +63,9 @@ class BrutedAcc(BaseModel):
 
     login: str = Field(default=..., title='The login of a bruted acc')
     password: str = Field(default=..., title='The password of a bruted acc')
+    source: BrutedAccSource = Field(
+        default=..., title='Bruted by the session itself or known from the store of hashes bruted by other sessions'
+    )
 
 
 class BrutedCredsData(BaseModel):
@@ -97,16 +115,21 @@ def bruted(commons: dict[str, UUID] = Depends(common_query_session_params)) -> d
 
         return {'status': 'not_found', 'creds': []}
 
-    bruted_hashes = sup_f.read_file_to_lst(bruted_hashes_file_path)
-    ntlm_hashes = sup_f.read_file_to_lst(ntlm_hashes_file_path)
+    accounts = CredsIndex.get_accounts(ntlm_hashes_file_path)
+    bruted_passwords = CredsIndex.get_bruted_passwords(bruted_hashes_file_path)
 
     # Matching bruted hashes with ntlm hashes
     creads = []
-    for bruted_hash in bruted_hashes:
-        hash_v, password = tuple(bruted_hash.split(':'))
-        for ntlm_hash in ntlm_hashes:
-            if hash_v in ntlm_hash:
-                creads.append({'login': ntlm_hash.split(':')[0], 'password': password})
+    for nt_hash, password in bruted_passwords.items():
+        for login in accounts.get(nt_hash, []):
+            creads.append({'login': login, 'password': password, 'source': 'session'})
+
+    # The hashes which the session hasn't bruted could be bruted by other sessions
+    CrackedHashStore.sync_output_file(bruted_hashes_file_path)
+    not_bruted = [nt_hash for nt_hash in accounts if nt_hash not in bruted_passwords]
+    for nt_hash, password in CrackedHashStore.get_passwords(not_bruted).items():
+        for login in accounts[nt_hash]:
+            creads.append({'login': login, 'password': password, 'source': 'store'})
     logging.info('Got %d creds for session_name: %s', len(creads), commons['session_name'])
     if not creads:
         return {'status': 'not_found', 'creds': []}
@@ -0,0 +1,114 @@
+"""
+The module contains routers for dumping NTLM-hashes and bruting them at the same time
+
+Author:
+    Konstantin S. (https://github.com/ST1LLY)
+"""
+import os
+from enum import Enum
+from typing import Any
+from uuid import UUID
+
+from fastapi import APIRouter, Depends
+from pydantic import BaseModel, Field
+
+from enviroment import HASHCAT_DICTIONARIES_DIR, HASHCAT_RULES_DIR
+from modules.dump_crack_pipeline import DumpCrackPipeline
+from .common import common_query_session_params
+from .dump_ntlm import DumpNTLMParams
+
+router = APIRouter(
+    prefix='/dump-crack',
+    tags=['dump-crack'],
+)
+
+
+class DumpCrackSessionData(BaseModel):
+    """
+    Minimal session info
+    """
+
+    session_name: str = Field(default=..., title='The session name of running dump-and-crack pipeline')
+
+
+class DumpCrackParams(DumpNTLMParams):
+    """
+    Params for starting NTLM dump with bruting the hashes while dumping
+    """
+
+    dictionary_file_name: str = Field(default='rockyou.txt', title='The dictionary file name in files/dictionaries')
+    rules_file_name: str = Field(default='InsidePro-PasswordsPro.rule', title='The rules file name in files/rules')
+    batch_size: int = Field(
+        default=1000,
+        ge=1,
+        title='The minimal number of new hashes to start the first brute batch while the dump is running, '
+        'the next batches need at least as many new hashes as all the previous ones',
+    )
+
+
+class DumpCrackInstanceInfoStatus(str, Enum):
+    """
+    The values of status field in information about dump-and-crack pipeline
+    """
+
+    RUNNING = 'running'
+    FINISHED = 'finished'
+    ERROR = 'error'
+    NOT_FOUND = 'not_found'
+
+
+class DumpCrackBatch(BaseModel):
+    """
+    The brute batch of the pipeline
+    """
+
+    session_name: str = Field(default=..., title='The session name of hashcat instance bruting the batch')
+    hashes_count: int = Field(default=..., title='The number of hashes in the batch')
+
+
+class DumpCrackInstanceInfoData(DumpCrackSessionData):
+    """
+    The information of dump-and-crack pipeline
+    """
+
+    status: DumpCrackInstanceInfoStatus = Field(default=..., title='The status of the pipeline')
+    err_desc: str = Field(default=..., title="error description if status = 'error'")
+    dump_session_name: str = Field(default=..., title='The session name of the NTLM-hashes dump')
+    hashes_count: int = Field(default=..., title='The number of unique NT-hashes streamed by the dump')
+    batches: list[DumpCrackBatch] = Field(default=..., title='The started brute batches')
+
+
+@router.post(
+    '/run', description='Dump NTLM-hashes from AD and brute them while dumping', response_model=DumpCrackSessionData
+)
+def run(data: DumpCrackParams) -> dict[str, str]:
+    """
+    See the description param of router decorator
+    """
+    return {
+        'session_name': DumpCrackPipeline().run_instance(
+            dump_params={
+                'target': data.target,
+                'just_dc_user': data.just_dc_user,
+                'bulk_replication': data.bulk_replication,
+                'drsuapi_workers': data.drsuapi_workers,
+                'incremental': data.incremental,
+                'callback_url': data.callback_url,
+            },
+            dictionary_file_path=os.path.join(HASHCAT_DICTIONARIES_DIR, data.dictionary_file_name),
+            rules_file_path=os.path.join(HASHCAT_RULES_DIR, data.rules_file_name),
+            batch_size=data.batch_size,
+        )
+    }
+
+
+@router.get(
+    '/info',
+    description='Get information about dump-and-crack pipeline. Use creds/bruted with session names of the batches',
+    response_model=DumpCrackInstanceInfoData,
+)
+def info(commons: dict[str, UUID] = Depends(common_query_session_params)) -> dict[str, Any]:
+    """
+    See the description param of router decorator
+    """
+    return DumpCrackPipeline().get_instance_info(str(commons['session_name']))
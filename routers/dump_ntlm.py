@@ -6,10 +6,11 @@ Author:
 """
 import os
 from enum import Enum
+from typing import Any
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException
-from pydantic import BaseModel, Field
+from pydantic import AnyHttpUrl, BaseModel, Field
 from starlette.responses import FileResponse
 
 from modules.dump_ntlm_performer import DumpNTLMPerformer
@@ -29,6 +30,24 @@ class DumpNTLMSessionData(BaseModel):
     session_name: str = Field(default=..., title='The session name of running NTLM-hashes dump')
 
 
+class ResumeDumpNTLMSessionStatus(str, Enum):
+    """
+    The values of status field in the information of resumed dumping process
+    """
+
+    SUCCESS = 'success'
+    NOT_FOUND = 'not_found'
+    RUNNING = 'running'
+
+
+class ResumeDumpNTLMSessionData(DumpNTLMSessionData):
+    """
+    The information of the resumed NTLM dumping session
+    """
+
+    status: ResumeDumpNTLMSessionStatus = Field(default=..., title='The status of the resumed session')
+
+
 class DumpNTLMParams(BaseModel):
     """
     Params for starting NTLM dump
@@ -40,6 +59,20 @@ class DumpNTLMParams(BaseModel):
         'Password must be encrypted by aes_256_key from settings.conf',
     )
     just_dc_user: str | None = Field(default=None, title='The specified AD user')
+    bulk_replication: bool = Field(
+        default=True, title='Replicate the whole domain NC by pages instead of one request per user'
+    )
+    drsuapi_workers: int = Field(
+        default=1, ge=1, le=16, title='The number of parallel DRSUAPI bindings used by the per user replication'
+    )
+    incremental: bool = Field(
+        default=False,
+        title='Replicate only the accounts changed since the previous dump of the same DC and merge them into it. '
+        'Requires bulk_replication',
+    )
+    callback_url: AnyHttpUrl | None = Field(
+        default=None, title='The URL the signed event is POSTed to when the session is finished or failed'
+    )
 
 
 class DumpNTLMInstanceInfoStatus(str, Enum):
@@ -62,6 +95,8 @@ class DumpNTLMInstanceInfoData(BaseModel):
     status: DumpNTLMInstanceInfoStatus = Field(default=..., title='The status of the dumping NTLM-hashes process')
     err_desc: str = Field(default=..., title="error description if status = 'error'")
     hashes_file_path: str = Field(default=..., title="path to file with NTLM-hashes if status = 'finished'")
+    exit_code: int | None = Field(default=None, title='The exit code of the process, None if running or unknown')
+    end_time: str | None = Field(default=None, title='The datetime of the exit of the process')
 
 
 @router.post('/run', description='Dump NTLM-hashes from AD', response_model=DumpNTLMSessionData)
@@ -69,7 +104,28 @@ def run(data: DumpNTLMParams) -> dict[str, str]:
     """
     See the description param of router decorator
     """
-    return {'session_name': DumpNTLMPerformer().run_instance(data.target, data.just_dc_user)}
+    return {
+        'session_name': DumpNTLMPerformer().run_instance(
+            data.target,
+            data.just_dc_user,
+            data.bulk_replication,
+            data.drsuapi_workers,
+            data.incremental,
+            callback_url=data.callback_url,
+        )
+    }
+
+
+@router.post(
+    '/resume',
+    description='Resume an interrupted NTLM-hashes dump from its last checkpoint',
+    response_model=ResumeDumpNTLMSessionData,
+)
+def resume(commons: dict[str, UUID] = Depends(common_query_session_params)) -> dict[str, str]:
+    """
+    See the description param of router decorator
+    """
+    return DumpNTLMPerformer().resume_instance(str(commons['session_name']))
 
 
 @router.get(
@@ -77,7 +133,7 @@ def run(data: DumpNTLMParams) -> dict[str, str]:
     description='Get information about a running process of dumping NTLM-hashes',
     response_model=DumpNTLMInstanceInfoData,
 )
-def status(commons: dict[str, UUID] = Depends(common_query_session_params)) -> dict[str, str]:
+def status(commons: dict[str, UUID] = Depends(common_query_session_params)) -> dict[str, Any]:
     """
     See the description param of router decorator
     """
@@ -6,16 +6,19 @@ Author:
 """
 import os
 from enum import Enum
+from typing import Any
 from uuid import UUID
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 from pydantic import BaseModel, Field
 
 import modules.support_functions as sup_f
-from enviroment import LOGS_DIR
+from enviroment import LOGS_DIR, NTLM_DUMP_RESUMES_DIR
+from modules.benchmark_service import BenchmarkService
+from modules.session_registry import SessionRegistry
 
 from .brute_ntlm import HashcatPerformer
-from .common import common_query_session_params
+from .common import PaginationParams, common_query_pagination_params, common_query_session_params
 from .dump_ntlm import DumpNTLMPerformer
 
 router = APIRouter(
@@ -30,6 +33,7 @@ class BenchmarkStatus(str, Enum):
     """
 
     SUCCESS = 'success'
+    RUNNING = 'running'
     ERROR = 'error'
 
 
@@ -39,6 +43,9 @@ class BenchmarkData(BaseModel):
     """
 
     status: BenchmarkStatus = Field(default=..., title='The status of benchmark')
+    job_id: str | None = Field(
+        default=None, title="The id of the benchmark job if the status is 'running', see /technical/benchmark-job"
+    )
     started: str = Field(default=..., title='The datetime of benchmark start')
     stopped: str = Field(default=..., title='The datetime of benchmark stop')
     speeds: list[str] = Field(default=..., title='The speed info of benchmark')
@@ -58,16 +65,183 @@ class BenchmarkData(BaseModel):
         }
 
 
+class BenchmarkJobState(str, Enum):
+    """
+    The values of state field in information about benchmark job
+    """
+
+    NOT_FOUND = 'not_found'
+    QUEUED = 'queued'
+    RUNNING = 'running'
+    SUCCESS = 'success'
+    ERROR = 'error'
+
+
+class BenchmarkResult(BaseModel):
+    """
+    The speed of a device from a benchmark
+    """
+
+    job_id: str = Field(default=..., title='The id of the benchmark job')
+    hash_mode: int = Field(default=..., title='The hash mode of hashcat')
+    device_id: int = Field(default=..., title='The device id of hashcat')
+    device_name: str = Field(default=..., title='The device name')
+    speed: float = Field(default=..., title='The speed, hashes per second')
+    speed_info: str = Field(default=..., title='The speed info from hashcat output')
+    hashcat_version: str = Field(default=..., title='The version of hashcat')
+    started: str = Field(default=..., title='The datetime of benchmark start')
+    stopped: str = Field(default=..., title='The datetime of benchmark stop')
+    tuned_speedup: float | None = Field(
+        default=None, title='The speedup of the last tuning of the same hashcat and devices, null if not tuned'
+    )
+
+
+class TuningCandidate(BaseModel):
+    """
+    The speed of hashcat with the candidate options
+    """
+
+    options: list[str] = Field(default=..., title='The options of hashcat')
+    speed: float = Field(default=..., title='The speed, hashes per second, 0 if hashcat has failed')
+
+
+class TuningResult(BaseModel):
+    """
+    The result of a tuning of hashcat workload options
+    """
+
+    job_id: str = Field(default=..., title='The id of the tuning job')
+    hashcat_version: str = Field(default=..., title='The version of hashcat')
+    options: list[str] = Field(default=..., title='The best options applied to the brute sessions')
+    speed: float = Field(default=..., title='The speed with the best options, hashes per second')
+    default_speed: float = Field(default=..., title='The speed with the default options, hashes per second')
+    speedup: float = Field(default=..., title='The ratio of the best speed to the default one')
+    candidates: list[TuningCandidate] = Field(default=..., title='The speeds of the tried options')
+    tuned: str = Field(default=..., title='The datetime of the tuning')
+
+
+class BenchmarkJobData(BaseModel):
+    """
+    The information of a benchmark job
+    """
+
+    job_id: str = Field(default=..., title='The id of the benchmark job')
+    state: BenchmarkJobState = Field(default=..., title='The state of the job')
+    error: str = Field(default=..., title='The error if the job has failed')
+    hash_modes: list[int] = Field(default=..., title='The hash modes of the benchmark')
+    results: list[BenchmarkResult] = Field(default=..., title='The speeds of the devices if the job has succeeded')
+    tuning: TuningResult | None = Field(default=None, title='The result if the tuning job has succeeded')
+
+
+class BenchmarkJobParams(BaseModel):
+    """
+    The params of a benchmark job
+    """
+
+    hash_modes: list[int] = Field(default=[1000], min_items=1, title='The hash modes of hashcat to benchmark')
+    is_forced: bool = Field(
+        default=False, title='Run the benchmark even if the results for the current hashcat and devices are kept'
+    )
+
+
+class TuningJobParams(BaseModel):
+    """
+    The params of a tuning job
+    """
+
+    runtime: int = Field(default=10, ge=1, le=600, title='The time of the run of every candidate, in seconds')
+    is_optimized_included: bool = Field(
+        default=False, title='Try the optimized kernels, they limit the length of bruted passwords to 27'
+    )
+
+
 @router.get(
     '/run-benchmark',
-    description='Run benchmark for bruting',
+    description='Get the benchmark for bruting. If no result for the current hashcat and devices is kept, '
+    'the benchmark job is started in background and its id is returned with running status',
     response_model=BenchmarkData,
 )
-def run_benchmark() -> dict[str, str | list]:
+def run_benchmark() -> dict[str, str | list[dict[str, Any]]]:
+    """
+    See the description param of router decorator
+    """
+    results = BenchmarkService.get_cached(1000)
+    if not results:
+        # The benchmark waits for the brute sessions in the job, so it doesn't share the CPU with them
+        job_id = next(
+            (
+                job['session_name']
+                for job in BenchmarkService.get_active_jobs(is_queued_included=True)
+                if not job['data']['is_tuning'] and 1000 in job['data']['hash_modes']
+            ),
+            None,
+        )
+        return {
+            'status': 'running',
+            'job_id': job_id or BenchmarkService.start_job([1000]),
+            'started': '',
+            'stopped': '',
+            'speeds': [],
+        }
+    return {
+        'status': 'success',
+        'started': results[0]['started'],
+        'stopped': results[0]['stopped'],
+        'speeds': [result['speed_info'] for result in results],
+    }
+
+
+@router.post(
+    '/benchmark-jobs',
+    description='Start the benchmark job in background, the kept results are returned '
+    'if all hash modes have been benchmarked with the current hashcat and devices',
+    response_model=BenchmarkJobData,
+)
+def start_benchmark_job(data: BenchmarkJobParams) -> dict[str, Any]:
     """
     See the description param of router decorator
     """
-    return HashcatPerformer().run_benchmark()
+    if not data.is_forced:
+        results = [result for hash_mode in data.hash_modes for result in BenchmarkService.get_cached(hash_mode)]
+        if {result['hash_mode'] for result in results} == set(data.hash_modes):
+            return {
+                'job_id': results[0]['job_id'],
+                'state': BenchmarkJobState.SUCCESS,
+                'error': '',
+                'hash_modes': data.hash_modes,
+                'results': results,
+                'tuning': None,
+            }
+    return BenchmarkService.get_job_info(BenchmarkService.start_job(data.hash_modes))
+
+
+@router.get(
+    '/benchmark-job',
+    description='Get information about a benchmark job',
+    response_model=BenchmarkJobData,
+)
+def benchmark_job(job_id: UUID) -> dict[str, Any]:
+    """
+    See the description param of router decorator
+    """
+    return BenchmarkService.get_job_info(str(job_id))
+
+
+@router.get(
+    '/benchmark-history',
+    description='Get the results of the benchmarks, the latest first',
+    response_model=list[BenchmarkResult],
+)
+def benchmark_history(
+    hash_mode: int | None = Query(default=None, title='The hash mode of hashcat, all by default'),
+    pagination: PaginationParams = Depends(common_query_pagination_params),
+) -> list[dict[str, Any]]:
+    """
+    See the description param of router decorator
+    """
+    return BenchmarkService.get_history(
+        hash_mode=hash_mode, offset=pagination['offset'], limit=pagination['limit']
+    )
 
 
 @router.get('/clean-dump', description='Clean log data of dumping')
@@ -77,12 +251,12 @@ def clean_dump(commons: dict[str, UUID] = Depends(common_query_session_params))
     """
     session_name = str(commons['session_name'])
 
-    for instance in DumpNTLMPerformer.instances:
-        if instance['session_name'] == session_name:
-            DumpNTLMPerformer.instances.remove(instance)
-            break
+    DumpNTLMPerformer.instances.pop(session_name, None)
+    SessionRegistry.delete(session_name)
     sup_f.delete_if_exists(os.path.join(LOGS_DIR, f'ntlm_dumping_{session_name}.log'))
     sup_f.delete_if_exists(os.path.join(LOGS_DIR, f'ntlm_dumping_{session_name}_errors.log'))
+    sup_f.delete_if_exists(os.path.join(NTLM_DUMP_RESUMES_DIR, f'{session_name}.resume'))
+    sup_f.delete_if_exists(os.path.join(NTLM_DUMP_RESUMES_DIR, f'{session_name}.params.json'))
 
     return 'success'
 
@@ -94,12 +268,39 @@ def clean_brute(commons: dict[str, UUID] = Depends(common_query_session_params))
     """
     session_name = str(commons['session_name'])
 
-    for instance in HashcatPerformer.instances:
-        if instance['session_name'] == session_name:
-            HashcatPerformer.instances.remove(instance)
-            break
+    HashcatPerformer.instances.pop(session_name, None)
+    SessionRegistry.delete(session_name)
 
     sup_f.delete_if_exists(os.path.join(LOGS_DIR, f'hashcat_{session_name}.log'))
     sup_f.delete_if_exists(os.path.join(LOGS_DIR, f'hashcat_{session_name}_errors.log'))
 
     return 'success'
+
+
+@router.post(
+    '/tuning-jobs',
+    description='Start the job tuning hashcat workload options for the host in background, '
+    'the best options are applied to the brute sessions queued after it',
+    response_model=BenchmarkJobData,
+)
+def start_tuning_job(data: TuningJobParams) -> dict[str, Any]:
+    """
+    See the description param of router decorator
+    """
+    return BenchmarkService.get_job_info(
+        BenchmarkService.start_job(
+            [1000], tuning_params={'runtime': data.runtime, 'is_optimized_included': data.is_optimized_included}
+        )
+    )
+
+
+@router.get(
+    '/tuning-history',
+    description='Get the results of the tunings, the latest first',
+    response_model=list[TuningResult],
+)
+def tuning_history(pagination: PaginationParams = Depends(common_query_pagination_params)) -> list[dict[str, Any]]:
+    """
+    See the description param of router decorator
+    """
+    return BenchmarkService.get_tuning_history(offset=pagination['offset'], limit=pagination['limit'])